@@ -0,0 +1,9 @@
+"""
+Benchmarks for the local (non-LLM) hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks                      # all suites, saved and compared with the last run
+    python -m benchmarks -b "standards.*"     # one suite
+    python -m benchmarks --quick --no-save    # one short repetition per case, nothing saved
+"""
@@ -0,0 +1,57 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .runner import (
+    DEFAULT_THRESHOLD,
+    RESULTS_DIR,
+    compare_results,
+    latest_results,
+    print_comparison,
+    run_benchmarks,
+    save_results,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-b", "--bench", default="*",
+                        help='Glob over "suite.Class.time_method" names (default: all)')
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per repetition")
+    parser.add_argument("--quick", action="store_true", help="One short repetition per case")
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR, help="Where results are stored")
+    parser.add_argument("--no-save", action="store_true", help="Do not store this run's results")
+    parser.add_argument("--compare-to", type=Path, default=None,
+                        help="Results file to compare with (default: the previous run on this machine)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Slowdown ratio reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit with status 1 if any case regressed")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.repeat, args.min_time = 1, 0.0
+    run = run_benchmarks(args.bench, args.repeat, args.min_time)
+
+    saved = None if args.no_save else save_results(run, args.results_dir)
+    if saved is not None:
+        print(f"Saved results to {saved}")
+
+    baseline_path = args.compare_to or latest_results(run["machine"]["name"], args.results_dir, exclude=saved)
+    if baseline_path is None:
+        print("No earlier results to compare with")
+        return 0
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    print(f"Compared with {baseline_path} (commit {baseline.get('commit')})")
+    rows = compare_results(baseline, run, args.threshold)
+    print_comparison(rows)
+    regressed = any(row["status"] == "regression" for row in rows)
+    return 1 if regressed and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""DocumentAnalyzerTool extraction and segmentation of synthetic documents."""
+
+import importlib.util
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.tools.document_analyzer import DocumentAnalyzerTool
+from src.utils.extraction_cache import ExtractionCache
+from tests.helpers import make_pdf
+
+from .synthetic import curriculum_html, curriculum_markdown, curriculum_text, write_docx
+
+# Extractor dependency per format; formats whose dependency is missing are skipped
+_REQUIRES = {'html': 'bs4', 'docx': 'docx', 'pdf': 'pdfplumber'}
+
+
+def write_document(folder: Path, lessons: int, file_format: str) -> Path:
+    """Write the synthetic curriculum with ``lessons`` lessons in one format."""
+    path = folder / f"curriculum.{file_format}"
+    if file_format == 'txt':
+        path.write_text(curriculum_text(lessons), encoding='utf-8')
+    elif file_format == 'md':
+        path.write_text(curriculum_markdown(lessons), encoding='utf-8')
+    elif file_format == 'html':
+        path.write_text(curriculum_html(lessons), encoding='utf-8')
+    elif file_format == 'docx':
+        write_docx(path, [line for line in curriculum_text(lessons).splitlines() if line])
+    else:
+        # One lesson heading per page keeps PDF generation cheap at any size
+        make_pdf(path, [f"Lesson {number}: Fractions on a number line" for number in range(1, lessons + 1)])
+    return path
+
+
+class DocumentExtraction:
+    """Uncached extraction through the tool, as an agent would call it."""
+
+    params = [[10, 100, 1000], ['txt', 'md', 'html', 'docx', 'pdf']]
+    param_names = ['lessons', 'format']
+
+    def setup(self, lessons, file_format):
+        module = _REQUIRES.get(file_format)
+        if module and importlib.util.find_spec(module) is None:
+            raise NotImplementedError(f"{module} not installed")
+        self.folder = Path(tempfile.mkdtemp())
+        self.path = write_document(self.folder, lessons, file_format)
+        self.tool = DocumentAnalyzerTool(extraction_cache=None, pdf_workers=1)
+
+    def teardown(self, lessons, file_format):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def time_run(self, lessons, file_format):
+        self.tool._run(str(self.path))
+
+    def time_segment(self, lessons, file_format):
+        self.tool.segment(str(self.path))
+
+
+class CachedExtraction:
+    """Repeat reads of a text document served by the extraction cache."""
+
+    params = [100, 1000]
+    param_names = ['lessons']
+
+    def setup(self, lessons):
+        self.folder = Path(tempfile.mkdtemp())
+        self.path = write_document(self.folder, lessons, 'txt')
+        self.tool = DocumentAnalyzerTool(extraction_cache=ExtractionCache(self.folder / "cache"))
+        self.tool._run(str(self.path))
+
+    def teardown(self, lessons):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def time_run(self, lessons):
+        self.tool._run(str(self.path))
@@ -0,0 +1,60 @@
+"""Pydantic validation and serialization of the output models."""
+
+import json
+import random
+
+from src.llms.fake_llm import sample_output
+from src.models import outputs
+
+from .synthetic import large_report
+
+MODELS = [
+    outputs.StandardsAlignmentOutput,
+    outputs.GradeLevelCheckOutput,
+    outputs.MathPracticesOutput,
+    outputs.ContentQualityOutput,
+    outputs.PedagogicalEffectivenessOutput,
+    outputs.EquityAccessibilityOutput,
+    outputs.AssessmentQualityOutput,
+    outputs.FinalReviewReport,
+    outputs.TaskInput,
+]
+
+
+class OutputValidation:
+    """Validating each output model from a dict and from the JSON an agent returns."""
+
+    params = [model.__name__ for model in MODELS]
+    param_names = ['model']
+
+    def setup(self, model_name):
+        self.model = getattr(outputs, model_name)
+        self.data = sample_output(self.model, random.Random(0), {"grade_level": "3"})
+        self.json = json.dumps(self.data)
+        self.instance = self.model.model_validate(self.data)
+
+    def time_validate_dict(self, model_name):
+        self.model.model_validate(self.data)
+
+    def time_validate_json(self, model_name):
+        self.model.model_validate_json(self.json)
+
+    def time_dump_json(self, model_name):
+        self.instance.model_dump_json()
+
+
+class LargeReportValidation:
+    """Round-tripping a final report with every detailed section filled."""
+
+    params = [10, 100, 1000]
+    param_names = ['findings']
+
+    def setup(self, findings):
+        self.report = large_report(findings)
+        self.json = self.report.model_dump_json()
+
+    def time_validate_json(self, findings):
+        outputs.FinalReviewReport.model_validate_json(self.json)
+
+    def time_dump_json(self, findings):
+        self.report.model_dump_json()
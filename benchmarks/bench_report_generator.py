@@ -0,0 +1,83 @@
+"""ReportGeneratorTool rendering of large final reports."""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.tools.report_generator import ReportGeneratorTool
+from src.utils.config import Config
+
+from .synthetic import large_report
+
+
+class _NullSink:
+    """Text sink that discards what is written."""
+
+    def write(self, text):
+        return len(text)
+
+
+class ReportRendering:
+    """Rendering and writing a report with ``findings`` items per list, in each format."""
+
+    params = [[10, 100, 1000], ['md', 'html', 'txt']]
+    param_names = ['findings', 'format']
+
+    def setup(self, findings, file_format):
+        self.folder = Path(tempfile.mkdtemp())
+        self.output_dir = Config.OUTPUT_DIR
+        Config.OUTPUT_DIR = self.folder
+        self.tool = ReportGeneratorTool()
+        self.content = large_report(findings).model_dump(mode='json')
+        self.request = json.dumps({
+            "title": "Synthetic Grade 3 Review", "content": self.content,
+            "format": file_format, "filename": f"report.{file_format}",
+        })
+
+    def teardown(self, findings, file_format):
+        Config.OUTPUT_DIR = self.output_dir
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def time_run(self, findings, file_format):
+        self.tool._run(self.request)
+
+    def time_render(self, findings, file_format):
+        render = {'md': self.tool._generate_markdown, 'html': self.tool._generate_html,
+                  'txt': self.tool._generate_text}[file_format]
+        render("Synthetic Grade 3 Review", self.content)
+
+    def time_stream(self, findings, file_format):
+        self.tool.render("Synthetic Grade 3 Review", self.content, file_format, _NullSink())
+
+
+class MultiFormatRendering:
+    """Writing a report as md, html, txt and json: one request per format versus one for all."""
+
+    params = [10, 100, 1000]
+    param_names = ['findings']
+
+    def setup(self, findings):
+        self.folder = Path(tempfile.mkdtemp())
+        self.output_dir = Config.OUTPUT_DIR
+        Config.OUTPUT_DIR = self.folder
+        self.tool = ReportGeneratorTool()
+        content = large_report(findings).model_dump(mode='json')
+        self.requests = [
+            json.dumps({"title": "Synthetic Grade 3 Review", "content": content, "format": file_format,
+                        "filename": f"report.{file_format}"})
+            for file_format in ('md', 'html', 'txt', 'json')
+        ]
+        self.request = json.dumps({"title": "Synthetic Grade 3 Review", "content": content,
+                                   "formats": ['md', 'html', 'txt', 'json'], "filename": "report"})
+
+    def teardown(self, findings):
+        Config.OUTPUT_DIR = self.output_dir
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def time_separate_runs(self, findings):
+        for request in self.requests:
+            self.tool._run(request)
+
+    def time_single_pass(self, findings):
+        self.tool._run(self.request)
@@ -0,0 +1,81 @@
+"""StandardsLoader lookups and StandardsLookupTool queries on a synthetic K-12 dataset."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.tools.standards_lookup import StandardsLookupTool
+from src.utils.standards_loader import StandardsLoader
+
+from .synthetic import write_standards
+
+
+class _SyntheticStandards:
+    """Loader over a synthetic dataset with ``per_domain`` standards per grade and domain."""
+
+    params = [5, 50]
+    param_names = ['per_domain']
+
+    def setup(self, per_domain):
+        self.folder = Path(tempfile.mkdtemp())
+        self.loader = StandardsLoader(write_standards(self.folder / "standards.json", per_domain),
+                                      use_snapshot=False)
+        # Build the search index up front so lookups time queries, not indexing
+        self.loader.search("warm up", top_k=1)
+
+    def teardown(self, per_domain):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+
+class StandardsLoading(_SyntheticStandards):
+    """Parsing and indexing the dataset, with and without the binary snapshot."""
+
+    def setup(self, per_domain):
+        super().setup(per_domain)
+        # Write the snapshot once so time_load_snapshot measures reading it
+        StandardsLoader(self.loader.standards_file, use_snapshot=True).get_grades()
+
+    def time_load_json(self, per_domain):
+        StandardsLoader(self.loader.standards_file, use_snapshot=False).get_grades()
+
+    def time_load_snapshot(self, per_domain):
+        StandardsLoader(self.loader.standards_file, use_snapshot=True).get_grades()
+
+
+class StandardsLookups(_SyntheticStandards):
+    """Indexed lookups and full-text search."""
+
+    def time_search_standard(self, per_domain):
+        self.loader.search_standard("7.NF.A.3")
+
+    def time_grade_standards(self, per_domain):
+        self.loader.get_all_standards_for_grade("5")
+
+    def time_domain_standards(self, per_domain):
+        self.loader.get_domain_standards("5", "MD")
+
+    def time_full_text_search(self, per_domain):
+        self.loader.search("fractions on a number line", top_k=5, grade="3")
+
+
+class StandardsLookupQueries(_SyntheticStandards):
+    """The lookup tool's query parsing and JSON output."""
+
+    def setup(self, per_domain):
+        super().setup(per_domain)
+        self.tool = StandardsLookupTool(standards_loader=self.loader)
+
+    def time_standard(self, per_domain):
+        self.tool._run("standard:7.NF.A.3")
+
+    def time_grade(self, per_domain):
+        self.tool._run("grade:5")
+
+    def time_domain(self, per_domain):
+        self.tool._run("domain:5.MD")
+
+    def time_practices(self, per_domain):
+        self.tool._run("practices")
+
+    def time_search(self, per_domain):
+        self.tool._run("search:fractions on a number line|grade=3")
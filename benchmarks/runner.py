@@ -0,0 +1,259 @@
+"""
+Benchmark discovery, timing, result storage and regression comparison.
+
+Suites follow the asv layout: a ``bench_*.py`` module holds classes with
+``time_*`` methods, optional ``params``/``param_names`` and optional
+``setup``/``teardown`` methods taking the same parameters. ``setup`` may
+raise ``NotImplementedError`` to skip a case (e.g., an optional
+dependency is missing). Each case is timed with ``timeit`` and results
+are saved as JSON under ``benchmarks/results/<machine>/``, so every run
+can be compared with the previous one on the same machine.
+"""
+
+import fnmatch
+import importlib
+import itertools
+import json
+import logging
+import os
+import platform
+import pkgutil
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Median slowdown (new / old) reported as a regression
+DEFAULT_THRESHOLD = 1.2
+
+
+def discover(pattern: str = "*") -> Iterator[Tuple[str, type, str]]:
+    """
+    Find benchmark methods.
+
+    Args:
+        pattern: Glob matched against "module.Class.method" names
+
+    Yields:
+        Tuple[str, type, str]: (full name, benchmark class, method name)
+    """
+    package = Path(__file__).parent
+    for module_info in sorted(pkgutil.iter_modules([str(package)]), key=lambda info: info.name):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"{__package__}.{module_info.name}")
+        suite = module_info.name[len("bench_"):]
+        for class_name, cls in sorted(vars(module).items()):
+            if not isinstance(cls, type) or cls.__module__ != module.__name__ or class_name.startswith("_"):
+                continue
+            for method in sorted(name for name in dir(cls) if name.startswith("time_")):
+                name = f"{suite}.{class_name}.{method}"
+                if fnmatch.fnmatch(name, pattern):
+                    yield name, cls, method
+
+
+def param_cases(cls: type) -> List[Tuple[Any, ...]]:
+    """All parameter combinations of a benchmark class (one empty case if unparameterized)."""
+    params = getattr(cls, "params", None)
+    if not params:
+        return [()]
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def case_key(params: Tuple[Any, ...]) -> str:
+    """Key of a parameter combination in the results, e.g. "(100, 'txt')"."""
+    return "(" + ", ".join(repr(param) for param in params) + ")" if params else "()"
+
+
+def time_case(cls: type, method: str, params: Tuple[Any, ...], repeat: int,
+              min_time: float) -> Dict[str, Any]:
+    """
+    Time one benchmark method for one parameter combination.
+
+    Args:
+        cls: Benchmark class
+        method: ``time_*`` method name
+        params: Parameters passed to setup, the method and teardown
+        repeat: Timing repetitions
+        min_time: Minimum seconds per repetition; calls are looped until reached
+
+    Returns:
+        Dict[str, Any]: Seconds per call (min, median, mean, stdev) and loop
+            counts, or {"skipped": reason}
+    """
+    bench = cls()
+    try:
+        if hasattr(bench, "setup"):
+            bench.setup(*params)
+    except NotImplementedError as e:
+        return {"skipped": str(e) or "not available"}
+    try:
+        function = getattr(bench, method)
+        timer = timeit.Timer(lambda: function(*params))
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= min_time or number >= 1_000_000:
+                break
+            number *= 10 if elapsed < min_time / 10 else 2
+        samples = [elapsed / number] + [timer.timeit(number) / number for _ in range(repeat - 1)]
+    finally:
+        if hasattr(bench, "teardown"):
+            bench.teardown(*params)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeat": len(samples),
+    }
+
+
+def run_benchmarks(pattern: str = "*", repeat: int = 5, min_time: float = 0.2,
+                   quiet: bool = False) -> Dict[str, Any]:
+    """
+    Run every matching benchmark case.
+
+    Args:
+        pattern: Glob matched against "module.Class.method" names
+        repeat: Timing repetitions per case
+        min_time: Minimum seconds per repetition
+        quiet: If True, print nothing
+
+    Returns:
+        Dict[str, Any]: Run record with environment details and
+            "results": {name: {case key: timing}}
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    # Tools log every call; keep that out of the timings and the output
+    logging.disable(logging.INFO)
+    try:
+        for name, cls, method in discover(pattern):
+            for params in param_cases(cls):
+                timing = time_case(cls, method, params, repeat, min_time)
+                results.setdefault(name, {})[case_key(params)] = timing
+                if not quiet:
+                    print(f"{name + case_key(params):<72} {format_timing(timing)}")
+    finally:
+        logging.disable(logging.NOTSET)
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "machine": machine_info(),
+        "settings": {"repeat": repeat, "min_time": min_time},
+        "results": results,
+    }
+
+
+def format_timing(timing: Dict[str, Any]) -> str:
+    """One-line summary of a case's timing."""
+    if "skipped" in timing:
+        return f"skipped: {timing['skipped']}"
+    return f"{_seconds(timing['median'])} median ({_seconds(timing['min'])} min, {timing['number']} loops)"
+
+
+def _seconds(value: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:8.3f}{unit}"
+    return f"{value / 1e-9:8.1f}ns"
+
+
+def git_commit() -> Optional[str]:
+    """Short hash of the checked-out commit, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def machine_info() -> Dict[str, Any]:
+    """Details that make timings comparable (or not) between runs."""
+    return {
+        "name": platform.node() or "unknown",
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def save_results(run: Dict[str, Any], results_dir: Path = RESULTS_DIR) -> Path:
+    """
+    Save a run record as ``<results_dir>/<machine>/<timestamp>_<commit>.json``.
+
+    Args:
+        run: Record from ``run_benchmarks``
+        results_dir: Root folder for results
+
+    Returns:
+        Path: Saved file
+    """
+    folder = results_dir / _safe_name(run["machine"]["name"])
+    folder.mkdir(parents=True, exist_ok=True)
+    stamp = run["created_at"].replace(":", "").replace("-", "")
+    path = folder / f"{stamp}_{run['commit'] or 'nocommit'}.json"
+    path.write_text(json.dumps(run, indent=2), encoding="utf-8")
+    return path
+
+
+def latest_results(machine: str, results_dir: Path = RESULTS_DIR, exclude: Optional[Path] = None) -> Optional[Path]:
+    """Most recent saved run for a machine, other than ``exclude``."""
+    folder = results_dir / _safe_name(machine)
+    runs = sorted(path for path in folder.glob("*.json") if path != exclude) if folder.is_dir() else []
+    return runs[-1] if runs else None
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare median timings of the cases two runs have in common.
+
+    Args:
+        baseline: Earlier run record
+        current: Later run record
+        threshold: Ratio (current / baseline) above which a case counts as a regression
+
+    Returns:
+        List[Dict[str, Any]]: One row per case with name, case, both medians,
+            ratio and status ("regression", "improvement" or "same"), slowest ratio first
+    """
+    rows = []
+    for name, cases in current["results"].items():
+        for key, timing in cases.items():
+            before = baseline["results"].get(name, {}).get(key)
+            if not before or "median" not in before or "median" not in timing:
+                continue
+            ratio = timing["median"] / before["median"] if before["median"] else float("inf")
+            status = "regression" if ratio > threshold else "improvement" if ratio < 1 / threshold else "same"
+            rows.append({
+                "name": name, "case": key, "before": before["median"], "after": timing["median"],
+                "ratio": ratio, "status": status,
+            })
+    return sorted(rows, key=lambda row: row["ratio"], reverse=True)
+
+
+def print_comparison(rows: List[Dict[str, Any]], out=sys.stdout) -> None:
+    """Print the cases that changed beyond the threshold."""
+    changed = [row for row in rows if row["status"] != "same"]
+    if not changed:
+        print(f"No changes beyond the threshold across {len(rows)} cases", file=out)
+        return
+    for row in changed:
+        print(f"{row['status']:<12} {row['ratio']:6.2f}x  {row['name']}{row['case']}  "
+              f"{_seconds(row['before']).strip()} -> {_seconds(row['after']).strip()}", file=out)
+
+
+def _safe_name(name: str) -> str:
+    return "".join(char if char.isalnum() or char in "-_." else "_" for char in name)
@@ -0,0 +1,209 @@
+"""
+Synthetic inputs for the benchmarks.
+
+Everything is generated deterministically from a size parameter, so a
+benchmark measures the same work on every machine and every run.
+"""
+
+import json
+import random
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.llms.fake_llm import sample_output
+from src.models import (
+    AssessmentQualityOutput,
+    ContentQualityOutput,
+    EquityAccessibilityOutput,
+    FinalReviewReport,
+    PedagogicalEffectivenessOutput,
+    StandardsAlignmentOutput,
+)
+
+GRADES = ("K", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12")
+DOMAINS = {
+    "CC": "Counting and Cardinality",
+    "OA": "Operations and Algebraic Thinking",
+    "NBT": "Number and Operations in Base Ten",
+    "NF": "Number and Operations - Fractions",
+    "MD": "Measurement and Data",
+    "G": "Geometry",
+}
+_WORDS = (
+    "fractions number line equal parts unit fraction compare denominators numerators "
+    "multiply divide arrays area perimeter place value rounding estimate measure angles "
+    "shapes partition represent explain reasoning model equations word problems"
+).split()
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def curriculum_text(lessons: int, seed: int = 0) -> str:
+    """
+    Plain-text curriculum with units of ten lessons, each with an objective and problems.
+
+    Args:
+        lessons: Number of lessons
+        seed: Random seed
+
+    Returns:
+        str: Curriculum text in the layout the segmenter recognizes
+    """
+    rng = random.Random(seed)
+    lines = ["Grade 3 Mathematics", ""]
+    for number in range(1, lessons + 1):
+        if number % 10 == 1:
+            lines += [f"Unit {number // 10 + 1}: {rng.choice(_WORDS).title()} and {rng.choice(_WORDS).title()}", ""]
+        lines += [
+            f"Lesson {number}: {rng.choice(_WORDS).title()} {rng.choice(_WORDS).title()}",
+            f"Objective: {_sentence(rng)}",
+            _sentence(rng, 30),
+            f"1. {_sentence(rng, 8)}",
+            f"2. {_sentence(rng, 8)}",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def curriculum_markdown(lessons: int, seed: int = 0) -> str:
+    """The synthetic curriculum as Markdown headings and lists."""
+    text = curriculum_text(lessons, seed)
+    converted = []
+    for line in text.splitlines():
+        if line.startswith("Unit "):
+            line = f"## {line}"
+        elif line.startswith("Lesson "):
+            line = f"### {line}"
+        converted.append(line)
+    return "# " + "\n".join(converted)
+
+
+def curriculum_html(lessons: int, seed: int = 0) -> str:
+    """The synthetic curriculum as an HTML page with a script and style block to strip."""
+    body = "\n".join(
+        f"<p>{line}</p>" if line else "" for line in curriculum_text(lessons, seed).splitlines()
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Grade 3</title>"
+        "<style>p { margin: 0 }</style><script>var tracking = 1;</script></head>"
+        f"<body>{body}</body></html>"
+    )
+
+
+def write_docx(path: Path, paragraphs: List[str]) -> Path:
+    """
+    Write a minimal DOCX file with one paragraph per string.
+
+    Args:
+        path: Output file path
+        paragraphs: Paragraph texts
+
+    Returns:
+        Path: The written file path
+    """
+    namespace = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    body = "".join(
+        f"<w:p><w:r><w:t xml:space=\"preserve\">{text.replace('&', '&amp;').replace('<', '&lt;')}</w:t></w:r></w:p>"
+        for text in paragraphs
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" ContentType='
+            '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'
+        ))
+        archive.writestr("_rels/.rels", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/officeDocument" Target="word/document.xml"/>'
+            '</Relationships>'
+        ))
+        archive.writestr("word/document.xml", (
+            f'<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="{namespace}">'
+            f'<w:body>{body}</w:body></w:document>'
+        ))
+    return path
+
+
+def standards_dataset(per_domain: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    K-12 standards data in the layout of ``ccssm_standards.json``.
+
+    Args:
+        per_domain: Standards per domain in each grade
+        seed: Random seed
+
+    Returns:
+        Dict[str, Any]: Standards data with 13 grades of six domains each
+    """
+    rng = random.Random(seed)
+    grade_levels = {}
+    for grade in GRADES:
+        domains = {}
+        for code, name in DOMAINS.items():
+            domains[code] = {
+                "name": name,
+                "standards": [
+                    {
+                        "id": f"{grade}.{code}.{chr(ord('A') + number // 10)}.{number % 10 + 1}",
+                        "description": _sentence(rng, 20),
+                    }
+                    for number in range(per_domain)
+                ],
+            }
+        grade_levels[grade] = {"domains": domains}
+    return {
+        "metadata": {"title": "Synthetic standards", "abbreviation": "SYN", "version": "bench"},
+        "mathematical_practices": [
+            {"id": f"MP{number}", "title": _sentence(rng, 6), "description": _sentence(rng, 25)}
+            for number in range(1, 9)
+        ],
+        "grade_levels": grade_levels,
+    }
+
+
+def write_standards(path: Path, per_domain: int, seed: int = 0) -> Path:
+    """Write ``standards_dataset`` as JSON."""
+    path.write_text(json.dumps(standards_dataset(per_domain, seed)), encoding="utf-8")
+    return path
+
+
+def large_report(findings: int, seed: int = 0) -> FinalReviewReport:
+    """
+    A final report with every detailed section filled and ``findings`` items per list.
+
+    Args:
+        findings: Items in each list of findings and recommendations
+        seed: Random seed
+
+    Returns:
+        FinalReviewReport: Valid report
+    """
+    rng = random.Random(seed)
+    context = {"grade_level": "3", "curriculum_title": "Synthetic Grade 3 Mathematics"}
+    data = sample_output(FinalReviewReport, rng, context)
+    for name, field in FinalReviewReport.model_fields.items():
+        if field.annotation == List[str]:
+            data[name] = [_sentence(rng, 15) for _ in range(findings)]
+    for name, model in (
+        ("standards_analysis", StandardsAlignmentOutput),
+        ("content_review", ContentQualityOutput),
+        ("pedagogical_analysis", PedagogicalEffectivenessOutput),
+        ("equity_review", EquityAccessibilityOutput),
+        ("assessment_review", AssessmentQualityOutput),
+    ):
+        section = sample_output(model, rng, context)
+        for field_name, field in model.model_fields.items():
+            if field.annotation == List[str]:
+                section[field_name] = [_sentence(rng, 15) for _ in range(findings)]
+        data[name] = section
+    data["executive_summary"] = " ".join(_sentence(rng, 20) for _ in range(findings))
+    return FinalReviewReport.model_validate(data)
@@ -0,0 +1,5 @@
+"""Allow running the command-line interface with ``python -m src``."""
+
+from .cli import main
+
+main()
@@ -7,6 +7,8 @@ from crewai import Agent
 from typing import List, Optional
 
 from ..tools import document_analyzer_tool
+from ..llms.factory import agent_memory_enabled, create_agent_llm
+from ..utils.lazy import lazy_module_attributes
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -114,16 +116,18 @@ def create_equity_reviewer_agent(verbose: bool = True) -> Agent:
         
         tools=[document_analyzer_tool],
         
+        llm=create_agent_llm(),  # Cached or fake LLM when configured, else crewai's default
+        
         allow_delegation=False,  # Leaf agent - no delegation
         
         verbose=verbose,
         
-        memory=True  # Remember context
+        memory=agent_memory_enabled()  # Remember context
     )
     
     logger.info("Created Equity & Accessibility Reviewer Agent")
     return agent
 
 
-# For backwards compatibility and easy imports
-equity_reviewer_agent = create_equity_reviewer_agent()
+# For backwards compatibility and easy imports; the shared agent is created on first access
+__getattr__ = lazy_module_attributes(__name__, {"equity_reviewer_agent": create_equity_reviewer_agent})
@@ -7,6 +7,8 @@ from crewai import Agent
 from typing import List, Optional
 
 from ..tools import standards_lookup_tool
+from ..llms.factory import agent_memory_enabled, create_agent_llm
+from ..utils.lazy import lazy_module_attributes
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -67,17 +69,19 @@ def create_grade_level_checker_agent(verbose: bool = True) -> Agent:
         
         tools=[standards_lookup_tool],
         
+        llm=create_agent_llm(),  # Cached or fake LLM when configured, else crewai's default
+        
         allow_delegation=False,  # Leaf agent - no delegation
         
         verbose=verbose,
         
         # Optional: Add memory for context retention
-        memory=True
+        memory=agent_memory_enabled()
     )
     
     logger.info("Created Grade Level Standards Checker Agent")
     return agent
 
 
-# For backwards compatibility and easy imports
-grade_level_checker_agent = create_grade_level_checker_agent()
+# For backwards compatibility and easy imports; the shared agent is created on first access
+__getattr__ = lazy_module_attributes(__name__, {"grade_level_checker_agent": create_grade_level_checker_agent})
@@ -7,6 +7,8 @@ from crewai import Agent
 from typing import List, Optional
 
 from ..tools import document_analyzer_tool
+from ..llms.factory import agent_memory_enabled, create_agent_llm
+from ..utils.lazy import lazy_module_attributes
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -106,16 +108,18 @@ def create_inclusion_equity_specialist_agent(verbose: bool = True) -> Agent:
         
         tools=[document_analyzer_tool],
         
+        llm=create_agent_llm(),  # Cached or fake LLM when configured, else crewai's default
+        
         allow_delegation=True,  # Mid-level agent - CAN delegate
         
         verbose=verbose,
         
-        memory=True
+        memory=agent_memory_enabled()
     )
     
     logger.info("Created Inclusion & Equity Specialist Agent (Mid-Level)")
     return agent
 
 
-# For backwards compatibility and easy imports
-inclusion_equity_specialist_agent = create_inclusion_equity_specialist_agent()
+# For backwards compatibility and easy imports; the shared agent is created on first access
+__getattr__ = lazy_module_attributes(__name__, {"inclusion_equity_specialist_agent": create_inclusion_equity_specialist_agent})
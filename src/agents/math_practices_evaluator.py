@@ -7,6 +7,8 @@ from crewai import Agent
 from typing import List, Optional
 
 from ..tools import document_analyzer_tool, standards_lookup_tool
+from ..llms.factory import agent_memory_enabled, create_agent_llm
+from ..utils.lazy import lazy_module_attributes
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -88,16 +90,18 @@ def create_math_practices_evaluator_agent(verbose: bool = True) -> Agent:
         
         tools=[document_analyzer_tool, standards_lookup_tool],
         
+        llm=create_agent_llm(),  # Cached or fake LLM when configured, else crewai's default
+        
         allow_delegation=False,  # Leaf agent - no delegation
         
         verbose=verbose,
         
-        memory=True  # Remember context from previous interactions
+        memory=agent_memory_enabled()  # Remember context from previous interactions
     )
     
     logger.info("Created Mathematical Practices Evaluator Agent")
     return agent
 
 
-# For backwards compatibility and easy imports
-math_practices_evaluator_agent = create_math_practices_evaluator_agent()
+# For backwards compatibility and easy imports; the shared agent is created on first access
+__getattr__ = lazy_module_attributes(__name__, {"math_practices_evaluator_agent": create_math_practices_evaluator_agent})
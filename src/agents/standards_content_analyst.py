@@ -7,6 +7,8 @@ from crewai import Agent
 from typing import List, Optional
 
 from ..tools import standards_lookup_tool, document_analyzer_tool
+from ..llms.factory import agent_memory_enabled, create_agent_llm
+from ..utils.lazy import lazy_module_attributes
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -83,16 +85,18 @@ def create_standards_content_analyst_agent(verbose: bool = True) -> Agent:
         
         tools=[standards_lookup_tool, document_analyzer_tool],
         
+        llm=create_agent_llm(),  # Cached or fake LLM when configured, else crewai's default
+        
         allow_delegation=True,  # Mid-level agent - CAN delegate
         
         verbose=verbose,
         
-        memory=True
+        memory=agent_memory_enabled()
     )
     
     logger.info("Created Standards & Content Analyst Agent (Mid-Level)")
     return agent
 
 
-# For backwards compatibility and easy imports
-standards_content_analyst_agent = create_standards_content_analyst_agent()
+# For backwards compatibility and easy imports; the shared agent is created on first access
+__getattr__ = lazy_module_attributes(__name__, {"standards_content_analyst_agent": create_standards_content_analyst_agent})
@@ -0,0 +1,306 @@
+"""
+Command-line interface for the curriculum review system.
+
+Only click and the standard library are imported at module level; each
+command imports what it needs when it runs, so ``--help`` and the local
+commands (segmentation, alignment, standards search) start without loading
+crewai. Run with ``python -m src``.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from . import __version__
+
+
+def _read_curriculum(file_path: str, pages: Optional[str] = None) -> str:
+    """
+    Read curriculum text, using the document analyzer only for rich formats.
+
+    Args:
+        file_path: Path to the curriculum document
+        pages: Optional PDF page range (e.g., "40-60")
+
+    Returns:
+        str: Extracted text
+    """
+    from .utils.file_utils import read_curriculum
+
+    try:
+        return read_curriculum(Path(file_path), pages)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+
+@click.group()
+@click.version_option(__version__, prog_name="curriculum-review")
+@click.option('--fake-llm', is_flag=True,
+              help='Answer every agent call with an offline fake LLM (see FAKE_LLM_LATENCY).')
+def cli(fake_llm: bool):
+    """Mathematics curriculum review against the Common Core (CCSSM)."""
+    if fake_llm:
+        from .utils.config import Config
+
+        Config.FAKE_LLM_ENABLED = True
+
+
+@cli.command()
+@click.argument('file_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--pages', default=None, help='PDF page range, e.g. "40-60".')
+@click.option('--json', 'as_json', is_flag=True, help='Print the full segment tree as JSON.')
+def segment(file_path: str, pages: Optional[str], as_json: bool):
+    """Split a curriculum document into units, lessons and objectives."""
+    from .utils.segmentation import segment_curriculum
+
+    document = segment_curriculum(_read_curriculum(file_path, pages))
+    click.echo(document.model_dump_json(indent=2) if as_json else document.outline())
+
+
+@cli.command()
+@click.argument('file_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--pages', default=None, help='PDF page range, e.g. "40-60".')
+@click.option('--max-tokens', default=None, type=int,
+              help='Token budget per chunk (default: CHUNK_MAX_TOKENS).')
+def chunk(file_path: str, pages: Optional[str], max_tokens: Optional[int]):
+    """Show how a curriculum is split for map-reduce review."""
+    from .utils.chunking import chunk_curriculum
+
+    for piece in chunk_curriculum(_read_curriculum(file_path, pages), max_tokens):
+        click.echo(f"{piece.index + 1:>3}. lines {piece.start_line}-{piece.end_line}  "
+                   f"{piece.token_count} tokens  {piece.label}")
+
+
+@cli.command()
+@click.argument('file_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--grade', 'grade_level', default=None, help='Target grade level (K-8).')
+@click.option('--pages', default=None, help='PDF page range, e.g. "40-60".')
+@click.option('--top-k', default=3, show_default=True, help='Candidate standards per segment.')
+@click.option('--json', 'as_json', is_flag=True, help='Print the coverage map as JSON.')
+def align(file_path: str, grade_level: Optional[str], pages: Optional[str], top_k: int, as_json: bool):
+    """Match curriculum lessons to candidate standards without an LLM."""
+    from .utils.standards_alignment import match_curriculum_to_standards
+
+    coverage_map = match_curriculum_to_standards(
+        _read_curriculum(file_path, pages), grade_level=grade_level, top_k=top_k
+    )
+    click.echo(coverage_map.model_dump_json(indent=2) if as_json else coverage_map.to_prompt())
+
+
+@cli.group()
+def standards():
+    """Look up and search CCSSM standards."""
+
+
+@standards.command('show')
+@click.argument('standard_id')
+def show_standard(standard_id: str):
+    """Show a standard or mathematical practice by ID."""
+    from .utils.standards_loader import get_standards_loader
+
+    loader = get_standards_loader()
+    if "." in standard_id:
+        record = loader.search_standard(standard_id)
+    else:
+        record = next(
+            (p for p in loader.get_mathematical_practices() if p.get("id") == standard_id), None
+        )
+    if record is None:
+        raise click.ClickException(f"Standard not found: {standard_id}")
+    click.echo(json.dumps(record, indent=2))
+
+
+@standards.command('search')
+@click.argument('query')
+@click.option('--grade', default=None, help='Restrict results to one grade level.')
+@click.option('--top-k', default=None, type=int, help='Maximum number of results.')
+def search_standards(query: str, grade: Optional[str], top_k: Optional[int]):
+    """Full-text search over standards and practices."""
+    from .utils.config import Config
+    from .utils.standards_loader import get_standards_loader
+
+    results = get_standards_loader().search(
+        query, top_k=top_k or Config.STANDARDS_SEARCH_TOP_K, grade=grade
+    )
+    if not results:
+        click.echo("No matching standards.")
+    for record, score in results:
+        click.echo(f"{record.get('id')}  ({score:.2f})  {record.get('description', '')}")
+
+
+@standards.command('snapshot')
+@click.argument('sources', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+def build_snapshots(sources):
+    """Precompile standards JSON files into binary snapshots."""
+    from .utils.standards_snapshot import build_all_snapshots, build_snapshot
+
+    built = [build_snapshot(Path(source)) for source in sources] if sources else build_all_snapshots()
+    for path in built:
+        click.echo(str(path))
+
+
+@cli.command('check-grade')
+@click.argument('file_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--grade', 'grade_level', required=True, help='Target grade level (K-8).')
+@click.option('--pages', default=None, help='PDF page range, e.g. "40-60".')
+@click.option('--by-reference', is_flag=True,
+              help='Reference the curriculum by id; the agent reads sections through a tool.')
+@click.option('--verbose', is_flag=True, help='Show agent reasoning.')
+def check_grade(file_path: str, grade_level: str, pages: Optional[str], by_reference: bool,
+                verbose: bool):
+    """Run the grade-level checker agent on a curriculum document (calls the LLM)."""
+    from crewai import Crew, Process
+
+    from .agents.grade_level_checker import create_grade_level_checker_agent
+    from .tasks.grade_level_check_task import create_grade_level_check_task
+    from .utils.curriculum_context import register_curriculum, registered_curricula
+    from .utils.standards_alignment import match_curriculum_to_standards
+
+    content = _read_curriculum(file_path, pages)
+    agent = create_grade_level_checker_agent(verbose=verbose)
+    with registered_curricula():
+        task = create_grade_level_check_task(
+            agent=agent,
+            curriculum_content=register_curriculum(content, grade_level) if by_reference else content,
+            grade_level=grade_level,
+            candidate_alignment=match_curriculum_to_standards(content, grade_level=grade_level),
+        )
+        result = Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=verbose).kickoff()
+    click.echo(result.raw)
+
+
+@cli.command()
+@click.argument('file_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--grade', 'grade_level', required=True, help='Target grade level (K-8).')
+@click.option('--title', default=None, help='Curriculum title for the report.')
+@click.option('--pages', default=None, help='PDF page range, e.g. "40-60".')
+@click.option('--workers', default=None, type=int,
+              help='Concurrent task runs (default: MAX_CONCURRENT_TASKS).')
+@click.option('--max-tokens', default=None, type=int,
+              help='Token budget per chunk (default: CHUNK_MAX_TOKENS).')
+@click.option('--by-reference', is_flag=True,
+              help='Reference the curriculum by id; agents read sections through a tool.')
+@click.option('--mode', type=click.Choice(['concurrent', 'dag', 'incremental']), default='concurrent',
+              show_default=True,
+              help='concurrent: map-reduce leaf tasks; dag: dependency-graph pipeline; '
+                   'incremental: re-review only the lessons changed since the last review.')
+@click.option('--document-id', default=None,
+              help='Name incremental reviews are tracked under, so a revised draft with another '
+                   'file name is compared with the earlier one (default: file name).')
+@click.option('--compare', is_flag=True,
+              help='Run the DAG pipeline and the hierarchical crew and compare latency and tokens.')
+@click.option('--fresh', is_flag=True,
+              help='Discard saved task checkpoints for this curriculum and rerun every task.')
+@click.option('--verbose', is_flag=True, help='Show agent reasoning.')
+def review(file_path: str, grade_level: str, title: Optional[str], pages: Optional[str],
+           workers: Optional[int], max_tokens: Optional[int], by_reference: bool, mode: str,
+           document_id: Optional[str], compare: bool, fresh: bool, verbose: bool):
+    """Run all five specialists concurrently, then synthesize a final report (calls the LLM)."""
+    from .utils.file_utils import save_json
+    from .utils.profiling import save_run_profile
+
+    content = _read_curriculum(file_path, pages)
+    stem = Path(file_path).stem
+
+    if compare:
+        from .crews.review_pipeline import compare_review_modes
+
+        comparison = compare_review_modes(
+            content, grade_level, curriculum_title=title, max_workers=workers, verbose=verbose,
+        )
+        for name, stats in comparison.items():
+            if 'error' in stats:
+                click.echo(f"{name:<13} failed: {stats['error']}")
+            else:
+                click.echo(f"{name:<13} {stats['seconds']:>8.1f}s  "
+                           f"{stats.get('total_tokens', 0):>8} tokens  "
+                           f"{stats.get('successful_requests', 0):>4} requests")
+        path = save_json(comparison, f"{stem}_mode_comparison.json")
+        click.echo(f"Saved comparison to {path}")
+        return
+
+    if mode == 'dag':
+        from .crews.review_pipeline import run_review_pipeline
+
+        result = run_review_pipeline(
+            content, grade_level, curriculum_title=title,
+            max_workers=workers, by_reference=by_reference, verbose=verbose, fresh=fresh,
+        )
+    elif mode == 'incremental':
+        from .crews.incremental_review import run_incremental_review
+
+        result = run_incremental_review(
+            content, grade_level, document_id or stem, curriculum_title=title,
+            max_workers=workers, max_tokens=max_tokens, by_reference=by_reference, verbose=verbose,
+            fresh=fresh,
+        )
+        diff = result.segment_diff
+        click.echo(f"Segments: {len(diff.unchanged)} unchanged, {len(diff.edited)} edited, "
+                   f"{len(diff.added)} added, {len(diff.removed)} removed")
+    else:
+        from .crews.concurrent_review import run_concurrent_review
+
+        result = run_concurrent_review(
+            content, grade_level, curriculum_title=title,
+            max_workers=workers, max_tokens=max_tokens, by_reference=by_reference, verbose=verbose,
+            fresh=fresh,
+        )
+    path = save_json(result.model_dump(mode='json', exclude={'profile'}), f"{stem}_review.json")
+    profile_path = save_run_profile(result.profile, f"{stem}_profile.json")
+    if result.report is not None:
+        click.echo(result.report.executive_summary)
+    else:
+        click.echo(f"Synthesis failed: {result.error}", err=True)
+    click.echo(f"Timings: {result.timings}")
+    click.echo(f"Tokens: {result.token_usage.get('total_tokens', 0)}")
+    click.echo(f"Saved review to {path}")
+    if profile_path is not None:
+        click.echo(f"Saved run profile to {profile_path}")
+
+
+@cli.command()
+@click.argument('source', type=click.Path(exists=True))
+@click.option('--grade', 'grade_level', default=None,
+              help='Grade level for items without one (default: inferred from file names).')
+@click.option('--output-dir', default=None, type=click.Path(file_okay=False),
+              help='Folder for reports and index.json (default: OUTPUT_DIR/batch/<source name>).')
+@click.option('--workers', default=None, type=int,
+              help='Curricula reviewed at once (default: BATCH_MAX_WORKERS).')
+@click.option('--retries', default=None, type=int, help='Retries per curriculum (default: BATCH_MAX_RETRIES).')
+@click.option('--rpm', default=None, type=float,
+              help='LLM requests per minute across all workers (default: LLM_REQUESTS_PER_MINUTE).')
+@click.option('--mode', type=click.Choice(['concurrent', 'dag']), default='concurrent', show_default=True,
+              help='Review mode for each curriculum.')
+@click.option('--restart', is_flag=True, help='Review everything again instead of resuming.')
+@click.option('--verbose', is_flag=True, help='Show agent reasoning.')
+def batch(source: str, grade_level: Optional[str], output_dir: Optional[str], workers: Optional[int],
+          retries: Optional[int], rpm: Optional[float], mode: str, restart: bool, verbose: bool):
+    """Review every curriculum in a directory or JSON manifest (calls the LLM)."""
+    from .crews.batch_review import discover_batch_items, run_batch_review
+    from .utils.config import Config
+
+    items = discover_batch_items(Path(source), grade_level)
+    if not items:
+        raise click.ClickException(f"No curriculum documents found in {source}")
+    target = Path(output_dir) if output_dir else Config.OUTPUT_DIR / 'batch' / Path(source).stem
+    summary = run_batch_review(
+        items, target, max_workers=workers, max_retries=retries, requests_per_minute=rpm,
+        resume=not restart, mode=mode, verbose=verbose,
+    )
+    for item in summary.items:
+        rating = f"{item.overall_rating:5.1f}" if item.overall_rating is not None else "    -"
+        click.echo(f"{item.status:<10} {rating}  {Path(item.source).name}"
+                   + (f"  ({item.error})" if item.error else ""))
+    click.echo(f"{summary.count('completed')} completed, {summary.count('failed')} failed; "
+               f"index saved to {target / 'index.json'}")
+
+
+def main():
+    """Console entry point."""
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,34 @@
 """Crew configurations for the curriculum review system."""
+
+from ..utils.lazy import lazy_package_exports
+
+# Crew modules import crewai and the agents, so they are loaded on first access
+__getattr__ = lazy_package_exports(__name__, {
+    'LEAF_TASKS': '.leaf_tasks',
+    'run_leaf_task': '.leaf_tasks',
+    'run_map_reduce_review': '.map_reduce_review',
+    'merge_outputs': '.reducers',
+    'run_concurrent_review': '.concurrent_review',
+    'synthesize_report': '.concurrent_review',
+    'ReviewPipeline': '.review_pipeline',
+    'run_review_pipeline': '.review_pipeline',
+    'compare_review_modes': '.review_pipeline',
+    'run_incremental_review': '.incremental_review',
+    'discover_batch_items': '.batch_review',
+    'run_batch_review': '.batch_review',
+})
+
+__all__ = [
+    'LEAF_TASKS',
+    'run_leaf_task',
+    'run_map_reduce_review',
+    'merge_outputs',
+    'run_concurrent_review',
+    'synthesize_report',
+    'ReviewPipeline',
+    'run_review_pipeline',
+    'compare_review_modes',
+    'run_incremental_review',
+    'discover_batch_items',
+    'run_batch_review',
+]
@@ -0,0 +1,354 @@
+"""
+Batch reviews of many curricula, e.g. a publisher's whole K-8 series.
+
+Curricula come from a directory or a JSON manifest. They are reviewed on a
+bounded worker pool, and all of their LLM calls share one process-wide rate
+limit. A failed review is retried with backoff. Each curriculum gets its
+own ``FinalReviewReport`` file, and a summary index is rewritten after
+every item. The index doubles as the progress file, so re-running the same
+batch skips curricula that are already done.
+
+Throughput grows with the worker count until the shared rate limit becomes
+the bottleneck.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from ..models import BatchItemResult, BatchSummary, ReviewRunResult
+from ..utils.config import Config
+from ..utils.file_utils import CURRICULUM_SUFFIXES, ensure_directory, list_files, load_json, read_curriculum, save_json
+from ..utils.logger import setup_logger
+from ..utils.profiling import save_run_profile
+from ..utils.rate_limit import install_llm_rate_limit
+from .concurrent_review import run_concurrent_review
+from .review_pipeline import run_review_pipeline
+
+logger = setup_logger(__name__)
+
+INDEX_FILENAME = "index.json"
+
+# "grade3", "Grade-3", "grade_K", "g5", "kindergarten"
+_GRADE_PATTERN = re.compile(r'(?:^|[^a-z])(?:grade|gr|g)[\s_-]*(k|[1-8])(?![0-9])', re.IGNORECASE)
+
+
+class BatchItem(NamedTuple):
+    """One curriculum to review."""
+
+    path: Path
+    grade_level: Optional[str] = None
+    title: Optional[str] = None
+
+
+def infer_grade_level(path: Path) -> Optional[str]:
+    """
+    Guess a curriculum's grade level from its file or folder name.
+
+    Args:
+        path: Curriculum path
+
+    Returns:
+        Optional[str]: Grade level ("K" or "1"-"8"), or None if the name has none
+    """
+    for part in (path.stem, *reversed(path.parent.parts)):
+        if 'kindergarten' in part.lower():
+            return "K"
+        match = _GRADE_PATTERN.search(part)
+        if match:
+            return match.group(1).upper()
+    return None
+
+
+def discover_batch_items(
+    source: Path,
+    grade_level: Optional[str] = None,
+    pattern: str = "*",
+    recursive: bool = True
+) -> List[BatchItem]:
+    """
+    List the curricula in a directory or a JSON manifest.
+
+    A manifest is a JSON list (or an object with an ``items`` list) of
+    paths or of objects with ``path`` and optional ``grade_level`` and
+    ``title``. Relative paths are resolved against the manifest's folder.
+
+    Args:
+        source: Directory of curriculum documents, or a manifest file
+        grade_level: Grade level for items that do not give one (default: inferred from the name)
+        pattern: Glob pattern for directory sources
+        recursive: Whether to search directory sources recursively
+
+    Returns:
+        List[BatchItem]: Items sorted by path
+
+    Raises:
+        ValueError: If the source does not exist or a manifest entry has no path
+    """
+    source = Path(source)
+    if source.is_dir():
+        paths = [path for path in list_files(source, pattern, recursive)
+                 if path.suffix.lower() in CURRICULUM_SUFFIXES]
+        entries = [{'path': path} for path in sorted(paths)]
+        base = source
+    elif source.is_file():
+        manifest = load_json(source)
+        entries = manifest.get('items', []) if isinstance(manifest, dict) else manifest
+        base = source.parent
+    else:
+        raise ValueError(f"Batch source not found: {source}")
+
+    items = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'path': entry}
+        if not entry.get('path'):
+            raise ValueError(f"Manifest entry has no path: {entry}")
+        path = Path(entry['path'])
+        if not path.is_absolute():
+            path = base / path
+        items.append(BatchItem(
+            path=path,
+            grade_level=entry.get('grade_level') or grade_level or infer_grade_level(path),
+            title=entry.get('title'),
+        ))
+    return items
+
+
+def report_filename(path: Path) -> str:
+    """Report file name for a curriculum, unique even when stems repeat across folders."""
+    digest = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()[:8]
+    return f"{path.stem}_{digest}_report.json"
+
+
+class BatchProgress:
+    """Thread-safe summary index, saved after every change."""
+
+    def __init__(self, path: Path, summary: BatchSummary):
+        self.path = path
+        self.summary = summary
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: Path, batch_name: str, resume: bool = True) -> "BatchProgress":
+        """
+        Load an existing index, or start a new one.
+
+        Args:
+            path: Index file path
+            batch_name: Name recorded in a new index
+            resume: If False, any existing index is ignored
+
+        Returns:
+            BatchProgress: Progress tracker
+        """
+        if resume and path.exists():
+            try:
+                summary = BatchSummary.model_validate_json(path.read_text(encoding='utf-8'))
+                summary.finished_at = None
+                return cls(path, summary)
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable batch index {path}: {e}")
+        return cls(path, BatchSummary(batch_name=batch_name))
+
+    def get(self, source: str) -> Optional[BatchItemResult]:
+        """Get the recorded result for a source, if any."""
+        with self._lock:
+            return next((item for item in self.summary.items if item.source == source), None)
+
+    def record(self, result: BatchItemResult) -> None:
+        """Record (or replace) the result for a source and save the index."""
+        with self._lock:
+            items = [item for item in self.summary.items if item.source != result.source]
+            items.append(result)
+            self.summary.items = sorted(items, key=lambda item: item.source)
+            self._save()
+
+    def finish(self) -> BatchSummary:
+        """Stamp the finish time, save and return the summary."""
+        with self._lock:
+            self.summary.finished_at = datetime.now()
+            self._save()
+            return self.summary
+
+    def _save(self) -> None:
+        """Write the index atomically so an interrupted run never leaves it half-written."""
+        temp = self.path.with_suffix('.tmp')
+        temp.write_text(self.summary.model_dump_json(indent=2), encoding='utf-8')
+        os.replace(temp, self.path)
+
+
+def _review_once(item: BatchItem, mode: str, task_workers: Optional[int], by_reference: bool,
+                 llm: Optional[Any], verbose: bool) -> ReviewRunResult:
+    """Run one review attempt, raising if no report was produced."""
+    content = read_curriculum(item.path)
+    if mode == 'dag':
+        run = run_review_pipeline(
+            content, item.grade_level, curriculum_title=item.title, max_workers=task_workers,
+            by_reference=by_reference, llm=llm, verbose=verbose,
+        )
+    else:
+        run = run_concurrent_review(
+            content, item.grade_level, curriculum_title=item.title, max_workers=task_workers,
+            by_reference=by_reference, llm=llm, verbose=verbose,
+        )
+    if run.report is None:
+        raise RuntimeError(run.error or "Synthesis produced no report")
+    return run
+
+
+def review_batch_item(
+    item: BatchItem,
+    output_dir: Path,
+    max_retries: int,
+    retry_delay: float = 5.0,
+    mode: str = 'concurrent',
+    task_workers: Optional[int] = None,
+    by_reference: bool = False,
+    llm: Optional[Any] = None,
+    verbose: bool = False
+) -> BatchItemResult:
+    """
+    Review one curriculum, retrying failed attempts with exponential backoff.
+
+    Args:
+        item: Curriculum to review
+        output_dir: Folder for the report and run profile files
+        max_retries: Retries after the first attempt
+        retry_delay: Seconds to wait before the first retry; doubled for each later one
+        mode: 'concurrent' (map-reduce leaf tasks) or 'dag' (review pipeline)
+        task_workers: Concurrent tasks within the review
+        by_reference: Reference the curriculum by id in prompts instead of inlining it
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+
+    Returns:
+        BatchItemResult: Completed or failed result
+    """
+    result = BatchItemResult(source=str(item.path), grade_level=item.grade_level,
+                             curriculum_title=item.title)
+    if item.grade_level is None:
+        result.status = 'failed'
+        result.error = "No grade level given or found in the file name"
+        return result
+
+    started = time.perf_counter()
+    for attempt in range(max_retries + 1):
+        result.attempts = attempt + 1
+        try:
+            run = _review_once(item, mode, task_workers, by_reference, llm, verbose)
+        except Exception as e:
+            result.error = str(e)
+            logger.warning(f"Review of {item.path.name} failed (attempt {attempt + 1}): {e}")
+            if attempt < max_retries:
+                time.sleep(retry_delay * 2 ** attempt)
+            continue
+
+        path = save_json(run.report.model_dump(mode='json'), report_filename(item.path), output_dir)
+        profile_path = save_run_profile(
+            run.profile, report_filename(item.path).replace('_report.json', '_profile.json'), output_dir
+        )
+        result.status = 'completed'
+        result.error = None
+        result.curriculum_title = run.curriculum_title
+        result.report_path = str(path)
+        result.profile_path = str(profile_path) if profile_path else None
+        result.overall_rating = run.report.overall_rating
+        result.token_usage = run.token_usage
+        break
+    else:
+        result.status = 'failed'
+
+    result.seconds = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_batch_review(
+    items: Sequence[BatchItem],
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    requests_per_minute: Optional[float] = None,
+    resume: bool = True,
+    retry_delay: float = 5.0,
+    mode: str = 'concurrent',
+    task_workers: Optional[int] = None,
+    by_reference: bool = False,
+    llm: Optional[Any] = None,
+    verbose: bool = False
+) -> BatchSummary:
+    """
+    Review many curricula concurrently.
+
+    Args:
+        items: Curricula to review (see ``discover_batch_items``)
+        output_dir: Folder for report files and the summary index
+        max_workers: Curricula reviewed at once (default: Config.BATCH_MAX_WORKERS)
+        max_retries: Retries per curriculum (default: Config.BATCH_MAX_RETRIES)
+        requests_per_minute: LLM request budget shared by all workers
+            (default: Config.LLM_REQUESTS_PER_MINUTE; 0 = no limit)
+        resume: Skip curricula the existing index marks as completed
+        retry_delay: Seconds to wait before the first retry of an item
+        mode: 'concurrent' (map-reduce leaf tasks) or 'dag' (review pipeline)
+        task_workers: Concurrent tasks within each review (default: Config.MAX_CONCURRENT_TASKS)
+        by_reference: Reference each curriculum by id in prompts instead of inlining it
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+
+    Returns:
+        BatchSummary: Result for every item, also saved as ``index.json`` in output_dir
+
+    Example:
+        >>> items = discover_batch_items(Path("data/input/series"))
+        >>> summary = run_batch_review(items, Path("data/output/batch/series"), max_workers=4)
+        >>> summary.count('completed')
+        12
+    """
+    if max_workers is None:
+        max_workers = Config.BATCH_MAX_WORKERS
+    if max_retries is None:
+        max_retries = Config.BATCH_MAX_RETRIES
+    output_dir = ensure_directory(Path(output_dir))
+    install_llm_rate_limit(requests_per_minute)
+
+    progress = BatchProgress.open(output_dir / INDEX_FILENAME, output_dir.name, resume)
+    pending = []
+    for item in items:
+        done = progress.get(str(item.path))
+        if done and done.status == 'completed' and done.report_path and Path(done.report_path).exists():
+            continue
+        progress.record(BatchItemResult(source=str(item.path), grade_level=item.grade_level,
+                                        curriculum_title=item.title))
+        pending.append(item)
+    logger.info(f"Batch review: {len(pending)} of {len(items)} curricula to review, {max_workers} workers")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(
+                review_batch_item, item, output_dir, max_retries, retry_delay, mode,
+                task_workers, by_reference, llm, verbose,
+            ): item
+            for item in pending
+        }
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Saving the report failed; the review itself never raises
+                result = BatchItemResult(source=str(item.path), grade_level=item.grade_level,
+                                         status='failed', error=str(e))
+            progress.record(result)
+            logger.info(f"{item.path.name}: {result.status} after {result.attempts} attempt(s)")
+
+    summary = progress.finish()
+    logger.info(
+        f"Batch review finished: {summary.count('completed')} completed, {summary.count('failed')} failed"
+    )
+    return summary
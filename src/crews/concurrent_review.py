@@ -0,0 +1,239 @@
+"""
+Concurrent review pipeline.
+
+Runs the five independent leaf specialists (grade level, mathematical
+practices, pedagogy, equity, assessment) concurrently, then a single
+synthesis task that turns their structured outputs into a
+``FinalReviewReport``. Wall-clock time is roughly the slowest specialist
+plus one synthesis call, instead of the sum of all of them.
+"""
+
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from crewai import Crew, CrewOutput, Process
+
+from ..agents.curriculum_review_manager import create_curriculum_review_manager_agent
+from ..models import FinalReviewReport, LeafReviewResults, ReviewRunResult
+from ..tasks.synthesis_task import create_synthesis_task
+from ..utils.checkpoints import CheckpointStore, get_checkpoint_store
+from ..utils.logger import setup_logger
+from ..utils.profiling import RunProfiler
+from ..utils.segmentation import segment_curriculum
+from .leaf_tasks import add_usage, assign_llm, parse_output, usage_of
+from .map_reduce_review import run_map_reduce_review
+
+logger = setup_logger(__name__)
+
+# Bump when the synthesis prompt or report model changes, so old checkpoints are not reused
+SYNTHESIS_VERSION = "1"
+
+
+def run_synthesis(
+    leaf_results: LeafReviewResults,
+    curriculum_title: str,
+    llm: Optional[Any] = None,
+    verbose: bool = False
+) -> CrewOutput:
+    """
+    Run the synthesis task over completed leaf results.
+
+    Args:
+        leaf_results: Outputs of the leaf specialist tasks
+        curriculum_title: Title of the curriculum
+        llm: Optional LLM to use instead of the manager's default
+        verbose: If True, the agent outputs detailed execution logs
+
+    Returns:
+        CrewOutput: Crew result; pass it to ``build_report``
+    """
+    manager = create_curriculum_review_manager_agent(verbose=verbose)
+    manager.allow_delegation = False
+    assign_llm(manager, llm)
+    task = create_synthesis_task(manager, leaf_results, curriculum_title, leaf_results.grade_level)
+    task.name = "synthesis"
+    return Crew(agents=[manager], tasks=[task], process=Process.sequential, verbose=verbose).kickoff()
+
+
+def build_report(
+    result: CrewOutput,
+    leaf_results: LeafReviewResults,
+    review_metadata: Optional[dict] = None
+) -> FinalReviewReport:
+    """
+    Build the final report from a synthesis result.
+
+    The specialists' own outputs are attached to the report's detailed
+    sections, so the LLM only has to write the synthesis.
+
+    Args:
+        result: Synthesis crew result
+        leaf_results: Outputs of the leaf specialist tasks
+        review_metadata: Extra metadata to record on the report (values are stringified)
+
+    Returns:
+        FinalReviewReport: Completed report
+
+    Raises:
+        ValueError: If the synthesis output does not match FinalReviewReport
+    """
+    report = parse_output(result, FinalReviewReport)
+    if report is None:
+        raise ValueError("Synthesis output did not match the FinalReviewReport model")
+
+    report.pedagogical_analysis = leaf_results.pedagogical_analysis or report.pedagogical_analysis
+    report.equity_review = leaf_results.equity_review or report.equity_review
+    report.assessment_review = leaf_results.assessment_evaluation or report.assessment_review
+    report.review_metadata.update({key: str(value) for key, value in (review_metadata or {}).items()})
+    return report
+
+
+def synthesize_report(
+    leaf_results: LeafReviewResults,
+    curriculum_title: str,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    review_metadata: Optional[dict] = None
+) -> FinalReviewReport:
+    """
+    Run the synthesis task and build the final report.
+
+    Args:
+        leaf_results: Outputs of the leaf specialist tasks
+        curriculum_title: Title of the curriculum
+        llm: Optional LLM to use instead of the manager's default
+        verbose: If True, the agent outputs detailed execution logs
+        review_metadata: Extra metadata to record on the report
+
+    Returns:
+        FinalReviewReport: Synthesized report
+
+    Raises:
+        ValueError: If the synthesis output does not match FinalReviewReport
+    """
+    result = run_synthesis(leaf_results, curriculum_title, llm, verbose)
+    return build_report(result, leaf_results, review_metadata)
+
+
+def synthesize_with_checkpoint(
+    leaf_results: LeafReviewResults,
+    curriculum_title: str,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    review_metadata: Optional[dict] = None,
+    checkpoints: Optional[CheckpointStore] = None
+) -> Tuple[FinalReviewReport, Dict[str, int]]:
+    """
+    Synthesize the final report, reusing a checkpointed report for the same findings.
+
+    Args:
+        leaf_results: Outputs of the leaf specialist tasks
+        curriculum_title: Title of the curriculum
+        llm: Optional LLM to use instead of the manager's default
+        verbose: If True, the agent outputs detailed execution logs
+        review_metadata: Extra metadata to record on the report
+        checkpoints: Optional store to restore and save the report
+
+    Returns:
+        Tuple[FinalReviewReport, Dict[str, int]]: Report and the token usage
+            of the synthesis call (empty when restored)
+
+    Raises:
+        ValueError: If the synthesis output does not match FinalReviewReport
+    """
+    # Timings and token usage differ between runs without changing what the synthesis sees
+    synthesis_input = curriculum_title + leaf_results.model_dump_json(exclude={'timings', 'token_usage'})
+    if checkpoints is not None:
+        report = checkpoints.load('synthesis', SYNTHESIS_VERSION, FinalReviewReport, synthesis_input)
+        if report is not None:
+            report.review_metadata.update({key: str(value) for key, value in (review_metadata or {}).items()})
+            return report, {}
+
+    result = run_synthesis(leaf_results, curriculum_title, llm, verbose)
+    report = build_report(result, leaf_results, review_metadata)
+    if checkpoints is not None:
+        checkpoints.save('synthesis', SYNTHESIS_VERSION, report, synthesis_input)
+    return report, usage_of(result)
+
+
+def run_concurrent_review(
+    curriculum_content: str,
+    grade_level: str,
+    curriculum_title: Optional[str] = None,
+    task_names: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    by_reference: bool = False,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    checkpoint: Optional[bool] = None,
+    fresh: bool = False
+) -> ReviewRunResult:
+    """
+    Review a curriculum with concurrent leaf tasks and one synthesis task.
+
+    Curricula longer than the chunk budget are reviewed map-reduce style
+    (see ``run_map_reduce_review``); shorter ones run each leaf task once.
+    Each completed task is checkpointed, so rerunning a review that failed
+    part way only runs the tasks that had not finished.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        curriculum_title: Title for the report (default: the document's own title)
+        task_names: Leaf tasks to run (default: all five)
+        max_workers: Maximum concurrent task runs (default: Config.MAX_CONCURRENT_TASKS)
+        max_tokens: Token budget per chunk (default: Config.CHUNK_MAX_TOKENS)
+        by_reference: Reference the curriculum by id in prompts instead of inlining it
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+        checkpoint: Restore and save task checkpoints (default: Config.CHECKPOINTS_ENABLED)
+        fresh: Discard existing checkpoints for this curriculum first
+
+    Returns:
+        ReviewRunResult: Leaf outputs, the synthesized report, stage timings and run profile
+
+    Example:
+        >>> result = run_concurrent_review(curriculum_text, grade_level="3")
+        >>> print(result.report.overall_rating, result.timings)
+    """
+    started = time.perf_counter()
+    if curriculum_title is None:
+        curriculum_title = segment_curriculum(curriculum_content).title or "Untitled curriculum"
+    checkpoints = get_checkpoint_store(curriculum_content, grade_level, checkpoint, fresh)
+
+    with RunProfiler("concurrent", curriculum_title, grade_level) as profiler:
+        if checkpoints is not None:
+            profiler.track_cache('checkpoints', checkpoints)
+        leaf_results = run_map_reduce_review(
+            curriculum_content, grade_level, task_names, max_tokens, max_workers, llm, verbose, by_reference,
+            checkpoints,
+        )
+        leaf_seconds = time.perf_counter() - started
+        logger.info(f"Leaf tasks finished in {leaf_seconds:.1f}s: {leaf_results.completed_tasks()}")
+
+        run = ReviewRunResult(
+            curriculum_title=curriculum_title,
+            grade_level=grade_level,
+            leaf_results=leaf_results,
+            token_usage=dict(leaf_results.token_usage),
+        )
+        synthesis_started = time.perf_counter()
+        try:
+            run.report, usage = synthesize_with_checkpoint(
+                leaf_results, curriculum_title, llm, verbose,
+                review_metadata={"mode": "concurrent", "chunks": len(leaf_results.chunks)},
+                checkpoints=checkpoints,
+            )
+            add_usage(run.token_usage, usage)
+        except Exception as e:
+            logger.error(f"Synthesis failed: {e}")
+            run.error = str(e)
+
+    run.timings = {
+        "leaf_tasks": round(leaf_seconds, 3),
+        "synthesis": round(time.perf_counter() - synthesis_started, 3),
+        "total": round(time.perf_counter() - started, 3),
+    }
+    run.profile = profiler.finish(run.timings)
+    return run
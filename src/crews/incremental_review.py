@@ -0,0 +1,265 @@
+"""
+Incremental re-review of revised curricula.
+
+The curriculum is split into lesson-sized segments and every leaf task
+output is checkpointed under the digest of the segment it reviewed, in a
+store that follows the curriculum from draft to draft. Reviewing a revised
+draft diffs its segments against the last reviewed version, runs the leaf
+tasks only for segments whose text changed and restores the rest; all
+per-segment outputs are then merged and synthesized into a fresh report.
+Editing one lesson costs that lesson's leaf tasks plus one synthesis call.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from pydantic import ValidationError
+
+from ..models import (
+    CurriculumChunk,
+    LEAF_TASK_NAMES,
+    ReviewedSegment,
+    ReviewRunResult,
+    SegmentDiff,
+    SegmentManifest,
+)
+from ..utils.checkpoints import CheckpointStore, content_digest
+from ..utils.chunking import segment_blocks
+from ..utils.curriculum_context import register_curriculum, registered_curricula
+from ..utils.file_utils import save_json
+from ..utils.logger import setup_logger
+from ..utils.profiling import RunProfiler
+from ..utils.segmentation import segment_curriculum
+from .concurrent_review import synthesize_with_checkpoint
+from .leaf_tasks import LEAF_TASKS, LeafJob, add_usage, alignment_task_kwargs, run_leaf_jobs
+from .map_reduce_review import reduce_chunk_outputs
+
+logger = setup_logger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+# Digest prefix used in checkpoint keys; long enough to never collide within one curriculum
+_KEY_LENGTH = 16
+
+
+def format_segment(segment: CurriculumChunk) -> str:
+    """
+    Prefix segment text with a note on which part of the curriculum it is.
+
+    The note names the segment but not its position, and is added even when
+    the curriculum is a single segment, so a task's input depends only on
+    its segment: adding or removing a lesson changes no other lesson's input.
+
+    Args:
+        segment: Curriculum segment
+
+    Returns:
+        str: Text to pass to a task as its curriculum content
+    """
+    return (
+        f"[Excerpt: {segment.label}. Review only this excerpt; "
+        f"the other parts of the curriculum are reviewed separately and the results combined.]\n\n"
+        f"{segment.text}"
+    )
+
+
+def load_manifest(store: CheckpointStore) -> Optional[SegmentManifest]:
+    """
+    Load the manifest of the last reviewed version from a store.
+
+    Args:
+        store: Store of the curriculum's incremental reviews
+
+    Returns:
+        Optional[SegmentManifest]: Manifest, or None if there is no usable one
+    """
+    path = store.run_dir / MANIFEST_FILE
+    try:
+        return SegmentManifest.model_validate_json(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        logger.warning(f"Ignoring segment manifest {path}: {e}")
+        return None
+
+
+def save_manifest(store: CheckpointStore, manifest: SegmentManifest) -> Path:
+    """
+    Record a reviewed version as the one the next review is compared with.
+
+    Args:
+        store: Store of the curriculum's incremental reviews
+        manifest: Segments of the reviewed version
+
+    Returns:
+        Path: Saved manifest file
+    """
+    return save_json(manifest.model_dump(mode='json'), MANIFEST_FILE, store.run_dir)
+
+
+def diff_segments(segments: Sequence[ReviewedSegment], previous: Optional[SegmentManifest]) -> SegmentDiff:
+    """
+    Compare a curriculum's segments with those of its last reviewed version.
+
+    A segment is unchanged if its text was in the previous version, edited
+    if its label was but its text differs, and added otherwise.
+
+    Args:
+        segments: Current segments
+        previous: Manifest of the last reviewed version, if any
+
+    Returns:
+        SegmentDiff: Segment labels by kind of change
+    """
+    if previous is None:
+        return SegmentDiff(added=[segment.label for segment in segments])
+
+    previous_digests = {segment.digest for segment in previous.segments}
+    previous_labels = {segment.label for segment in previous.segments}
+    current_digests = {segment.digest for segment in segments}
+    current_labels = {segment.label for segment in segments}
+
+    diff = SegmentDiff(previous_reviewed_at=previous.reviewed_at)
+    for segment in segments:
+        if segment.digest in previous_digests:
+            diff.unchanged.append(segment.label)
+        elif segment.label in previous_labels:
+            diff.edited.append(segment.label)
+        else:
+            diff.added.append(segment.label)
+    diff.removed = [
+        segment.label for segment in previous.segments
+        if segment.digest not in current_digests and segment.label not in current_labels
+    ]
+    return diff
+
+
+def run_incremental_review(
+    curriculum_content: str,
+    grade_level: str,
+    document_id: str,
+    curriculum_title: Optional[str] = None,
+    task_names: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    by_reference: bool = False,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    fresh: bool = False
+) -> ReviewRunResult:
+    """
+    Review a curriculum, re-running the leaf tasks only for lessons that changed.
+
+    Outputs are kept per document id and grade level, so a revised draft is
+    compared with the last version reviewed under the same id even if its
+    file name or text differs. Once a review completes without failures its
+    segments become the baseline for the next one, and the outputs of
+    segments that no longer exist are deleted.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        document_id: Name the curriculum's reviews are tracked under (e.g., its file stem)
+        curriculum_title: Title for the report (default: the document's own title)
+        task_names: Leaf tasks to run (default: all five)
+        max_workers: Maximum concurrent task runs (default: Config.MAX_CONCURRENT_TASKS)
+        max_tokens: Token budget per segment (default: Config.CHUNK_MAX_TOKENS)
+        by_reference: Reference each segment by id in prompts instead of inlining it
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+        fresh: Discard the saved outputs and baseline first, so every segment is reviewed
+
+    Returns:
+        ReviewRunResult: Merged leaf outputs, the synthesized report, stage
+            timings, run profile and the segment diff
+
+    Raises:
+        ValueError: If a task name is unknown
+
+    Example:
+        >>> result = run_incremental_review(revised_text, "3", document_id="unit3")
+        >>> print(result.segment_diff.edited, result.token_usage)
+    """
+    task_names = list(task_names or LEAF_TASK_NAMES)
+    unknown = [name for name in task_names if name not in LEAF_TASKS]
+    if unknown:
+        raise ValueError(f"Unknown leaf tasks: {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    document = segment_curriculum(curriculum_content)
+    if curriculum_title is None:
+        curriculum_title = document.title or "Untitled curriculum"
+    store = CheckpointStore.for_document(document_id, grade_level)
+    if fresh:
+        store.clear()
+
+    segments = segment_blocks(curriculum_content, max_tokens, document)
+    reviewed = [
+        ReviewedSegment(label=segment.label, digest=content_digest(segment.text), token_count=segment.token_count)
+        for segment in segments
+    ]
+    previous = load_manifest(store)
+    diff = diff_segments(reviewed, previous)
+    logger.info(f"Incremental review of {document_id}: {len(diff.changed())} of {len(segments)} segments "
+                f"changed, {len(diff.removed)} removed")
+
+    contents = [format_segment(segment) for segment in segments]
+    with RunProfiler("incremental", curriculum_title, grade_level) as profiler, registered_curricula():
+        if by_reference:
+            contents = [register_curriculum(content, grade_level, segment.label)
+                        for content, segment in zip(contents, segments)]
+        jobs = [
+            # Each segment gets a coverage map of its own text, so editing one
+            # lesson leaves the other segments' inputs and checkpoints unchanged
+            LeafJob(name, segment.index, segment.label, content, entry.digest[:_KEY_LENGTH],
+                    alignment_task_kwargs(name, segment.text, grade_level))
+            for name in task_names
+            for segment, entry, content in zip(segments, reviewed, contents)
+        ]
+        profiler.track_cache('checkpoints', store)
+        job_results = run_leaf_jobs(jobs, grade_level, max_workers, llm, verbose, store)
+        leaf_results = reduce_chunk_outputs(grade_level, segments, job_results.outputs, job_results.failures)
+        leaf_results.timings = job_results.timings
+        leaf_results.token_usage = job_results.token_usage
+        leaf_seconds = time.perf_counter() - started
+        logger.info(f"Leaf tasks finished in {leaf_seconds:.1f}s: {leaf_results.completed_tasks()}")
+
+        run = ReviewRunResult(
+            curriculum_title=curriculum_title,
+            grade_level=grade_level,
+            leaf_results=leaf_results,
+            token_usage=dict(leaf_results.token_usage),
+            segment_diff=diff,
+        )
+        synthesis_started = time.perf_counter()
+        try:
+            run.report, usage = synthesize_with_checkpoint(
+                leaf_results, curriculum_title, llm, verbose,
+                review_metadata={
+                    "mode": "incremental",
+                    "segments": len(segments),
+                    "changed_segments": len(diff.changed()),
+                    "removed_segments": len(diff.removed),
+                },
+                checkpoints=store,
+            )
+            add_usage(run.token_usage, usage)
+        except Exception as e:
+            logger.error(f"Synthesis failed: {e}")
+            run.error = str(e)
+
+    run.timings = {
+        "leaf_tasks": round(leaf_seconds, 3),
+        "synthesis": round(time.perf_counter() - synthesis_started, 3),
+        "total": round(time.perf_counter() - started, 3),
+    }
+    run.profile = profiler.finish(run.timings)
+
+    if run.report is not None and not leaf_results.failures:
+        save_manifest(store, SegmentManifest(document_id=document_id, grade_level=grade_level, segments=reviewed))
+        current = {entry.digest for entry in reviewed}
+        for entry in previous.segments if previous is not None else []:
+            if entry.digest not in current:
+                store.discard(f"*@{entry.digest[:_KEY_LENGTH]}")
+    return run
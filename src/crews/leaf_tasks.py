@@ -0,0 +1,378 @@
+"""
+Registry of the five leaf specialist tasks and runners for them.
+
+Each leaf task pairs an agent factory, a task factory and the pydantic
+model the task produces, so review pipelines can build and run any leaf
+task by name, one at a time or concurrently.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from crewai import Agent, Crew, CrewOutput, Process, Task
+from crewai.llms.base_llm import BaseLLM
+from pydantic import BaseModel, ValidationError
+
+from ..agents.assessment_evaluator import create_assessment_evaluator_agent
+from ..agents.equity_reviewer import create_equity_reviewer_agent
+from ..agents.grade_level_checker import create_grade_level_checker_agent
+from ..agents.math_practices_evaluator import create_math_practices_evaluator_agent
+from ..agents.pedagogical_analyst import create_pedagogical_analyst_agent
+from ..llms.fake_llm import FakeLLM
+from ..models import (
+    AssessmentQualityOutput,
+    EquityAccessibilityOutput,
+    GradeLevelCheckOutput,
+    MathPracticesOutput,
+    PedagogicalEffectivenessOutput,
+)
+from ..tasks.assessment_evaluation_task import create_assessment_evaluation_task
+from ..tasks.equity_review_task import create_equity_review_task
+from ..tasks.grade_level_check_task import create_grade_level_check_task
+from ..tasks.math_practices_task import create_math_practices_task
+from ..tasks.pedagogical_analysis_task import create_pedagogical_analysis_task
+from ..utils.checkpoints import CheckpointStore, content_digest
+from ..utils.config import Config
+from ..utils.logger import setup_logger
+from ..utils.profiling import submit_in_context
+from ..utils.standards_alignment import match_curriculum_to_standards
+
+logger = setup_logger(__name__)
+
+
+class LeafJob(NamedTuple):
+    """One leaf task run over one piece of curriculum content."""
+
+    name: str
+    index: int
+    label: str
+    curriculum_content: Any
+    # Checkpoint under "name@key" instead of by position (e.g., a segment's content digest)
+    checkpoint_key: Optional[str] = None
+    # Extra task factory arguments for this job (e.g., candidate_alignment)
+    task_kwargs: Optional[Dict[str, Any]] = None
+
+
+class LeafJobResults(NamedTuple):
+    """Collected results of a batch of leaf jobs."""
+
+    outputs: Dict[str, List[Tuple[int, BaseModel]]]
+    failures: Dict[str, List[str]]
+    timings: Dict[str, float]
+    token_usage: Dict[str, int]
+
+
+class LeafTaskSpec(NamedTuple):
+    """How to build and interpret one leaf specialist task."""
+
+    create_agent: Callable[..., Agent]
+    create_task: Callable[..., Task]
+    output_model: Type[BaseModel]
+    # Bump when the prompt or output model changes, so old checkpoints are not reused
+    version: str = "1"
+
+
+# Keyed by the LeafReviewResults field each task fills, in review order
+LEAF_TASKS: Dict[str, LeafTaskSpec] = {
+    'grade_level_check': LeafTaskSpec(
+        create_grade_level_checker_agent, create_grade_level_check_task, GradeLevelCheckOutput
+    ),
+    'math_practices': LeafTaskSpec(
+        create_math_practices_evaluator_agent, create_math_practices_task, MathPracticesOutput
+    ),
+    'pedagogical_analysis': LeafTaskSpec(
+        create_pedagogical_analyst_agent, create_pedagogical_analysis_task, PedagogicalEffectivenessOutput
+    ),
+    'equity_review': LeafTaskSpec(
+        create_equity_reviewer_agent, create_equity_review_task, EquityAccessibilityOutput
+    ),
+    'assessment_evaluation': LeafTaskSpec(
+        create_assessment_evaluator_agent, create_assessment_evaluation_task, AssessmentQualityOutput
+    ),
+}
+
+
+def assign_llm(agent: Agent, llm: Optional[Any]) -> Agent:
+    """
+    Give an agent its own copy of a shared LLM.
+
+    Crews report the lifetime usage of their agents' LLMs, so each agent
+    gets a copy with a fresh usage counter and a crew reports only its own
+    calls. Agents on a ``FakeLLM`` also drop memory, whose extraction
+    calls would otherwise go to the default remote LLM.
+
+    Args:
+        agent: Agent to update
+        llm: LLM to use, or None to keep the agent's default
+
+    Returns:
+        Agent: The same agent
+    """
+    if llm is None:
+        return agent
+    if isinstance(llm, BaseLLM):
+        llm = _fresh_usage_copy(llm)
+    agent.llm = llm
+    if isinstance(llm, FakeLLM):
+        agent.memory = False
+    return agent
+
+
+def _fresh_usage_copy(llm: BaseLLM) -> BaseLLM:
+    """Shallow copy of an LLM (and any LLM it wraps) with zeroed token usage."""
+    update = {}
+    if isinstance(getattr(llm, 'inner', None), BaseLLM):
+        update['inner'] = _fresh_usage_copy(llm.inner)
+    copy = llm.model_copy(update=update)
+    copy._token_usage = {key: 0 for key in llm._token_usage}
+    return copy
+
+
+def build_leaf_task(
+    name: str,
+    curriculum_content: Any,
+    grade_level: str,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    **task_kwargs
+) -> Tuple[Agent, Task]:
+    """
+    Create a fresh agent and task for a leaf specialist.
+
+    A new agent is created per call so concurrent runs never share agent
+    state or memory.
+
+    Args:
+        name: Leaf task name (a key of LEAF_TASKS)
+        curriculum_content: Curriculum text or registered CurriculumContext
+        grade_level: Target grade level
+        llm: Optional LLM to use instead of the agent's default
+        verbose: If True, agent outputs detailed execution logs
+        **task_kwargs: Extra task factory arguments (e.g., candidate_alignment)
+
+    Returns:
+        Tuple[Agent, Task]: Agent and its task
+
+    Raises:
+        KeyError: If the task name is unknown
+    """
+    spec = LEAF_TASKS[name]
+    agent = assign_llm(spec.create_agent(verbose=verbose), llm)
+    task = spec.create_task(
+        agent=agent, curriculum_content=curriculum_content, grade_level=grade_level, **task_kwargs
+    )
+    task.name = name
+    return agent, task
+
+
+def parse_output(result: CrewOutput, model: Type[BaseModel]) -> Optional[BaseModel]:
+    """
+    Get a task's structured output from a crew result.
+
+    Args:
+        result: Crew result
+        model: Expected output model
+
+    Returns:
+        Optional[BaseModel]: Parsed output, or None if the raw output does not fit the model
+    """
+    if isinstance(result.pydantic, model):
+        return result.pydantic
+    try:
+        if result.json_dict:
+            return model.model_validate(result.json_dict)
+        return model.model_validate_json(result.raw)
+    except (ValidationError, ValueError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not parse {model.__name__} from task output: {e}")
+        return None
+
+
+def usage_of(result: CrewOutput) -> Dict[str, int]:
+    """
+    Get token usage counters from a crew result.
+
+    Args:
+        result: Crew result
+
+    Returns:
+        Dict[str, int]: Counters such as total_tokens, prompt_tokens and successful_requests
+    """
+    usage = getattr(result, 'token_usage', None)
+    if usage is None:
+        return {}
+    return {key: value for key, value in usage.model_dump().items() if isinstance(value, int)}
+
+
+def add_usage(total: Dict[str, int], usage: Dict[str, int]) -> Dict[str, int]:
+    """
+    Add token usage counters into a running total.
+
+    Args:
+        total: Running total, updated in place
+        usage: Counters to add
+
+    Returns:
+        Dict[str, int]: The updated total
+    """
+    for key, value in usage.items():
+        total[key] = total.get(key, 0) + value
+    return total
+
+
+def alignment_task_kwargs(name: str, curriculum_text: str, grade_level: str) -> Optional[Dict[str, Any]]:
+    """
+    Run the standards alignment pre-pass for one leaf job, if its task uses it.
+
+    The coverage map is built from the job's own text, so a chunk's grade-level
+    check sees only the candidate standards of the excerpt it reviews.
+
+    Args:
+        name: Leaf task name
+        curriculum_text: Text the job reviews, without any excerpt note
+        grade_level: Target grade level
+
+    Returns:
+        Optional[Dict[str, Any]]: Task factory arguments for the job's ``LeafJob.task_kwargs``,
+            or None if the task takes none
+    """
+    if name != 'grade_level_check':
+        return None
+    coverage = match_curriculum_to_standards(curriculum_text, grade_level=grade_level)
+    return {'candidate_alignment': coverage}
+
+
+def job_input(job: LeafJob) -> Any:
+    """
+    Input a leaf job's checkpoint is saved for: its content and any task arguments.
+
+    Args:
+        job: Leaf job
+
+    Returns:
+        Any: The job's content, or a string combining its digest with the task arguments
+    """
+    if not job.task_kwargs:
+        return job.curriculum_content
+    arguments = json.dumps({
+        key: value.model_dump(mode='json') if isinstance(value, BaseModel) else value
+        for key, value in job.task_kwargs.items()
+    }, sort_keys=True, default=str)
+    return f"{content_digest(job.curriculum_content)}|{arguments}"
+
+
+def run_leaf_task(
+    name: str,
+    curriculum_content: Any,
+    grade_level: str,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    **task_kwargs
+) -> CrewOutput:
+    """
+    Run one leaf specialist task in its own single-agent crew.
+
+    Args:
+        name: Leaf task name (a key of LEAF_TASKS)
+        curriculum_content: Curriculum text or registered CurriculumContext
+        grade_level: Target grade level
+        llm: Optional LLM to use instead of the agent's default
+        verbose: If True, agent outputs detailed execution logs
+        **task_kwargs: Extra task factory arguments
+
+    Returns:
+        CrewOutput: Crew result; use ``parse_output`` for the structured output
+    """
+    agent, task = build_leaf_task(name, curriculum_content, grade_level, llm, verbose, **task_kwargs)
+    crew = Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=verbose)
+    return crew.kickoff()
+
+
+def run_leaf_jobs(
+    jobs: Sequence[LeafJob],
+    grade_level: str,
+    max_workers: Optional[int] = None,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    checkpoints: Optional[CheckpointStore] = None
+) -> LeafJobResults:
+    """
+    Run leaf jobs concurrently on a bounded thread pool.
+
+    The leaf specialists have no data dependencies on each other, so wall
+    clock time approaches that of the slowest job once ``max_workers``
+    covers all of them. A failing job is recorded and does not stop the others.
+    Jobs with a checkpoint are restored instead of run, and every job that
+    completes is checkpointed, so a rerun after a failure only repeats the
+    jobs that failed. A job's checkpoint is keyed by its content and its
+    task arguments (see ``job_input``).
+
+    Args:
+        jobs: Jobs to run
+        grade_level: Target grade level
+        max_workers: Maximum concurrent jobs (default: Config.MAX_CONCURRENT_TASKS)
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+        checkpoints: Optional store to restore and save job outputs
+
+    Returns:
+        LeafJobResults: Outputs as (job index, output) pairs per task, error
+            messages per task, wall-clock seconds per job run (keyed 'name',
+            'name[index]' or 'name@checkpoint_key') and summed token usage
+    """
+    if max_workers is None:
+        max_workers = Config.MAX_CONCURRENT_TASKS
+    single_piece = len({job.index for job in jobs}) <= 1
+
+    outputs: Dict[str, List[Tuple[int, BaseModel]]] = {}
+    failures: Dict[str, List[str]] = {}
+    timings: Dict[str, float] = {}
+    token_usage: Dict[str, int] = {}
+
+    def key_of(job: LeafJob) -> str:
+        if job.checkpoint_key is not None:
+            return f"{job.name}@{job.checkpoint_key}"
+        return job.name if single_piece else f"{job.name}[{job.index}]"
+
+    def run(job: LeafJob) -> Tuple[CrewOutput, float]:
+        started = time.perf_counter()
+        result = run_leaf_task(
+            job.name, job.curriculum_content, grade_level, llm, verbose, **(job.task_kwargs or {})
+        )
+        return result, time.perf_counter() - started
+
+    pending = []
+    for job in jobs:
+        spec = LEAF_TASKS[job.name]
+        restored = checkpoints.load(key_of(job), spec.version, spec.output_model, job_input(job)) \
+            if checkpoints is not None else None
+        if restored is None:
+            pending.append(job)
+        else:
+            outputs.setdefault(job.name, []).append((job.index, restored))
+    if len(pending) < len(jobs):
+        logger.info(f"Restored {len(jobs) - len(pending)} of {len(jobs)} leaf jobs from checkpoints")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {submit_in_context(executor, run, job): job for job in pending}
+        for future in as_completed(futures):
+            job = futures[future]
+            key = key_of(job)
+            try:
+                result, elapsed = future.result()
+            except Exception as e:
+                logger.error(f"{job.name} failed on {job.label}: {e}")
+                failures.setdefault(job.name, []).append(f"{job.label}: {e}")
+                continue
+            timings[key] = round(elapsed, 3)
+            add_usage(token_usage, usage_of(result))
+            output = parse_output(result, LEAF_TASKS[job.name].output_model)
+            if output is None:
+                failures.setdefault(job.name, []).append(f"{job.label}: output did not match the model")
+            else:
+                outputs.setdefault(job.name, []).append((job.index, output))
+                if checkpoints is not None:
+                    checkpoints.save(key, LEAF_TASKS[job.name].version, output, job_input(job))
+
+    return LeafJobResults(outputs, failures, timings, token_usage)
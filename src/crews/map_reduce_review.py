@@ -0,0 +1,140 @@
+"""
+Map-reduce review mode for long curricula.
+
+The curriculum is split into token-budgeted chunks at unit/lesson
+boundaries. Every selected leaf task runs once per chunk, concurrently,
+and the per-chunk outputs of each task are merged into one. Latency is
+bounded by the slowest chunk rather than the whole document, and no single
+prompt has to hold the entire curriculum.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from ..models import CurriculumChunk, LEAF_TASK_NAMES, LeafReviewResults
+from ..utils.checkpoints import CheckpointStore
+from ..utils.chunking import chunk_curriculum
+from ..utils.curriculum_context import register_curriculum, registered_curricula
+from ..utils.logger import setup_logger
+from .leaf_tasks import LEAF_TASKS, LeafJob, alignment_task_kwargs, run_leaf_jobs
+from .reducers import merge_outputs
+
+logger = setup_logger(__name__)
+
+
+def format_chunk(chunk: CurriculumChunk, total: int) -> str:
+    """
+    Prefix chunk text with a note on which part of the curriculum it is.
+
+    Args:
+        chunk: Curriculum chunk
+        total: Number of chunks in the curriculum
+
+    Returns:
+        str: Text to pass to a task as its curriculum content
+    """
+    if total == 1:
+        return chunk.text
+    return (
+        f"[Excerpt {chunk.index + 1} of {total}: {chunk.label}. Review only this excerpt; "
+        f"the other parts of the curriculum are reviewed separately and the results combined.]\n\n"
+        f"{chunk.text}"
+    )
+
+
+def run_map_reduce_review(
+    curriculum_content: str,
+    grade_level: str,
+    task_names: Optional[Sequence[str]] = None,
+    max_tokens: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    by_reference: bool = False,
+    checkpoints: Optional[CheckpointStore] = None
+) -> LeafReviewResults:
+    """
+    Review a curriculum chunk by chunk and merge the results per task.
+
+    A curriculum that fits in one chunk is reviewed whole, so this is also
+    the general entry point for running the leaf tasks concurrently.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        task_names: Leaf tasks to run (default: all five)
+        max_tokens: Token budget per chunk (default: Config.CHUNK_MAX_TOKENS)
+        max_workers: Maximum concurrent task runs (default: Config.MAX_CONCURRENT_TASKS)
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+        by_reference: If True, register each chunk as a CurriculumContext and
+            reference it by id in the task prompts instead of inlining it
+        checkpoints: Optional store to restore and save per-chunk task outputs
+
+    Returns:
+        LeafReviewResults: Merged output per task, plus any per-chunk failures
+    """
+    task_names = list(task_names or LEAF_TASK_NAMES)
+    unknown = [name for name in task_names if name not in LEAF_TASKS]
+    if unknown:
+        raise ValueError(f"Unknown leaf tasks: {', '.join(unknown)}")
+
+    chunks = chunk_curriculum(curriculum_content, max_tokens)
+    contents = [format_chunk(chunk, len(chunks)) for chunk in chunks]
+    with registered_curricula():
+        if by_reference:
+            contents = [register_curriculum(content, grade_level, chunk.label)
+                        for content, chunk in zip(contents, chunks)]
+        jobs = [
+            LeafJob(name, chunk.index, chunk.label, content,
+                    task_kwargs=alignment_task_kwargs(name, chunk.text, grade_level))
+            for name in task_names
+            for chunk, content in zip(chunks, contents)
+        ]
+        logger.info(f"Leaf review: {len(task_names)} tasks x {len(chunks)} chunks")
+
+        job_results = run_leaf_jobs(jobs, grade_level, max_workers, llm, verbose, checkpoints)
+    results = reduce_chunk_outputs(grade_level, chunks, job_results.outputs, job_results.failures)
+    results.timings = job_results.timings
+    results.token_usage = job_results.token_usage
+    return results
+
+
+def reduce_chunk_outputs(
+    grade_level: str,
+    chunks: Sequence[CurriculumChunk],
+    outputs: Dict[str, List[Tuple[int, BaseModel]]],
+    failures: Optional[Dict[str, List[str]]] = None
+) -> LeafReviewResults:
+    """
+    Merge per-chunk outputs into one output per task.
+
+    Outputs are weighted by chunk token count, so a long unit counts for
+    more than a short appendix.
+
+    Args:
+        grade_level: Target grade level
+        chunks: Chunks that were reviewed
+        outputs: Task name -> (chunk index, output) pairs
+        failures: Task name -> error messages
+
+    Returns:
+        LeafReviewResults: Merged results
+    """
+    results = LeafReviewResults(
+        grade_level=grade_level,
+        chunks=[chunk.label for chunk in chunks],
+        failures=failures or {},
+    )
+    for name, indexed in outputs.items():
+        if not indexed:
+            continue
+        indexed = sorted(indexed, key=lambda item: item[0])
+        merged = merge_outputs(
+            LEAF_TASKS[name].output_model,
+            [output for _, output in indexed],
+            [chunks[index].token_count for index, _ in indexed],
+        )
+        setattr(results, name, merged)
+    return results
@@ -0,0 +1,149 @@
+"""
+Reducers that merge per-chunk review outputs into one.
+
+Each leaf task produces one pydantic output per curriculum chunk. Merging
+is driven by the output model's field types, so the same reducer handles
+``GradeLevelCheckOutput``, ``MathPracticesOutput`` and the other leaf
+outputs:
+
+- numeric scores: mean weighted by chunk size
+- lists of findings: union in first-seen order, without duplicates
+- dicts of scores: per-key weighted mean
+- dicts of lists: per-key union
+- ordinal ratings (e.g. scaffolding quality): weighted mean on the scale
+- other strings: the value with the largest total weight
+"""
+
+import typing
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Ordinal string fields, best to worst
+ORDINAL_SCALES: Dict[str, Sequence[str]] = {
+    "scaffolding_quality": ("Excellent", "Good", "Fair", "Poor"),
+}
+
+
+def _normalize(item: Any) -> Any:
+    """Key used to detect duplicate list items."""
+    return " ".join(item.lower().split()).rstrip(".") if isinstance(item, str) else repr(item)
+
+
+def _union(lists: Sequence[List[Any]]) -> List[Any]:
+    """Merge lists in first-seen order, dropping duplicates."""
+    seen = set()
+    merged = []
+    for items in lists:
+        for item in items:
+            key = _normalize(item)
+            if key not in seen:
+                seen.add(key)
+                merged.append(item)
+    return merged
+
+
+def _weighted_mean(values: Sequence[float], weights: Sequence[float]) -> float:
+    """Weighted mean, falling back to the plain mean when all weights are zero."""
+    total = sum(weights)
+    if not total:
+        return sum(values) / len(values)
+    return sum(value * weight for value, weight in zip(values, weights)) / total
+
+
+def _merge_ordinal(values: Sequence[str], weights: Sequence[float], scale: Sequence[str]) -> str:
+    """Average ordinal ratings on their scale; unknown ratings are ignored."""
+    lookup = {label.lower(): rank for rank, label in enumerate(scale)}
+    ranked = [(lookup[v.strip().lower()], w) for v, w in zip(values, weights) if v.strip().lower() in lookup]
+    if not ranked:
+        return _merge_text(values, weights)
+    rank = _weighted_mean([r for r, _ in ranked], [w for _, w in ranked])
+    return scale[int(rank + 0.5)]
+
+
+def _merge_text(values: Sequence[str], weights: Sequence[float]) -> str:
+    """Pick the value with the largest total weight (ties go to the first seen)."""
+    totals: Dict[str, float] = {}
+    for value, weight in zip(values, weights):
+        totals[value] = totals.get(value, 0.0) + weight
+    return max(totals, key=lambda value: totals[value])
+
+
+def _merge_field(name: str, annotation: Any, values: List[Any], weights: List[float]) -> Any:
+    """Merge one field's values according to its type annotation."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Union:
+        inner = [arg for arg in args if arg is not type(None)]
+        present = [(v, w) for v, w in zip(values, weights) if v is not None]
+        if not present or len(inner) != 1:
+            return present[0][0] if present else None
+        return _merge_field(name, inner[0], [v for v, _ in present], [w for _, w in present])
+
+    if annotation in (float, int):
+        merged = _weighted_mean(values, weights)
+        return round(merged, 2) if annotation is float else round(merged)
+    if annotation is datetime:
+        return max(values)
+    if origin is list:
+        return _union(values)
+    if origin is dict:
+        value_type = args[1] if len(args) == 2 else Any
+        per_key: Dict[Any, List[Any]] = defaultdict(list)
+        per_key_weights: Dict[Any, List[float]] = defaultdict(list)
+        for mapping, weight in zip(values, weights):
+            for key, value in mapping.items():
+                per_key[key].append(value)
+                per_key_weights[key].append(weight)
+        return {
+            key: _merge_field(name, value_type, per_key[key], per_key_weights[key])
+            for key in per_key
+        }
+    if annotation is str:
+        if name in ORDINAL_SCALES:
+            return _merge_ordinal(values, weights, ORDINAL_SCALES[name])
+        return _merge_text(values, weights)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return merge_outputs(annotation, values, weights)
+    return values[0]
+
+
+def merge_outputs(
+    model: Type[ModelT],
+    outputs: Sequence[ModelT],
+    weights: Optional[Sequence[float]] = None
+) -> ModelT:
+    """
+    Merge several outputs of the same model into one.
+
+    Args:
+        model: Output model class (e.g., GradeLevelCheckOutput)
+        outputs: Per-chunk outputs
+        weights: Relative weight of each output, e.g. chunk token counts
+            (default: equal weights)
+
+    Returns:
+        Output model instance combining all inputs
+
+    Raises:
+        ValueError: If no outputs are given
+    """
+    if not outputs:
+        raise ValueError(f"No {model.__name__} outputs to merge")
+    if len(outputs) == 1:
+        return outputs[0]
+    if weights is None:
+        weights = [1.0] * len(outputs)
+
+    merged = {
+        name: _merge_field(
+            name, field.annotation, [getattr(output, name) for output in outputs], list(weights)
+        )
+        for name, field in model.model_fields.items()
+    }
+    return model(**merged)
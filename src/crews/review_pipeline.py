@@ -0,0 +1,457 @@
+"""
+Declarative DAG review pipeline.
+
+An alternative to the hierarchical crew in which a manager LLM delegates
+to three coordinators, which delegate to five specialists. Here the task
+factories are wired into an explicit dependency graph:
+
+    alignment (deterministic pre-pass) --> grade_level_check --\\
+    math_practices ---------------------------------------------+
+    pedagogical_analysis ---------------------------------------+--> synthesis
+    equity_review ----------------------------------------------+
+    assessment_evaluation --------------------------------------/
+
+Nodes whose dependencies are complete run in parallel, and the manager is
+called exactly once, for the final synthesis into a ``FinalReviewReport``.
+``compare_review_modes`` runs this pipeline and the hierarchical crew on
+the same curriculum and reports latency and token usage for both.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from crewai import Crew, Process
+
+from ..models import LEAF_TASK_NAMES, LeafReviewResults, ReviewRunResult
+from ..utils.checkpoints import CheckpointStore, content_digest, get_checkpoint_store
+from ..utils.config import Config
+from ..utils.curriculum_context import register_curriculum, registered_curricula
+from ..utils.logger import setup_logger
+from ..utils.profiling import RunProfiler, submit_in_context
+from ..utils.segmentation import segment_curriculum
+from ..utils.standards_alignment import match_curriculum_to_standards
+from .concurrent_review import synthesize_with_checkpoint
+from . import leaf_tasks
+from .leaf_tasks import LEAF_TASKS, add_usage, assign_llm, parse_output, usage_of
+
+logger = setup_logger(__name__)
+
+# Default model for the hierarchical manager when no LLM is given or configured,
+# as in test_full_system.py
+HIERARCHICAL_MANAGER_LLM = "gpt-3.5-turbo"
+
+
+class PipelineNode(NamedTuple):
+    """
+    One step of a pipeline.
+
+    ``run`` receives the outputs of the node's dependencies keyed by node
+    name and returns ``(output, token_usage)``. A node that tolerates
+    failures runs once all its dependencies have finished, with the outputs
+    of those that succeeded; otherwise a failed dependency skips it.
+    """
+
+    name: str
+    run: Callable[[Dict[str, Any]], Tuple[Any, Dict[str, int]]]
+    depends_on: Tuple[str, ...] = ()
+    tolerate_failures: bool = False
+
+
+class PipelineRun(NamedTuple):
+    """Outputs, failures, timings and token usage of a pipeline run."""
+
+    outputs: Dict[str, Any]
+    failures: Dict[str, str]
+    timings: Dict[str, float]
+    token_usage: Dict[str, int]
+
+
+class ReviewPipeline:
+    """
+    Runs a DAG of nodes, starting each as soon as its dependencies finish.
+    """
+
+    def __init__(self, nodes: Sequence[PipelineNode]):
+        """
+        Initialize and validate the pipeline.
+
+        Args:
+            nodes: Pipeline nodes
+
+        Raises:
+            ValueError: If node names repeat, a dependency is unknown or the graph has a cycle
+        """
+        self.nodes: Dict[str, PipelineNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"Duplicate pipeline node: {node.name}")
+            self.nodes[node.name] = node
+
+        for node in nodes:
+            unknown = [dep for dep in node.depends_on if dep not in self.nodes]
+            if unknown:
+                raise ValueError(f"Node '{node.name}' depends on unknown nodes: {', '.join(unknown)}")
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """Order nodes so every node follows its dependencies."""
+        remaining = {name: set(node.depends_on) for name, node in self.nodes.items()}
+        order: List[str] = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Pipeline has a dependency cycle among: {', '.join(sorted(remaining))}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def run(self, max_workers: Optional[int] = None) -> PipelineRun:
+        """
+        Execute the pipeline.
+
+        A node whose dependency failed is skipped and recorded as failed,
+        unless it tolerates failures.
+
+        Args:
+            max_workers: Maximum nodes running at once (default: Config.MAX_CONCURRENT_TASKS)
+
+        Returns:
+            PipelineRun: Outputs, failures, timings and summed token usage
+        """
+        if max_workers is None:
+            max_workers = Config.MAX_CONCURRENT_TASKS
+
+        outputs: Dict[str, Any] = {}
+        failures: Dict[str, str] = {}
+        timings: Dict[str, float] = {}
+        token_usage: Dict[str, int] = {}
+        pending = list(self.order)
+        running: Dict[Future, str] = {}
+
+        def execute(node: PipelineNode, inputs: Dict[str, Any]) -> Tuple[Any, Dict[str, int], float]:
+            started = time.perf_counter()
+            output, usage = node.run(inputs)
+            return output, usage, time.perf_counter() - started
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while pending or running:
+                for name in list(pending):
+                    node = self.nodes[name]
+                    failed = [dep for dep in node.depends_on if dep in failures]
+                    if failed and not node.tolerate_failures:
+                        failures[name] = f"skipped: dependency failed ({', '.join(failed)})"
+                        pending.remove(name)
+                    elif all(dep in outputs or dep in failures for dep in node.depends_on):
+                        inputs = {dep: outputs[dep] for dep in node.depends_on if dep in outputs}
+                        running[submit_in_context(executor, execute, node, inputs)] = name
+                        pending.remove(name)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        output, usage, elapsed = future.result()
+                    except Exception as e:
+                        logger.error(f"Pipeline node '{name}' failed: {e}")
+                        failures[name] = str(e)
+                        continue
+                    outputs[name] = output
+                    timings[name] = round(elapsed, 3)
+                    add_usage(token_usage, usage)
+
+        return PipelineRun(outputs, failures, timings, token_usage)
+
+
+def _leaf_node(name: str, content: Any, grade_level: str, llm: Optional[Any], verbose: bool,
+               depends_on: Tuple[str, ...] = (),
+               checkpoints: Optional[CheckpointStore] = None,
+               tolerate_failures: bool = False) -> PipelineNode:
+    """Build a node that runs one leaf task, or restores it from a checkpoint."""
+    spec = LEAF_TASKS[name]
+
+    def run(inputs: Dict[str, Any]) -> Tuple[Any, Dict[str, int]]:
+        task_kwargs = {}
+        task_input = content
+        if 'alignment' in inputs:
+            task_kwargs['candidate_alignment'] = inputs['alignment']
+            task_input = f"{content_digest(content)}|{inputs['alignment'].model_dump_json()}"
+        if checkpoints is not None:
+            restored = checkpoints.load(name, spec.version, spec.output_model, task_input)
+            if restored is not None:
+                return restored, {}
+
+        result = leaf_tasks.run_leaf_task(name, content, grade_level, llm, verbose, **task_kwargs)
+        output = parse_output(result, spec.output_model)
+        if output is None:
+            raise ValueError(f"{name} output did not match {spec.output_model.__name__}")
+        if checkpoints is not None:
+            checkpoints.save(name, spec.version, output, task_input)
+        return output, usage_of(result)
+    return PipelineNode(name, run, depends_on, tolerate_failures)
+
+
+def build_review_pipeline(
+    curriculum_content: str,
+    grade_level: str,
+    curriculum_title: str,
+    task_names: Optional[Sequence[str]] = None,
+    by_reference: bool = False,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    checkpoints: Optional[CheckpointStore] = None
+) -> ReviewPipeline:
+    """
+    Wire the leaf task factories and the synthesis task into a DAG.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        curriculum_title: Title for the report
+        task_names: Leaf tasks to include (default: all five)
+        by_reference: Reference the curriculum by id in prompts instead of inlining it; build
+            inside ``registered_curricula()`` so the context is released after the run
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+        checkpoints: Optional store to restore and save leaf outputs and the report
+
+    Returns:
+        ReviewPipeline: Pipeline whose 'synthesis' node produces the FinalReviewReport
+
+    Raises:
+        ValueError: If a task name is unknown
+    """
+    task_names = list(task_names or LEAF_TASK_NAMES)
+    unknown = [name for name in task_names if name not in LEAF_TASKS]
+    if unknown:
+        raise ValueError(f"Unknown leaf tasks: {', '.join(unknown)}")
+    content = register_curriculum(curriculum_content, grade_level, curriculum_title) \
+        if by_reference else curriculum_content
+
+    nodes = [PipelineNode(
+        'alignment',
+        lambda inputs: (match_curriculum_to_standards(curriculum_content, grade_level=grade_level), {}),
+    )]
+    for name in task_names:
+        # The grade-level check still runs, without candidate standards, if the pre-pass fails
+        depends_on = ('alignment',) if name == 'grade_level_check' else ()
+        nodes.append(_leaf_node(
+            name, content, grade_level, llm, verbose, depends_on, checkpoints, tolerate_failures=True,
+        ))
+
+    def synthesize(inputs: Dict[str, Any]) -> Tuple[Any, Dict[str, int]]:
+        # Like concurrent mode, synthesize whichever specialists succeeded
+        if not inputs:
+            raise ValueError("No leaf task completed")
+        leaf_results = LeafReviewResults(
+            grade_level=grade_level,
+            chunks=[curriculum_title],
+            failures={name: ["did not complete"] for name in task_names if name not in inputs},
+            **inputs,
+        )
+        return synthesize_with_checkpoint(
+            leaf_results, curriculum_title, llm, verbose,
+            review_metadata={"mode": "dag"}, checkpoints=checkpoints,
+        )
+
+    nodes.append(PipelineNode('synthesis', synthesize, tuple(task_names), tolerate_failures=True))
+    return ReviewPipeline(nodes)
+
+
+def run_review_pipeline(
+    curriculum_content: str,
+    grade_level: str,
+    curriculum_title: Optional[str] = None,
+    task_names: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    by_reference: bool = False,
+    llm: Optional[Any] = None,
+    verbose: bool = False,
+    checkpoint: Optional[bool] = None,
+    fresh: bool = False
+) -> ReviewRunResult:
+    """
+    Review a curriculum with the DAG pipeline.
+
+    Completed nodes are checkpointed, so a rerun after a failure resumes
+    at the nodes that had not finished.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        curriculum_title: Title for the report (default: the document's own title)
+        task_names: Leaf tasks to run (default: all five)
+        max_workers: Maximum nodes running at once (default: Config.MAX_CONCURRENT_TASKS)
+        by_reference: Reference the curriculum by id in prompts instead of inlining it
+        llm: Optional LLM to use for every agent
+        verbose: If True, agents output detailed execution logs
+        checkpoint: Restore and save task checkpoints (default: Config.CHECKPOINTS_ENABLED)
+        fresh: Discard existing checkpoints for this curriculum first
+
+    Returns:
+        ReviewRunResult: Leaf outputs, the synthesized report, per-node timings, token usage
+            and run profile
+    """
+    started = time.perf_counter()
+    if curriculum_title is None:
+        curriculum_title = segment_curriculum(curriculum_content).title or "Untitled curriculum"
+
+    checkpoints = get_checkpoint_store(curriculum_content, grade_level, checkpoint, fresh)
+    with RunProfiler("dag", curriculum_title, grade_level) as profiler, registered_curricula():
+        pipeline = build_review_pipeline(
+            curriculum_content, grade_level, curriculum_title, task_names, by_reference, llm, verbose,
+            checkpoints,
+        )
+        if checkpoints is not None:
+            profiler.track_cache('checkpoints', checkpoints)
+        run = pipeline.run(max_workers)
+
+    leaf_names = [name for name in pipeline.order if name in LEAF_TASKS]
+    leaf_results = LeafReviewResults(
+        grade_level=grade_level,
+        chunks=[curriculum_title],
+        failures={name: [run.failures[name]] for name in leaf_names if name in run.failures},
+        timings={name: run.timings[name] for name in leaf_names if name in run.timings},
+        **{name: run.outputs[name] for name in leaf_names if name in run.outputs},
+    )
+    timings = dict(run.timings)
+    timings['total'] = round(time.perf_counter() - started, 3)
+
+    return ReviewRunResult(
+        curriculum_title=curriculum_title,
+        grade_level=grade_level,
+        report=run.outputs.get('synthesis'),
+        leaf_results=leaf_results,
+        timings=timings,
+        token_usage=run.token_usage,
+        error=run.failures.get('synthesis'),
+        profile=profiler.finish(timings),
+    )
+
+
+def run_hierarchical_review(
+    curriculum_content: str,
+    grade_level: str,
+    manager_llm: Optional[Any] = None,
+    verbose: bool = False,
+    llm: Optional[Any] = None
+) -> Tuple[str, Dict[str, float], Dict[str, int]]:
+    """
+    Review a curriculum with the original 3-level hierarchical crew.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        manager_llm: LLM (or model name) for the hierarchical manager (default:
+            ``llm``, else the configured cached or fake LLM, else HIERARCHICAL_MANAGER_LLM)
+        verbose: If True, agents output detailed execution logs
+        llm: Optional LLM to use for every agent
+
+    Returns:
+        Tuple: (raw report text, {'total': seconds}, token usage)
+    """
+    from ..agents import (
+        create_assessment_evaluator_agent,
+        create_curriculum_review_manager_agent,
+        create_equity_reviewer_agent,
+        create_grade_level_checker_agent,
+        create_inclusion_equity_specialist_agent,
+        create_math_practices_evaluator_agent,
+        create_pedagogical_analyst_agent,
+        create_standards_content_analyst_agent,
+        create_teaching_learning_reviewer_agent,
+    )
+    from ..llms.factory import create_agent_llm
+    from ..tasks.comprehensive_review_task import create_comprehensive_review_task
+
+    if manager_llm is None:
+        manager_llm = llm or create_agent_llm() or HIERARCHICAL_MANAGER_LLM
+    started = time.perf_counter()
+    review_manager = create_curriculum_review_manager_agent(verbose=verbose)
+    agents = [
+        review_manager,
+        create_standards_content_analyst_agent(verbose=verbose),
+        create_teaching_learning_reviewer_agent(verbose=verbose),
+        create_inclusion_equity_specialist_agent(verbose=verbose),
+        create_grade_level_checker_agent(verbose=verbose),
+        create_math_practices_evaluator_agent(verbose=verbose),
+        create_pedagogical_analyst_agent(verbose=verbose),
+        create_assessment_evaluator_agent(verbose=verbose),
+        create_equity_reviewer_agent(verbose=verbose),
+    ]
+    for agent in agents:
+        assign_llm(agent, llm)
+    task = create_comprehensive_review_task(
+        agent=review_manager, curriculum_content=curriculum_content, grade_level=grade_level
+    )
+    crew = Crew(
+        agents=agents,
+        tasks=[task],
+        process=Process.hierarchical,
+        manager_llm=manager_llm,
+        verbose=verbose,
+    )
+    result = crew.kickoff()
+    return result.raw, {'total': round(time.perf_counter() - started, 3)}, usage_of(result)
+
+
+def compare_review_modes(
+    curriculum_content: str,
+    grade_level: str,
+    curriculum_title: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    llm: Optional[Any] = None,
+    manager_llm: Optional[Any] = None,
+    verbose: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the DAG pipeline and the hierarchical crew on the same curriculum.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        curriculum_title: Title for the report
+        max_workers: Maximum concurrent nodes for the DAG pipeline
+        llm: Optional LLM for every agent in both modes
+        manager_llm: LLM (or model name) for the hierarchical manager (default: as in
+            ``run_hierarchical_review``)
+        verbose: If True, agents output detailed execution logs
+
+    Returns:
+        Dict: Mode ('dag', 'hierarchical') -> seconds, token counters, whether
+            a report was produced and the run profile
+    """
+    # Checkpoints are bypassed so both modes pay for every call they make
+    dag = run_review_pipeline(
+        curriculum_content, grade_level, curriculum_title, max_workers=max_workers,
+        llm=llm, verbose=verbose, checkpoint=False
+    )
+    comparison = {
+        'dag': {
+            'seconds': dag.timings['total'],
+            **dag.token_usage,
+            'report': dag.report is not None,
+            'profile': dag.profile.model_dump(mode='json'),
+        }
+    }
+
+    try:
+        with RunProfiler("hierarchical", curriculum_title, grade_level) as profiler:
+            raw, timings, usage = run_hierarchical_review(
+                curriculum_content, grade_level, manager_llm, verbose, llm
+            )
+        comparison['hierarchical'] = {
+            'seconds': timings['total'], **usage, 'report': bool(raw),
+            'profile': profiler.finish(timings).model_dump(mode='json'),
+        }
+    except Exception as e:
+        logger.error(f"Hierarchical review failed: {e}")
+        comparison['hierarchical'] = {'error': str(e), 'report': False}
+
+    logger.info(f"Review mode comparison: {comparison}")
+    return comparison
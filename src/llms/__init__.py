@@ -0,0 +1,18 @@
+"""LLM wrappers and stand-ins used by the review agents."""
+
+from ..utils.lazy import lazy_package_exports
+
+# LLM modules import crewai, so they are loaded on first access
+__getattr__ = lazy_package_exports(__name__, {
+    'CachedLLM': '.cached_llm',
+    'FakeLLM': '.fake_llm',
+    'LatencyDistribution': '.fake_llm',
+    'create_agent_llm': '.factory',
+})
+
+__all__ = [
+    'CachedLLM',
+    'FakeLLM',
+    'LatencyDistribution',
+    'create_agent_llm',
+]
@@ -0,0 +1,162 @@
+"""
+LLM wrapper that replays cached responses.
+
+``CachedLLM`` sits in front of any crewai LLM. A call whose model, full
+message list, temperature, stop words, response model and offered tools
+match a stored entry returns the stored response without contacting the
+provider or waiting for a rate-limit slot; any other call is forwarded
+and its response stored.
+"""
+
+import json
+from typing import Any, ClassVar, Dict, List, Optional
+
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from crewai.types.usage_metrics import UsageMetrics
+from crewai.utilities.agent_utils import extract_tool_call_info, is_tool_call_list
+from pydantic import ConfigDict, Field, model_validator
+
+from ..utils.llm_cache import LLMResponseCache
+from ..utils.logger import setup_logger
+from ..utils.rate_limit import llm_request_slot
+
+logger = setup_logger(__name__)
+
+# Prefix of stored native tool-call responses; text responses are stored as is
+_TOOL_CALLS_PREFIX = "\x00tool_calls:"
+
+
+def _encode_tool_calls(tool_calls: List[Any]) -> Optional[str]:
+    """
+    Serialize a native tool-call response in the OpenAI dict format.
+
+    Args:
+        tool_calls: Tool calls in any provider format crewai understands
+
+    Returns:
+        Optional[str]: Stored form, or None if a call's format is not recognized
+    """
+    encoded = []
+    for tool_call in tool_calls:
+        info = extract_tool_call_info(tool_call)
+        if info is None:
+            return None
+        call_id, name, arguments = info
+        if not isinstance(arguments, str):
+            arguments = json.dumps(arguments, ensure_ascii=False)
+        encoded.append({"id": call_id, "type": "function", "function": {"name": name, "arguments": arguments}})
+    return _TOOL_CALLS_PREFIX + json.dumps(encoded, ensure_ascii=False)
+
+
+def _decode_response(stored: str) -> Any:
+    """
+    Turn a stored response back into what the wrapped LLM returned.
+
+    Args:
+        stored: Cached response
+
+    Returns:
+        Any: Response text, or a list of tool-call dicts
+    """
+    if stored.startswith(_TOOL_CALLS_PREFIX):
+        return json.loads(stored[len(_TOOL_CALLS_PREFIX):])
+    return stored
+
+
+class CachedLLM(BaseLLM):
+    """
+    Response-caching wrapper around another LLM.
+
+    The wrapped LLM's function-calling support is kept. Native tool-call
+    responses are cached like text, and tool results reach the cache key
+    through the messages of the next call. Calls that hand the LLM
+    ``available_functions`` to run tools itself are never cached, since
+    replaying them would skip the tools.
+
+    Example:
+        >>> llm = CachedLLM(inner=LLM(model="gpt-4-turbo"), cache=LLMResponseCache())
+        >>> agent.llm = llm
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # Waits for a rate-limit slot only on a cache miss
+    acquires_rate_limit_slot: ClassVar[bool] = True
+
+    llm_type: str = "cached"
+    inner: BaseLLM = Field(..., description="LLM that answers cache misses")
+    cache: LLMResponseCache = Field(..., description="Response store")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _copy_inner_settings(cls, data: Any) -> Any:
+        """Take the model name and sampling settings from the wrapped LLM."""
+        if isinstance(data, dict) and data.get("inner") is not None:
+            inner = data["inner"]
+            data.setdefault("model", inner.model)
+            data.setdefault("temperature", inner.temperature)
+            data.setdefault("provider", inner.provider)
+        return data
+
+    def call(
+        self,
+        messages: Any,
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+        response_model: Optional[Any] = None,
+    ) -> Any:
+        """
+        Return the cached response for these messages, or call the wrapped LLM and cache its response.
+
+        Text and native tool-call responses are cached; anything else is passed through.
+        """
+        stop = self.stop_sequences
+        key = None
+        if not available_functions:
+            key = self.cache.make_key(
+                self.model, messages, self.temperature, stop,
+                response_model.__name__ if response_model is not None else None,
+                tools,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {self.model}")
+                return _decode_response(cached)
+
+        # Stop words set by the agent executor apply to this wrapper; pass them on
+        with llm_request_slot(), call_stop_override(self.inner, stop):
+            response = self.inner.call(
+                messages, tools=tools, callbacks=callbacks, available_functions=available_functions,
+                from_task=from_task, from_agent=from_agent, response_model=response_model,
+            )
+        if key is not None:
+            stored = None
+            if isinstance(response, str) and response and not response.startswith(_TOOL_CALLS_PREFIX):
+                stored = response
+            elif isinstance(response, list) and is_tool_call_list(response):
+                stored = _encode_tool_calls(response)
+            if stored is not None:
+                self.cache.put(key, self.model, stored)
+        return response
+
+    def supports_function_calling(self) -> bool:
+        """Whether the wrapped LLM supports native function calling."""
+        # Not every BaseLLM implements the check; those use the text tool protocol
+        supports = getattr(self.inner, 'supports_function_calling', None)
+        return bool(supports()) if supports is not None else False
+
+    def supports_stop_words(self) -> bool:
+        """Whether the wrapped LLM honours stop words."""
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        """Context window of the wrapped LLM."""
+        return self.inner.get_context_window_size()
+
+    def get_token_usage_summary(self) -> UsageMetrics:
+        """Token usage of calls that reached the provider; cache hits cost nothing."""
+        return self.inner.get_token_usage_summary()
+
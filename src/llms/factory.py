@@ -0,0 +1,51 @@
+"""
+Choice of LLM for newly created agents.
+
+Agent factories call ``create_agent_llm`` so configuration alone decides
+whether agents talk to the provider directly, through the response cache,
+or to the offline fake.
+"""
+
+from typing import Optional
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+
+from ..utils.config import Config
+from ..utils.llm_cache import get_llm_response_cache
+from .cached_llm import CachedLLM
+from .fake_llm import FakeLLM
+
+
+def create_agent_llm() -> Optional[BaseLLM]:
+    """
+    Get the LLM for a new agent.
+
+    - ``FAKE_LLM_ENABLED``: a ``FakeLLM`` (no network)
+    - ``LLM_CACHE_ENABLED``: a ``CachedLLM`` over ``Config.get_model_name()``
+    - otherwise None, which leaves crewai to pick its default LLM from the environment
+
+    A new instance is returned per agent, so crew token accounting stays per agent.
+
+    Returns:
+        Optional[BaseLLM]: LLM to pass to ``Agent(llm=...)``
+    """
+    if Config.FAKE_LLM_ENABLED:
+        return FakeLLM.from_config()
+    cache = get_llm_response_cache()
+    if cache is None:
+        return None
+    return CachedLLM(inner=LLM(model=Config.get_model_name()), cache=cache)
+
+
+def agent_memory_enabled() -> bool:
+    """
+    Whether new agents keep memory.
+
+    Memory extraction calls crewai's default (remote) LLM, so it is off
+    when agents run on the offline fake.
+
+    Returns:
+        bool: Value for ``Agent(memory=...)``
+    """
+    return not Config.FAKE_LLM_ENABLED
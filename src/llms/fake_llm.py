@@ -0,0 +1,308 @@
+"""
+Offline stand-in for a remote LLM.
+
+``FakeLLM`` answers every agent call with a schema-valid final answer for
+the calling task's ``output_pydantic`` model. Values are generated from the
+model's fields: scores within their bounds, ordinal ratings from their
+scale, and templated findings. Any of them can be overridden with canned
+values. Each call sleeps for a latency drawn from a configurable
+distribution and records estimated token usage, so crew setup, JSON
+parsing, validation and report rendering can be load-tested without a
+network connection or API spend. The fake never calls tools.
+
+With a seed, every answer is a function of the seed, the output model and
+the prompt, so concurrent runs give the same outputs whatever order their
+calls are made in.
+"""
+
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import typing
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from annotated_types import Ge, Gt, Le, Lt
+from crewai.llms.base_llm import BaseLLM
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+from ..crews.reducers import ORDINAL_SCALES
+from ..utils.chunking import count_tokens
+from ..utils.config import Config
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Dict fields whose keys are the eight Standards for Mathematical Practice
+_PRACTICE_KEYS = tuple(f"MP{number}" for number in range(1, 9))
+
+_GRADE_PATTERN = re.compile(r'TARGET GRADE LEVEL:\s*(K|\d+)', re.IGNORECASE)
+_TITLE_PATTERN = re.compile(r'reviews? of "([^"]+)"')
+
+
+class LatencyDistribution(BaseModel):
+    """
+    Distribution of simulated response times, in seconds.
+
+    Kinds and their parameters:
+        fixed: (seconds,)
+        uniform: (low, high)
+        normal: (mean, stddev), clipped at 0
+        lognormal: (median, sigma)
+        exponential: (mean,)
+    """
+
+    kind: str = "fixed"
+    params: Tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """
+        Parse a spec such as "0.5", "uniform:0.2,1.0" or "lognormal:1.5,0.4".
+
+        Args:
+            spec: Distribution kind and comma-separated parameters
+
+        Returns:
+            LatencyDistribution: Parsed distribution
+
+        Raises:
+            ValueError: If the kind is unknown or the parameters do not fit it
+        """
+        kind, _, params = spec.strip().partition(':')
+        if not params:
+            kind, params = "fixed", kind
+        values = tuple(float(value) for value in params.split(',') if value.strip())
+        expected = {'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2, 'exponential': 1}
+        if expected.get(kind) != len(values):
+            raise ValueError(f"Latency spec '{spec}' must be one of: {', '.join(expected)} with its parameters")
+        return cls(kind=kind, params=values)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'normal':
+            return max(0.0, rng.gauss(*self.params))
+        if self.kind == 'lognormal':
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        if self.kind == 'exponential':
+            return rng.expovariate(1 / self.params[0]) if self.params[0] > 0 else 0.0
+        return self.params[0]
+
+
+def _bounds(field: Any, default: Tuple[float, float]) -> Tuple[float, float]:
+    """Numeric bounds from a field's ge/gt/le/lt constraints."""
+    low, high = default
+    for constraint in getattr(field, 'metadata', ()):
+        if isinstance(constraint, (Ge, Gt)):
+            low = float(getattr(constraint, 'ge', getattr(constraint, 'gt', low)))
+        if isinstance(constraint, (Le, Lt)):
+            high = float(getattr(constraint, 'le', getattr(constraint, 'lt', high)))
+    return low, high
+
+
+def _sample_value(name: str, annotation: Any, field: Any, rng: random.Random,
+                  context: Dict[str, str]) -> Any:
+    """Generate a value for one field from its type annotation."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    label = name.replace('_', ' ')
+
+    if origin is typing.Union:
+        inner = [arg for arg in args if arg is not type(None)]
+        return _sample_value(name, inner[0], field, rng, context) if len(inner) == 1 else None
+    if annotation is float:
+        # Realistic scores sit in the upper part of the allowed range
+        low, high = _bounds(field, (0.0, 100.0))
+        return round(rng.uniform(low + (high - low) * 0.5, high), 1)
+    if annotation is int:
+        low, high = _bounds(field, (0, 10))
+        return rng.randint(int(low), int(high))
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is str:
+        if name in ORDINAL_SCALES:
+            return rng.choice(ORDINAL_SCALES[name][:3])
+        if name in context:
+            return context[name]
+        return f"Simulated {label} for grade {context.get('grade_level', '?')}."
+    if origin is list:
+        item_type = args[0] if args else str
+        count = rng.randint(1, 3)
+        if item_type is str:
+            return [f"Simulated {label} {i + 1}" for i in range(count)]
+        return [_sample_value(name, item_type, None, rng, context) for _ in range(count)]
+    if origin is dict:
+        value_type = args[1] if len(args) == 2 else str
+        keys = _PRACTICE_KEYS if name.startswith('practice') else [f"{name}_{i + 1}" for i in range(2)]
+        return {key: _sample_value(key, value_type, field, rng, context) for key in keys}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return sample_output(annotation, rng, context)
+    return None
+
+
+def sample_output(model: Type[BaseModel], rng: Optional[random.Random] = None,
+                  context: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Generate JSON data that validates against an output model.
+
+    Required fields and list/dict/text fields are filled; timestamps and
+    optional nested reports are left to their defaults.
+
+    Args:
+        model: Output model class (e.g., GradeLevelCheckOutput)
+        rng: Random source (default: a fresh unseeded one)
+        context: Values for same-named string fields (e.g., grade_level, curriculum_title)
+
+    Returns:
+        Dict[str, Any]: Data for ``model.model_validate``
+    """
+    rng = rng or random.Random()
+    context = context or {}
+    data = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        inner = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if annotation is datetime or name == 'review_metadata':
+            continue
+        if not field.is_required() and typing.get_origin(annotation) is typing.Union \
+                and inner and isinstance(inner[0], type) and issubclass(inner[0], BaseModel):
+            continue
+        data[name] = _sample_value(name, annotation, field, rng, context)
+    return data
+
+
+class FakeLLM(BaseLLM):
+    """
+    Offline LLM returning schema-valid final answers with simulated latency.
+
+    Example:
+        >>> llm = FakeLLM(latency=LatencyDistribution.parse("lognormal:1.0,0.5"), seed=7)
+        >>> result = run_concurrent_review(curriculum_text, "3", llm=llm, checkpoint=False)
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    llm_type: str = "fake"
+    model: str = "fake-llm"
+    latency: LatencyDistribution = Field(default_factory=LatencyDistribution)
+    seed: Optional[int] = None
+    canned: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Output model name -> field values to use instead of generated ones; "
+                    "string values may use {grade_level} and {curriculum_title}"
+    )
+    calls: int = 0
+
+    _rng: random.Random = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _default_model_name(cls, data: Any) -> Any:
+        """BaseLLM requires a model name; the fake has a fixed default."""
+        if isinstance(data, dict):
+            data.setdefault("model", "fake-llm")
+        return data
+
+    @classmethod
+    def from_config(cls) -> "FakeLLM":
+        """Create a fake LLM with latency and seed from ``FAKE_LLM_LATENCY`` and ``FAKE_LLM_SEED``."""
+        return cls(latency=LatencyDistribution.parse(Config.FAKE_LLM_LATENCY), seed=Config.FAKE_LLM_SEED)
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._rng = random.Random(self.seed)
+
+    def call(
+        self,
+        messages: Any,
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+        response_model: Optional[Any] = None,
+    ) -> str:
+        """
+        Answer with generated output for the task's output model, after a simulated delay.
+        """
+        prompt = messages if isinstance(messages, str) else "\n".join(
+            str(message.get('content', '')) for message in messages
+        )
+        output_model = response_model or getattr(from_task, 'output_pydantic', None) \
+            or getattr(from_task, 'output_json', None)
+
+        rng = self._call_rng(output_model, prompt)
+        with self._lock:
+            self.calls += 1
+        delay = self.latency.sample(rng)
+
+        if output_model is not None:
+            body = json.dumps(self.respond(output_model, prompt, rng))
+        else:
+            body = "Simulated analysis of the provided material."
+        response = body if response_model is not None else (
+            f"Thought: I now know the final answer\nFinal Answer: {body}"
+        )
+
+        time.sleep(delay)
+        prompt_tokens = count_tokens(prompt)
+        completion_tokens = count_tokens(response)
+        self._track_token_usage_internal({
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+        })
+        return response
+
+    def _call_rng(self, output_model: Optional[Type[BaseModel]], prompt: str) -> random.Random:
+        """Random source for one call, derived from the seed, output model and prompt."""
+        if self.seed is None:
+            with self._lock:
+                return random.Random(self._rng.random())
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        model_name = output_model.__name__ if output_model is not None else ""
+        return random.Random(f"{self.seed}:{model_name}:{digest}")
+
+    def respond(self, output_model: Type[BaseModel], prompt: str, rng: random.Random) -> Dict[str, Any]:
+        """
+        Build the answer for an output model: generated values overlaid with canned ones.
+
+        Args:
+            output_model: Model the task expects
+            prompt: Full prompt text, used to fill grade level and title
+            rng: Random source
+
+        Returns:
+            Dict[str, Any]: Data valid for ``output_model``
+        """
+        context = {}
+        grade = _GRADE_PATTERN.search(prompt)
+        if grade:
+            context['grade_level'] = grade.group(1)
+        title = _TITLE_PATTERN.search(prompt)
+        if title:
+            context['curriculum_title'] = title.group(1)
+
+        data = sample_output(output_model, rng, context)
+        for name, value in self.canned.get(output_model.__name__, {}).items():
+            data[name] = value.format_map(_Defaults(context)) if isinstance(value, str) else value
+        return data
+
+    def supports_function_calling(self) -> bool:
+        """Use the text tool protocol; the fake never calls tools."""
+        return False
+
+
+class _Defaults(dict):
+    """Mapping for str.format_map that leaves unknown placeholders as they are."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
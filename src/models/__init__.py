@@ -11,6 +11,36 @@ from .outputs import (
     FinalReviewReport,
     TaskInput,
 )
+from .curriculum import (
+    PracticeProblem,
+    CurriculumSection,
+    CurriculumLesson,
+    CurriculumUnit,
+    CurriculumDocument,
+    CurriculumChunk,
+)
+from .alignment import (
+    StandardCandidate,
+    SegmentAlignment,
+    CandidateCoverageMap,
+)
+from .profile import (
+    ToolStats,
+    ProfileStats,
+    TaskProfile,
+    CacheStats,
+    RunProfile,
+)
+from .review import (
+    LEAF_TASK_NAMES,
+    LeafReviewResults,
+    ReviewRunResult,
+    ReviewedSegment,
+    SegmentManifest,
+    SegmentDiff,
+    BatchItemResult,
+    BatchSummary,
+)
 
 __all__ = [
     'StandardsAlignmentOutput',
@@ -22,4 +52,26 @@ __all__ = [
     'AssessmentQualityOutput',
     'FinalReviewReport',
     'TaskInput',
+    'PracticeProblem',
+    'CurriculumSection',
+    'CurriculumLesson',
+    'CurriculumUnit',
+    'CurriculumDocument',
+    'CurriculumChunk',
+    'StandardCandidate',
+    'SegmentAlignment',
+    'CandidateCoverageMap',
+    'LEAF_TASK_NAMES',
+    'LeafReviewResults',
+    'ReviewRunResult',
+    'ReviewedSegment',
+    'SegmentManifest',
+    'SegmentDiff',
+    'BatchItemResult',
+    'BatchSummary',
+    'ToolStats',
+    'ProfileStats',
+    'TaskProfile',
+    'CacheStats',
+    'RunProfile',
 ]
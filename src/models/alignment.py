@@ -0,0 +1,68 @@
+"""
+Pydantic models for the deterministic standards alignment pre-pass.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+
+class StandardCandidate(BaseModel):
+    """A standard suggested for a curriculum segment."""
+
+    standard_id: str = Field(..., description="CCSSM standard ID (e.g., '3.NF.A.1')")
+    grade: Optional[str] = Field(None, description="Grade level of the standard")
+    description: str = Field("", description="Standard description")
+    score: float = Field(..., ge=0, le=1, description="TF-IDF cosine similarity (0-1)")
+
+
+class SegmentAlignment(BaseModel):
+    """Candidate standards for one lesson or objective."""
+
+    kind: str = Field(..., description="Segment kind: 'lesson' or 'objective'")
+    location: str = Field(..., description="Where the segment is (e.g., 'Unit 1 > Lesson 2')")
+    text: str = Field(..., description="Lesson title or objective text")
+    candidates: List[StandardCandidate] = Field(default_factory=list)
+
+
+class CandidateCoverageMap(BaseModel):
+    """Deterministic candidate mapping of curriculum segments to standards."""
+
+    grade_level: Optional[str] = Field(None, description="Target grade level, if known")
+    segments: List[SegmentAlignment] = Field(default_factory=list)
+    cited_standards: List[str] = Field(
+        default_factory=list,
+        description="Standard IDs written explicitly in the curriculum text"
+    )
+    coverage: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Standard ID -> locations of lessons matching it"
+    )
+    uncovered_standards: List[str] = Field(
+        default_factory=list,
+        description="Target-grade standards with no candidate lesson and no citation"
+    )
+
+    def to_prompt(self) -> str:
+        """
+        Render the coverage map as compact text for a task description.
+
+        Returns:
+            str: Plain-text candidate map
+        """
+        lines = []
+        for segment in self.segments:
+            if not segment.candidates:
+                continue
+            matches = ", ".join(
+                f"{c.standard_id} ({c.score:.2f})" for c in segment.candidates
+            )
+            label = segment.text if segment.kind == "lesson" else f"Objective: {segment.text}"
+            lines.append(f"- {segment.location} | {label} -> {matches}")
+        if self.cited_standards:
+            lines.append(f"Standards cited in the text: {', '.join(self.cited_standards)}")
+        if self.uncovered_standards:
+            lines.append(
+                f"Grade {self.grade_level} standards with no candidate match: "
+                f"{', '.join(self.uncovered_standards)}"
+            )
+        return "\n".join(lines) if lines else "No candidate alignments found."
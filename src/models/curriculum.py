@@ -0,0 +1,125 @@
+"""
+Pydantic models for segmented curriculum documents.
+A curriculum is parsed into units, lessons, objectives and practice problems
+so tasks can be handed only the slices they need.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Iterator, List, Optional
+
+
+class PracticeProblem(BaseModel):
+    """A single practice problem within a lesson."""
+
+    number: Optional[int] = Field(None, description="Problem number as written in the source")
+    text: str = Field(..., description="Problem statement")
+
+
+class CurriculumSection(BaseModel):
+    """A headed block of text that is not a unit or lesson (e.g., Assessment, Teaching Notes)."""
+
+    title: str = Field(..., description="Section heading text")
+    text: str = Field("", description="Raw section text including the heading")
+    start_line: int = Field(..., description="First line of the section (1-based)")
+    end_line: int = Field(..., description="Last line of the section (1-based)")
+
+
+class CurriculumLesson(BaseModel):
+    """A lesson with its objectives and practice problems."""
+
+    number: Optional[str] = Field(None, description="Lesson number (e.g., '3')")
+    title: str = Field(..., description="Lesson title")
+    objectives: List[str] = Field(default_factory=list, description="Stated learning objectives")
+    practice_problems: List[PracticeProblem] = Field(default_factory=list)
+    text: str = Field("", description="Raw lesson text including the heading")
+    start_line: int = Field(..., description="First line of the lesson (1-based)")
+    end_line: int = Field(..., description="Last line of the lesson (1-based)")
+
+
+class CurriculumUnit(BaseModel):
+    """A unit grouping lessons and other sections."""
+
+    number: Optional[str] = Field(None, description="Unit number (e.g., '2')")
+    title: str = Field(..., description="Unit title")
+    lessons: List[CurriculumLesson] = Field(default_factory=list)
+    sections: List[CurriculumSection] = Field(
+        default_factory=list,
+        description="Non-lesson sections within the unit (e.g., Assessment)"
+    )
+    text: str = Field("", description="Raw unit text including the heading")
+    start_line: int = Field(..., description="First line of the unit (1-based)")
+    end_line: int = Field(..., description="Last line of the unit (1-based)")
+
+
+class CurriculumDocument(BaseModel):
+    """Segmented curriculum document."""
+
+    title: Optional[str] = Field(None, description="Document title, if present")
+    units: List[CurriculumUnit] = Field(default_factory=list)
+    sections: List[CurriculumSection] = Field(
+        default_factory=list,
+        description="Top-level sections outside any unit (e.g., Standards Addressed)"
+    )
+    line_count: int = Field(0, description="Number of lines in the source text")
+
+    def iter_lessons(self) -> Iterator[CurriculumLesson]:
+        """Iterate over all lessons in document order."""
+        for unit in self.units:
+            yield from unit.lessons
+
+    def get_unit(self, number: str) -> Optional[CurriculumUnit]:
+        """Get a unit by number."""
+        for unit in self.units:
+            if unit.number == str(number):
+                return unit
+        return None
+
+    def get_lesson(self, number: str) -> Optional[CurriculumLesson]:
+        """Get a lesson by number."""
+        for lesson in self.iter_lessons():
+            if lesson.number == str(number):
+                return lesson
+        return None
+
+    def get_section(self, title: str) -> Optional[CurriculumSection]:
+        """Get a top-level or unit section by case-insensitive title."""
+        wanted = title.strip().lower()
+        for section in self.sections + [s for unit in self.units for s in unit.sections]:
+            if section.title.lower() == wanted:
+                return section
+        return None
+
+    def all_objectives(self) -> List[str]:
+        """Get every lesson objective in document order."""
+        return [objective for lesson in self.iter_lessons() for objective in lesson.objectives]
+
+    def outline(self) -> str:
+        """
+        Render a compact outline of the document structure.
+
+        Returns:
+            str: One line per unit, lesson and section
+        """
+        lines = [self.title] if self.title else []
+        for unit in self.units:
+            lines.append(f"Unit {unit.number}: {unit.title}" if unit.number else unit.title)
+            for lesson in unit.lessons:
+                label = f"Lesson {lesson.number}: {lesson.title}" if lesson.number else lesson.title
+                lines.append(f"  {label} ({len(lesson.objectives)} objectives, "
+                             f"{len(lesson.practice_problems)} practice problems)")
+            for section in unit.sections:
+                lines.append(f"  [{section.title}]")
+        for section in self.sections:
+            lines.append(f"[{section.title}]")
+        return "\n".join(lines)
+
+
+class CurriculumChunk(BaseModel):
+    """A token-budgeted slice of a curriculum cut at unit/lesson boundaries."""
+
+    index: int = Field(..., description="Position of the chunk (0-based)")
+    label: str = Field(..., description="Units/lessons covered (e.g., 'Unit 1 > Lesson 2 to Unit 2 > Lesson 4')")
+    text: str = Field(..., description="Chunk text")
+    start_line: int = Field(..., description="First line of the chunk (1-based)")
+    end_line: int = Field(..., description="Last line of the chunk (1-based)")
+    token_count: int = Field(..., description="Token count (exact with tiktoken, otherwise estimated)")
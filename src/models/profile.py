@@ -0,0 +1,71 @@
+"""
+Pydantic models for review run profiles.
+"""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Dict, Optional
+
+
+class ToolStats(BaseModel):
+    """Invocations of one tool."""
+
+    calls: int = 0
+    seconds: float = Field(0.0, description="Total seconds spent in the tool")
+
+
+class ProfileStats(BaseModel):
+    """Time, LLM and tool usage of one agent, task or whole run."""
+
+    seconds: float = Field(
+        0.0, description="Wall-clock seconds from the first to the last LLM or tool call of each task run"
+    )
+    llm_calls: int = 0
+    llm_seconds: float = Field(0.0, description="Total seconds spent waiting for LLM responses")
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    tool_calls: int = 0
+    tool_seconds: float = 0.0
+    tools: Dict[str, ToolStats] = Field(default_factory=dict, description="Per-tool invocations")
+
+
+class TaskProfile(ProfileStats):
+    """Usage of one task, summed over its runs (e.g., one per chunk)."""
+
+    agent: Optional[str] = Field(None, description="Role of the agent that ran the task")
+    runs: int = Field(0, description="Task runs that made at least one LLM or tool call")
+
+
+class CacheStats(BaseModel):
+    """
+    Hits and misses of one cache while the run was active.
+
+    Shared caches (LLM responses, extraction, standards snapshots) keep
+    process-wide counters, so these include hits from runs that overlapped
+    this one (e.g., concurrent batch items).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    hit_rate: Optional[float] = Field(None, description="hits / (hits + misses), or None if unused")
+
+
+class RunProfile(BaseModel):
+    """Where the time, tokens and tool calls of one review run went."""
+
+    mode: str = Field(..., description="Review mode (e.g., 'concurrent', 'dag', 'hierarchical')")
+    curriculum_title: Optional[str] = None
+    grade_level: Optional[str] = None
+    started_at: datetime = Field(default_factory=datetime.now)
+    seconds: float = Field(0.0, description="Wall-clock seconds of the whole run")
+    stages: Dict[str, float] = Field(default_factory=dict, description="Wall-clock seconds per stage")
+    totals: ProfileStats = Field(default_factory=ProfileStats)
+    agents: Dict[str, ProfileStats] = Field(default_factory=dict, description="Usage per agent role")
+    tasks: Dict[str, TaskProfile] = Field(default_factory=dict, description="Usage per task name")
+    caches: Dict[str, CacheStats] = Field(
+        default_factory=dict, description="Cache hits and misses during the run window, per cache"
+    )
+    rate_limit_wait_seconds: float = Field(
+        0.0, description="Time LLM calls in the process waited on the rate limit during the run window"
+    )
@@ -0,0 +1,149 @@
+"""
+Pydantic models for results of multi-task review runs.
+"""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+from .profile import RunProfile
+from .outputs import (
+    FinalReviewReport,
+    GradeLevelCheckOutput,
+    MathPracticesOutput,
+    PedagogicalEffectivenessOutput,
+    EquityAccessibilityOutput,
+    AssessmentQualityOutput,
+)
+
+
+class LeafReviewResults(BaseModel):
+    """Combined outputs of the five leaf specialist tasks for one curriculum."""
+    
+    grade_level: str = Field(..., description="Target grade level")
+    grade_level_check: Optional[GradeLevelCheckOutput] = None
+    math_practices: Optional[MathPracticesOutput] = None
+    pedagogical_analysis: Optional[PedagogicalEffectivenessOutput] = None
+    equity_review: Optional[EquityAccessibilityOutput] = None
+    assessment_evaluation: Optional[AssessmentQualityOutput] = None
+    chunks: List[str] = Field(
+        default_factory=list,
+        description="Labels of the curriculum chunks reviewed (one entry when not chunked)"
+    )
+    failures: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Task name -> errors for chunks whose review failed"
+    )
+    timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall-clock seconds per task run, keyed 'task' or 'task[chunk]'"
+    )
+    token_usage: Dict[str, int] = Field(
+        default_factory=dict,
+        description="LLM token counters summed over all task runs"
+    )
+    
+    def completed_tasks(self) -> List[str]:
+        """Get the names of tasks that produced an output."""
+        return [
+            name for name in LEAF_TASK_NAMES
+            if getattr(self, name) is not None
+        ]
+
+
+# Leaf task names in review order; each is a field of LeafReviewResults
+LEAF_TASK_NAMES = (
+    'grade_level_check',
+    'math_practices',
+    'pedagogical_analysis',
+    'equity_review',
+    'assessment_evaluation',
+)
+
+
+class ReviewedSegment(BaseModel):
+    """One lesson-sized segment of a curriculum as it was last reviewed."""
+    
+    label: str = Field(..., description="Unit/lesson the segment covers (e.g., 'Unit 1 > Lesson 2')")
+    digest: str = Field(..., description="SHA-256 digest of the segment text")
+    token_count: int = Field(..., description="Token count of the segment")
+
+
+class SegmentManifest(BaseModel):
+    """The segments of the last successfully reviewed version of a curriculum."""
+    
+    document_id: str = Field(..., description="Name the curriculum's reviews are tracked under")
+    grade_level: str = Field(..., description="Target grade level")
+    reviewed_at: datetime = Field(default_factory=datetime.now)
+    segments: List[ReviewedSegment] = Field(default_factory=list)
+
+
+class SegmentDiff(BaseModel):
+    """Segment labels of a curriculum compared with its last reviewed version."""
+    
+    previous_reviewed_at: Optional[datetime] = Field(
+        None, description="When the previous version was reviewed, or None on the first review"
+    )
+    unchanged: List[str] = Field(default_factory=list, description="Segments whose text is unchanged")
+    edited: List[str] = Field(default_factory=list, description="Segments whose text changed")
+    added: List[str] = Field(default_factory=list, description="Segments not in the previous version")
+    removed: List[str] = Field(default_factory=list, description="Previous segments no longer present")
+    
+    def changed(self) -> List[str]:
+        """Get the labels of segments that need a fresh review."""
+        return self.edited + self.added
+
+
+class ReviewRunResult(BaseModel):
+    """Result of a full review run: specialist outputs plus the synthesized report."""
+    
+    curriculum_title: str = Field(..., description="Title of the curriculum reviewed")
+    grade_level: str = Field(..., description="Target grade level")
+    report: Optional[FinalReviewReport] = Field(
+        None, description="Synthesized report, or None if synthesis failed"
+    )
+    leaf_results: LeafReviewResults
+    timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall-clock seconds per stage (e.g., 'leaf_tasks', 'synthesis', 'total')"
+    )
+    token_usage: Dict[str, int] = Field(
+        default_factory=dict,
+        description="LLM token counters summed over the whole run"
+    )
+    error: Optional[str] = Field(None, description="Synthesis error, if any")
+    profile: Optional[RunProfile] = Field(
+        None, description="Per-agent and per-task time, token and tool usage"
+    )
+    segment_diff: Optional[SegmentDiff] = Field(
+        None, description="Changes since the last reviewed version (incremental reviews only)"
+    )
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of reviewing one curriculum in a batch."""
+    
+    source: str = Field(..., description="Path of the curriculum document")
+    grade_level: Optional[str] = Field(None, description="Target grade level")
+    curriculum_title: Optional[str] = None
+    status: str = Field("pending", description="'pending', 'completed' or 'failed'")
+    attempts: int = Field(0, description="Review attempts made, including retries")
+    report_path: Optional[str] = Field(None, description="Saved FinalReviewReport JSON")
+    profile_path: Optional[str] = Field(None, description="Saved RunProfile JSON")
+    overall_rating: Optional[float] = None
+    seconds: float = Field(0.0, description="Wall-clock seconds across all attempts")
+    token_usage: Dict[str, int] = Field(default_factory=dict)
+    error: Optional[str] = Field(None, description="Last error, if the review failed")
+
+
+class BatchSummary(BaseModel):
+    """Summary index of a batch review, also used as its resumable progress file."""
+    
+    batch_name: str
+    started_at: datetime = Field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = None
+    items: List[BatchItemResult] = Field(default_factory=list)
+    
+    def count(self, status: str) -> int:
+        """Count items with the given status."""
+        return sum(1 for item in self.items if item.status == status)
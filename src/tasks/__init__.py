@@ -1,11 +1,17 @@
 """Task definitions for the curriculum review system."""
 
-from .grade_level_check_task import create_grade_level_check_task
-from .math_practices_task import create_math_practices_task
-from .pedagogical_analysis_task import create_pedagogical_analysis_task
-from .equity_review_task import create_equity_review_task
-from .assessment_evaluation_task import create_assessment_evaluation_task
-from .comprehensive_review_task import create_comprehensive_review_task
+from ..utils.lazy import lazy_package_exports
+
+# Task modules import crewai, so they are loaded on first access
+__getattr__ = lazy_package_exports(__name__, {
+    'create_grade_level_check_task': '.grade_level_check_task',
+    'create_math_practices_task': '.math_practices_task',
+    'create_pedagogical_analysis_task': '.pedagogical_analysis_task',
+    'create_equity_review_task': '.equity_review_task',
+    'create_assessment_evaluation_task': '.assessment_evaluation_task',
+    'create_comprehensive_review_task': '.comprehensive_review_task',
+    'create_synthesis_task': '.synthesis_task',
+})
 
 __all__ = [
     'create_grade_level_check_task',
@@ -14,4 +20,5 @@ __all__ = [
     'create_equity_review_task',
     'create_assessment_evaluation_task',
     'create_comprehensive_review_task',
+    'create_synthesis_task',
 ]
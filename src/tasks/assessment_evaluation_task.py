@@ -8,13 +8,14 @@ from typing import Optional
 
 from ..models import AssessmentQualityOutput
 from ..utils.logger import setup_logger
+from .curriculum_prompt import CurriculumInput, render_curriculum
 
 logger = setup_logger(__name__)
 
 
 def create_assessment_evaluation_task(
     agent,
-    curriculum_content: str,
+    curriculum_content: CurriculumInput,
     grade_level: str,
     context: Optional[list] = None
 ) -> Task:
@@ -23,7 +24,8 @@ def create_assessment_evaluation_task(
     
     Args:
         agent: The Assessment Evaluator agent to assign this task to
-        curriculum_content: The curriculum text to analyze
+        curriculum_content: The curriculum text to analyze, or a registered
+            ``CurriculumContext`` to reference by id instead of inlining
         grade_level: Target grade level (e.g., "3", "K", "8")
         context: Optional list of previous task outputs to use as context
         
@@ -40,12 +42,13 @@ def create_assessment_evaluation_task(
         ... )
     """
     
+    curriculum_section, tools = render_curriculum(agent, curriculum_content)
+    
     description = f"""
 Analyze the provided Grade {grade_level} curriculum content and conduct a comprehensive 
 evaluation of its assessment quality and effectiveness.
 
-CURRICULUM CONTENT TO ANALYZE:
-{curriculum_content}
+{curriculum_section}
 
 TARGET GRADE LEVEL: {grade_level}
 
@@ -198,6 +201,7 @@ The output should be structured according to the AssessmentQualityOutput model w
         description=description,
         expected_output=expected_output,
         agent=agent,
+        tools=tools,
         context=context,
         output_pydantic=AssessmentQualityOutput,
         async_execution=False
@@ -7,13 +7,14 @@ from crewai import Task
 from typing import Optional
 
 from ..utils.logger import setup_logger
+from .curriculum_prompt import CurriculumInput, render_curriculum
 
 logger = setup_logger(__name__)
 
 
 def create_comprehensive_review_task(
     agent,
-    curriculum_content: str,
+    curriculum_content: CurriculumInput,
     grade_level: str,
     context: Optional[list] = None
 ) -> Task:
@@ -25,7 +26,8 @@ def create_comprehensive_review_task(
     
     Args:
         agent: The Curriculum Review Manager agent to assign this task to
-        curriculum_content: The curriculum text to analyze
+        curriculum_content: The curriculum text to analyze, or a registered
+            ``CurriculumContext`` to reference by id instead of inlining
         grade_level: Target grade level (e.g., "3", "K", "8")
         context: Optional list of previous task outputs to use as context
         
@@ -42,11 +44,12 @@ def create_comprehensive_review_task(
         ... )
     """
     
+    curriculum_section, tools = render_curriculum(agent, curriculum_content, "CURRICULUM TO REVIEW")
+    
     description = f"""
 Lead a comprehensive review of this Grade {grade_level} mathematics curriculum.
 
-CURRICULUM TO REVIEW:
-{curriculum_content}
+{curriculum_section}
 
 TARGET GRADE LEVEL: {grade_level}
 
@@ -203,6 +206,7 @@ The report should be:
         description=description,
         expected_output=expected_output,
         agent=agent,
+        tools=tools,
         context=context,
         async_execution=False
     )
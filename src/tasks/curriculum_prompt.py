@@ -0,0 +1,43 @@
+"""
+Shared rendering of the curriculum block in task descriptions.
+"""
+
+from typing import List, Optional, Tuple, Union
+
+from ..utils.curriculum_context import CurriculumContext
+
+CurriculumInput = Union[str, CurriculumContext]
+
+
+def render_curriculum(
+    agent,
+    curriculum_content: CurriculumInput,
+    heading: str = "CURRICULUM CONTENT TO ANALYZE"
+) -> Tuple[str, Optional[List]]:
+    """
+    Render the curriculum block of a task description.
+    
+    Plain text is embedded inline as before. A registered ``CurriculumContext``
+    is referenced by id with its outline, and the task gets the Curriculum
+    Reader tool alongside the agent's own tools so the agent can fetch the
+    sections it needs.
+    
+    Args:
+        agent: Agent the task is assigned to
+        curriculum_content: Curriculum text or registered context
+        heading: Heading line for the block
+        
+    Returns:
+        Tuple[str, Optional[List]]: (description block, task tools or None
+            to use the agent's tools)
+    """
+    if not isinstance(curriculum_content, CurriculumContext):
+        return f"{heading}:\n{curriculum_content}", None
+    
+    from ..tools.curriculum_reader import curriculum_reader_tool
+    
+    # Task tools replace the agent's tools, so keep the agent's as well
+    tools = [tool for tool in (getattr(agent, 'tools', None) or [])
+             if tool.name != curriculum_reader_tool.name]
+    tools.append(curriculum_reader_tool)
+    return f"{heading} (BY REFERENCE):\n{curriculum_content.to_prompt()}", tools
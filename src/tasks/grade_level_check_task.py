@@ -7,25 +7,32 @@ from crewai import Task
 from typing import Optional
 
 from ..models import GradeLevelCheckOutput
+from ..models.alignment import CandidateCoverageMap
 from ..utils.logger import setup_logger
+from .curriculum_prompt import CurriculumInput, render_curriculum
 
 logger = setup_logger(__name__)
 
 
 def create_grade_level_check_task(
     agent,
-    curriculum_content: str,
+    curriculum_content: CurriculumInput,
     grade_level: str,
-    context: Optional[list] = None
+    context: Optional[list] = None,
+    candidate_alignment: Optional[CandidateCoverageMap] = None
 ) -> Task:
     """
     Create a task for checking grade-level appropriateness of curriculum content.
     
     Args:
         agent: The Grade Level Checker agent to assign this task to
-        curriculum_content: The curriculum text to analyze
+        curriculum_content: The curriculum text to analyze, or a registered
+            ``CurriculumContext`` to reference by id instead of inlining
         grade_level: Target grade level (e.g., "3", "K", "8")
         context: Optional list of previous task outputs to use as context
+        candidate_alignment: Optional deterministic pre-pass from
+            ``match_curriculum_to_standards`` to verify instead of
+            discovering alignments from scratch
         
     Returns:
         Task: Configured CrewAI task
@@ -40,15 +47,26 @@ def create_grade_level_check_task(
         ... )
     """
     
+    alignment_section = ""
+    if candidate_alignment is not None:
+        alignment_section = f"""
+CANDIDATE STANDARDS ALIGNMENT (automated keyword pre-pass, scores 0-1):
+{candidate_alignment.to_prompt()}
+
+Treat these as a shortlist to verify, not as conclusions. Confirm or reject
+each candidate and look up only the standards you need to check.
+"""
+
+    curriculum_section, tools = render_curriculum(agent, curriculum_content)
+    
     description = f"""
 Analyze the provided curriculum content and verify that it matches the appropriate 
 grade-level expectations for Grade {grade_level}.
 
-CURRICULUM CONTENT TO ANALYZE:
-{curriculum_content}
+{curriculum_section}
 
 TARGET GRADE LEVEL: {grade_level}
-
+{alignment_section}
 YOUR ANALYSIS MUST INCLUDE:
 
 1. APPROPRIATENESS ASSESSMENT
@@ -108,6 +126,7 @@ The output should be structured according to the GradeLevelCheckOutput model wit
         description=description,
         expected_output=expected_output,
         agent=agent,
+        tools=tools,
         context=context,  # Can use outputs from previous tasks
         output_pydantic=GradeLevelCheckOutput,  # Structured output
         async_execution=False  # Execute synchronously for now
@@ -8,13 +8,14 @@ from typing import Optional
 
 from ..models import MathPracticesOutput
 from ..utils.logger import setup_logger
+from .curriculum_prompt import CurriculumInput, render_curriculum
 
 logger = setup_logger(__name__)
 
 
 def create_math_practices_task(
     agent,
-    curriculum_content: str,
+    curriculum_content: CurriculumInput,
     grade_level: str,
     context: Optional[list] = None
 ) -> Task:
@@ -23,7 +24,8 @@ def create_math_practices_task(
     
     Args:
         agent: The Mathematical Practices Evaluator agent to assign this task to
-        curriculum_content: The curriculum text to analyze
+        curriculum_content: The curriculum text to analyze, or a registered
+            ``CurriculumContext`` to reference by id instead of inlining
         grade_level: Target grade level (e.g., "3", "K", "8")
         context: Optional list of previous task outputs to use as context
         
@@ -40,12 +42,13 @@ def create_math_practices_task(
         ... )
     """
     
+    curriculum_section, tools = render_curriculum(agent, curriculum_content)
+    
     description = f"""
 Analyze the provided Grade {grade_level} curriculum content and evaluate how well it 
 develops the 8 Standards for Mathematical Practice (MP1-MP8).
 
-CURRICULUM CONTENT TO ANALYZE:
-{curriculum_content}
+{curriculum_section}
 
 TARGET GRADE LEVEL: {grade_level}
 
@@ -149,6 +152,7 @@ The output should be structured according to the MathPracticesOutput model with:
         description=description,
         expected_output=expected_output,
         agent=agent,
+        tools=tools,
         context=context,
         output_pydantic=MathPracticesOutput,
         async_execution=False  # Execute synchronously
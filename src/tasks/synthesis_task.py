@@ -0,0 +1,116 @@
+"""
+Review Synthesis Task
+Task definition for combining the leaf specialists' findings into a final report.
+"""
+
+from crewai import Task
+from typing import Optional
+
+from ..models import FinalReviewReport, LEAF_TASK_NAMES, LeafReviewResults
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def create_synthesis_task(
+    agent,
+    leaf_results: LeafReviewResults,
+    curriculum_title: str,
+    grade_level: str,
+    context: Optional[list] = None
+) -> Task:
+    """
+    Create a task that synthesizes completed specialist reviews into a final report.
+    
+    Unlike the comprehensive review task, nothing is delegated: the
+    specialists' structured outputs are already available and are given to
+    the agent directly, so a single LLM call produces the report.
+    
+    Args:
+        agent: The Curriculum Review Manager agent to assign this task to
+        leaf_results: Structured outputs of the leaf specialist tasks
+        curriculum_title: Title of the curriculum being reviewed
+        grade_level: Target grade level (e.g., "3", "K", "8")
+        context: Optional list of previous task outputs to use as context
+    
+    Returns:
+        Task: Configured CrewAI task
+    
+    Example:
+        >>> from src.agents import create_curriculum_review_manager_agent
+        >>> agent = create_curriculum_review_manager_agent()
+        >>> task = create_synthesis_task(
+        ...     agent=agent,
+        ...     leaf_results=leaf_results,
+        ...     curriculum_title="Grade 3 Sample",
+        ...     grade_level="3"
+        ... )
+    """
+    
+    findings = leaf_results.model_dump_json(
+        indent=1, exclude={'chunks'}, exclude_none=True
+    )
+    missing = [name for name in LEAF_TASK_NAMES if name not in leaf_results.completed_tasks()]
+    missing_note = (
+        f"\nNOTE: These reviews did not complete and are unavailable: {', '.join(missing)}. "
+        f"Say so in reviewer_notes and base the affected scores on the evidence you have.\n"
+        if missing else ""
+    )
+    
+    description = f"""
+Synthesize the completed specialist reviews of "{curriculum_title}" into a final
+curriculum review report for Grade {grade_level}.
+
+TARGET GRADE LEVEL: {grade_level}
+
+SPECIALIST FINDINGS (structured JSON):
+{findings}
+{missing_note}
+All specialist reviews are complete. Do NOT delegate or repeat their analysis;
+combine and prioritize their findings.
+
+YOUR REPORT MUST INCLUDE:
+
+1. SCORES (0-100)
+   - standards_alignment_score: from the grade-level check and mathematical practices
+   - content_quality_score: from grade-level appropriateness and practice opportunities
+   - pedagogical_score: from the pedagogical analysis
+   - equity_score: from the equity review
+   - assessment_score: from the assessment evaluation
+   - overall_rating: a weighted judgment across all five, not a plain average
+
+2. KEY STRENGTHS AND WEAKNESSES
+   - Top 5 strengths and top 5 areas for improvement, citing which review found them
+
+3. PRIORITIZED RECOMMENDATIONS
+   - critical_recommendations: must be addressed before adoption
+   - important_recommendations: should be addressed soon
+   - suggested_improvements: nice-to-have
+   - Merge duplicate recommendations made by more than one specialist
+
+4. SUMMARIES
+   - executive_summary: 2-3 decision-ready paragraphs
+   - recommendation_summary: the top recommendations in a few sentences
+"""
+
+    expected_output = """
+A final curriculum review report structured according to the FinalReviewReport model with:
+- curriculum_title and grade_level
+- overall_rating and the five category scores (0-100)
+- key_strengths and key_weaknesses
+- critical_recommendations, important_recommendations and suggested_improvements
+- executive_summary and recommendation_summary
+- reviewer_notes for any gaps in the specialist findings
+"""
+
+    task = Task(
+        description=description,
+        expected_output=expected_output,
+        agent=agent,
+        context=context,
+        output_pydantic=FinalReviewReport,
+        async_execution=False
+    )
+    
+    logger.info(f"Created Review Synthesis Task for grade {grade_level}")
+    return task
@@ -1,8 +1,18 @@
 """Custom tools for the curriculum review system."""
 
-from .document_analyzer import DocumentAnalyzerTool, document_analyzer_tool
-from .standards_lookup import StandardsLookupTool, standards_lookup_tool
-from .report_generator import ReportGeneratorTool, report_generator_tool
+from ..utils.lazy import lazy_package_exports
+
+# Tool modules import crewai, so they are loaded on first access
+__getattr__ = lazy_package_exports(__name__, {
+    'DocumentAnalyzerTool': '.document_analyzer',
+    'document_analyzer_tool': '.document_analyzer',
+    'StandardsLookupTool': '.standards_lookup',
+    'standards_lookup_tool': '.standards_lookup',
+    'ReportGeneratorTool': '.report_generator',
+    'report_generator_tool': '.report_generator',
+    'CurriculumReaderTool': '.curriculum_reader',
+    'curriculum_reader_tool': '.curriculum_reader',
+})
 
 __all__ = [
     'DocumentAnalyzerTool',
@@ -11,4 +21,6 @@ __all__ = [
     'standards_lookup_tool',
     'ReportGeneratorTool',
     'report_generator_tool',
+    'CurriculumReaderTool',
+    'curriculum_reader_tool',
 ]
@@ -0,0 +1,83 @@
+"""
+Curriculum Reader Tool for reading sections of a registered curriculum.
+"""
+
+from crewai.tools import BaseTool
+from pydantic import Field
+import json
+
+from ..utils.config import Config
+from ..utils.curriculum_context import CurriculumRegistry, curriculum_registry
+from ..utils.logger import setup_logger
+from ..utils.serialization import dumps
+
+logger = setup_logger(__name__)
+
+
+class CurriculumReaderTool(BaseTool):
+    """
+    Tool for reading the curriculum a task refers to by id.
+    Returns only the requested unit, lesson, section or line range.
+    """
+
+    name: str = "Curriculum Reader"
+    description: str = (
+        "Reads the curriculum under review, referenced by its id (e.g., 'cur-3f2a9c1e7b4d5a60'). "
+        "Input is '<id>' for the outline, or '<id>|<part>' where <part> is one of: "
+        "'lesson 2', 'unit 1', 'objectives', 'lines 1-80', a section title such as "
+        "'Assessment', or 'full' for the entire text. Read only the parts you need."
+    )
+
+    registry: CurriculumRegistry = Field(default=curriculum_registry)
+    compact_output: bool = Field(default_factory=lambda: Config.COMPACT_TOOL_OUTPUT)
+
+    def _run(self, query: str) -> str:
+        """
+        Read part of a registered curriculum.
+
+        Args:
+            query: '<id>' or '<id>|<part>'
+
+        Returns:
+            str: JSON string with the requested text
+        """
+        try:
+            context_id, _, selector = query.strip().partition('|')
+            context = self.registry.get(context_id)
+
+            if context is None:
+                return dumps({
+                    "success": False,
+                    "query": query,
+                    "error": f"Unknown curriculum id: {context_id.strip()}"
+                }, self.compact_output)
+
+            selector = selector.strip() or 'outline'
+            content = context.read(selector)
+            if content is None:
+                return dumps({
+                    "success": False,
+                    "query": query,
+                    "error": f"No part of the curriculum matches '{selector}'",
+                    "outline": context.outline()
+                }, self.compact_output)
+
+            logger.info(f"Read '{selector}' from {context.context_id} ({len(content)} characters)")
+            return dumps({
+                "success": True,
+                "curriculum_id": context.context_id,
+                "part": selector,
+                "content": content
+            }, self.compact_output)
+
+        except Exception as e:
+            logger.error(f"Error reading curriculum: {e}")
+            return json.dumps({
+                "success": False,
+                "query": query,
+                "error": str(e)
+            })
+
+
+# Create tool instance for easy import
+curriculum_reader_tool = CurriculumReaderTool()
@@ -3,16 +3,82 @@ Document Analysis Tool for curriculum materials.
 Parses and extracts content from various document formats.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, Iterator, Tuple
 from pathlib import Path
 from crewai.tools import BaseTool
 from pydantic import Field
 import json
 
+from ..models.curriculum import CurriculumDocument
+from ..utils.config import Config
+from ..utils.content_store import HANDLE_PREFIX, content_store
+from ..utils.extraction_cache import ExtractionCache, get_extraction_cache
+from ..utils.pdf_extraction import PageRange, extract_pdf_document, iter_pdf_pages
+from ..utils.segmentation import segment_curriculum
 from ..utils.logger import setup_logger
+from ..utils.serialization import dumps
 
 logger = setup_logger(__name__)
 
+# Bump when extraction output changes so cached entries are invalidated
+EXTRACTOR_VERSION = "2"
+
+
+class ExtractionError(ValueError):
+    """Raised when a document's text cannot be extracted."""
+
+
+def parse_page_range(spec: str) -> PageRange:
+    """
+    Parse a page range specification.
+    
+    Args:
+        spec: Range such as "40-60", "40" or "40-"
+        
+    Returns:
+        PageRange: (first_page, last_page) with last_page None for open ranges
+        
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    first, sep, last = spec.strip().partition('-')
+    first_page = int(first)
+    if not sep:
+        last_page = first_page
+    else:
+        last_page = int(last) if last.strip() else None
+    
+    if first_page < 1 or (last_page is not None and last_page < first_page):
+        raise ValueError(f"Invalid page range: {spec}")
+    return first_page, last_page
+
+
+# Fragment options accepted after '#' in a tool query
+_QUERY_OPTIONS = ('pages', 'segments')
+
+
+def split_document_query(query: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Split a tool query such as 'path#pages=40-60&segments' into path and options.
+    
+    Args:
+        query: File path, optionally followed by '#<option>[&<option>...]'
+        
+    Returns:
+        Tuple[str, Dict[str, str]]: File path and fragment options
+    """
+    path, sep, fragment = query.rpartition('#')
+    if not sep or Path(query).exists():
+        return query, {}
+    
+    options = {}
+    for token in fragment.split('&'):
+        key, _, value = token.partition('=')
+        if key.strip() not in _QUERY_OPTIONS:
+            return query, {}
+        options[key.strip()] = value.strip()
+    return path, options
+
 
 class DocumentAnalyzerTool(BaseTool):
     """
@@ -25,20 +91,48 @@ class DocumentAnalyzerTool(BaseTool):
         "Analyzes curriculum documents and extracts content, structure, and metadata. "
         "Supports PDF, DOCX, TXT, HTML, and Markdown files. "
         "Use this tool when you need to read and analyze curriculum materials. "
-        "Input should be a file path."
+        "Input should be a file path. For long PDFs, append '#pages=40-60' "
+        "to read only that page range. Append '#segments' to get the document "
+        "split into units, lessons, objectives and practice problems. "
+        "If a result contains a 'content_handle' instead of 'content', pass the "
+        "handle (e.g., 'doc-3f2a9c1e7b4d5a60') as input to read the full text."
     )
     
+    extraction_cache: Optional[ExtractionCache] = Field(default_factory=get_extraction_cache)
+    pdf_workers: int = Field(default_factory=lambda: Config.PDF_EXTRACTION_WORKERS)
+    pdf_parallel_min_pages: int = Field(default_factory=lambda: Config.PDF_PARALLEL_MIN_PAGES)
+    compact_output: bool = Field(default_factory=lambda: Config.COMPACT_TOOL_OUTPUT)
+    content_by_reference: bool = Field(default_factory=lambda: Config.CONTENT_BY_REFERENCE)
+    
+    _EXTRACTORS: ClassVar[Dict[str, str]] = {
+        '.txt': '_extract_text',
+        '.md': '_extract_markdown',
+        '.pdf': '_extract_pdf',
+        '.docx': '_extract_docx',
+        '.doc': '_extract_docx',
+        '.html': '_extract_html',
+        '.htm': '_extract_html',
+    }
+    
     def _run(self, file_path: str) -> str:
         """
         Analyze a document and extract its content.
         
         Args:
-            file_path: Path to the document file
+            file_path: Path to the document file, optionally followed by
+                '#pages=<first>-<last>' (PDFs only) and/or '#segments'.
+                A content handle from an earlier result may be given instead.
             
         Returns:
             str: JSON string with extracted content and metadata
         """
         try:
+            file_path, options = split_document_query(file_path)
+            pages = parse_page_range(options['pages']) if 'pages' in options else None
+            
+            if file_path.strip().startswith(HANDLE_PREFIX) and not Path(file_path).exists():
+                return self._resolve_handle(file_path.strip(), options)
+            
             path = Path(file_path)
             
             if not path.exists():
@@ -50,22 +144,21 @@ class DocumentAnalyzerTool(BaseTool):
             # Determine file type and extract content
             extension = path.suffix.lower()
             
-            if extension == '.txt':
-                content = self._extract_text(path)
-            elif extension == '.md':
-                content = self._extract_markdown(path)
-            elif extension == '.pdf':
-                content = self._extract_pdf(path)
-            elif extension in ['.docx', '.doc']:
-                content = self._extract_docx(path)
-            elif extension in ['.html', '.htm']:
-                content = self._extract_html(path)
-            else:
+            if extension not in self._EXTRACTORS:
                 return json.dumps({
                     "error": f"Unsupported file type: {extension}",
                     "success": False
                 })
             
+            if pages is not None and extension != '.pdf':
+                return json.dumps({
+                    "error": "Page ranges are only supported for PDF files",
+                    "success": False
+                })
+            
+            entry = self._extract_entry(path, extension, pages)
+            content = entry["content"]
+            
             result = {
                 "success": True,
                 "file_path": str(path),
@@ -74,13 +167,16 @@ class DocumentAnalyzerTool(BaseTool):
                 "content": content,
                 "length": len(content),
                 "metadata": {
-                    "size_bytes": path.stat().st_size,
+                    **entry["metadata"],
                     "extension": extension
                 }
             }
+            if pages is not None:
+                result["metadata"]["pages"] = self._format_page_range(pages)
+            self._shape_content(result, options)
             
             logger.info(f"Successfully analyzed document: {path.name}")
-            return json.dumps(result, indent=2)
+            return dumps(result, self.compact_output)
             
         except Exception as e:
             logger.error(f"Error analyzing document: {e}")
@@ -89,6 +185,171 @@ class DocumentAnalyzerTool(BaseTool):
                 "success": False
             })
     
+    def _resolve_handle(self, handle: str, options: Dict[str, str]) -> str:
+        """
+        Return the content registered under a handle.
+        
+        Args:
+            handle: Content handle from an earlier result
+            options: Query fragment options
+            
+        Returns:
+            str: JSON string with the referenced content
+        """
+        content = content_store.get(handle)
+        if content is None:
+            return json.dumps({
+                "error": f"Unknown or expired content handle: {handle}",
+                "success": False
+            })
+        
+        result = {
+            "success": True,
+            "content_handle": handle,
+            "content": content,
+            "length": len(content)
+        }
+        if 'segments' in options:
+            self._shape_content(result, options)
+        
+        logger.info(f"Resolved content handle: {handle}")
+        return dumps(result, self.compact_output)
+    
+    def _shape_content(self, result: Dict[str, Any], options: Dict[str, str]) -> None:
+        """
+        Replace the inline content with a segment tree or a handle when requested.
+        
+        Args:
+            result: Tool result holding a 'content' entry, modified in place
+            options: Query fragment options
+        """
+        if 'segments' in options:
+            # The segment tree carries the lesson text, so drop the flat copy
+            document = segment_curriculum(result.pop("content"))
+            result["outline"] = document.outline()
+            result["segments"] = document.model_dump()
+        elif self.content_by_reference and "content_handle" not in result:
+            content = result.pop("content")
+            result["content_handle"] = content_store.put(content)
+            result["preview"] = content[:Config.CONTENT_PREVIEW_CHARS]
+    
+    def iter_content(self, file_path: str, pages: Optional[PageRange] = None) -> Iterator[str]:
+        """
+        Yield document content incrementally.
+        
+        PDFs are yielded one page at a time and each page's parsed layout is
+        released before the next is read, so memory use stays flat regardless
+        of document length. Other formats are yielded as a single chunk.
+        
+        The tool itself returns the whole text in one result, so there only a
+        '#pages=' range bounds memory; use this for callers that can process
+        the document piece by piece.
+        
+        Args:
+            file_path: Path to the document file
+            pages: Optional (first_page, last_page) range for PDFs
+            
+        Yields:
+            str: Content chunks in document order
+            
+        Raises:
+            ValueError: If the file type is unsupported, or a page range is given for a non-PDF file
+        """
+        path = Path(file_path)
+        extension = path.suffix.lower()
+        
+        if extension not in self._EXTRACTORS:
+            raise ValueError(f"Unsupported file type: {extension}")
+        if pages is not None and extension != '.pdf':
+            raise ValueError("Page ranges are only supported for PDF files")
+        
+        if extension == '.pdf':
+            yield from iter_pdf_pages(path, pages)
+        else:
+            yield getattr(self, self._EXTRACTORS[extension])(path)
+    
+    def segment(self, file_path: str, pages: Optional[PageRange] = None) -> CurriculumDocument:
+        """
+        Extract a document and segment it into units, lessons and objectives.
+        
+        Args:
+            file_path: Path to the document file
+            pages: Optional page range for PDFs
+            
+        Returns:
+            CurriculumDocument: Typed document tree
+        """
+        path = Path(file_path)
+        return segment_curriculum(self._extract_cached(path, path.suffix.lower(), pages))
+    
+    def _extract_cached(self, path: Path, extension: str, pages: Optional[PageRange] = None) -> str:
+        """
+        Extract content, reusing a cached extraction of identical file contents.
+        
+        Args:
+            path: Path to the document file
+            extension: Lowercase file extension
+            pages: Optional page range for PDFs
+            
+        Returns:
+            str: Extracted text content
+            
+        Raises:
+            ExtractionError: If the document cannot be extracted
+        """
+        return self._extract_entry(path, extension, pages)["content"]
+    
+    def _extract_entry(self, path: Path, extension: str,
+                       pages: Optional[PageRange] = None) -> Dict[str, Any]:
+        """
+        Extract content and metadata, reusing a cached extraction of identical file contents.
+        
+        Failed extractions raise and are never cached.
+        
+        Args:
+            path: Path to the document file
+            extension: Lowercase file extension
+            pages: Optional page range for PDFs
+            
+        Returns:
+            Dict[str, Any]: 'content' and 'metadata' (size_bytes, plus page_count for PDFs)
+            
+        Raises:
+            ExtractionError: If the document cannot be extracted
+        """
+        cache = self.extraction_cache
+        if cache is None:
+            return self._extract(path, extension, pages)
+        
+        variant = f"v{EXTRACTOR_VERSION}:{extension}"
+        if pages is not None:
+            variant += f":pages={self._format_page_range(pages)}"
+        
+        key = cache.make_key(path, variant)
+        entry = cache.get(key)
+        if entry is not None:
+            logger.debug(f"Extraction cache hit for {path.name}")
+            return entry
+        
+        entry = self._extract(path, extension, pages)
+        cache.put(key, entry)
+        return entry
+    
+    def _extract(self, path: Path, extension: str, pages: Optional[PageRange] = None) -> Dict[str, Any]:
+        """Dispatch to the extractor for a file extension and collect metadata."""
+        metadata: Dict[str, Any] = {"size_bytes": path.stat().st_size}
+        if extension == '.pdf':
+            content, metadata["page_count"] = self._extract_pdf(path, pages)
+        else:
+            content = getattr(self, self._EXTRACTORS[extension])(path)
+        return {"content": content, "metadata": metadata}
+    
+    @staticmethod
+    def _format_page_range(pages: PageRange) -> str:
+        """Format a page range as '<first>-<last>'."""
+        first_page, last_page = pages
+        return f"{first_page}-{last_page if last_page is not None else ''}"
+    
     def _extract_text(self, path: Path) -> str:
         """Extract content from plain text file."""
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -99,24 +360,22 @@ class DocumentAnalyzerTool(BaseTool):
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
             return f.read()
     
-    def _extract_pdf(self, path: Path) -> str:
-        """Extract text from PDF file."""
+    def _extract_pdf(self, path: Path, pages: Optional[PageRange] = None) -> Tuple[str, int]:
+        """Extract text and the page count from PDF file, sharding large files across processes."""
         try:
-            import pdfplumber
-            
-            text_content = []
-            with pdfplumber.open(path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(f"--- Page {page_num} ---\n{text}")
+            text_content, page_count = extract_pdf_document(
+                path,
+                pages,
+                workers=self.pdf_workers,
+                min_parallel_pages=self.pdf_parallel_min_pages
+            )
             
-            return "\n\n".join(text_content)
+            return "\n\n".join(text_content), page_count
             
         except ImportError:
-            return "Error: pdfplumber not installed. Install with: pip install pdfplumber"
+            raise ExtractionError("pdfplumber not installed. Install with: pip install pdfplumber")
         except Exception as e:
-            return f"Error extracting PDF: {str(e)}"
+            raise ExtractionError(f"Error extracting PDF: {str(e)}") from e
     
     def _extract_docx(self, path: Path) -> str:
         """Extract text from DOCX file."""
@@ -128,9 +387,9 @@ class DocumentAnalyzerTool(BaseTool):
             return "\n\n".join(paragraphs)
             
         except ImportError:
-            return "Error: python-docx not installed. Install with: pip install python-docx"
+            raise ExtractionError("python-docx not installed. Install with: pip install python-docx")
         except Exception as e:
-            return f"Error extracting DOCX: {str(e)}"
+            raise ExtractionError(f"Error extracting DOCX: {str(e)}") from e
     
     def _extract_html(self, path: Path) -> str:
         """Extract text from HTML file."""
@@ -155,9 +414,9 @@ class DocumentAnalyzerTool(BaseTool):
             return text
             
         except ImportError:
-            return "Error: beautifulsoup4 not installed. Install with: pip install beautifulsoup4"
+            raise ExtractionError("beautifulsoup4 not installed. Install with: pip install beautifulsoup4")
         except Exception as e:
-            return f"Error extracting HTML: {str(e)}"
+            raise ExtractionError(f"Error extracting HTML: {str(e)}") from e
 
 
 # Create tool instance for easy import
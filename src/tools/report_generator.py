@@ -1,34 +1,227 @@
 """
 Report Generation Tool for creating formatted review reports.
+
+Reports are rendered as a stream of text fragments and written to their
+file (or any other sink) as they are produced, so memory use does not
+grow with the size of the report. The content is read as a sequence of
+``ReportSection`` objects, shared by every output format, so several
+formats can be rendered in a single pass over it.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, List, NamedTuple, Tuple, Type, Union
 from pathlib import Path
+from contextlib import ExitStack
 from datetime import datetime
 from crewai.tools import BaseTool
 from pydantic import Field
+import inspect
 import json
+import queue
+import threading
 
 from ..utils.config import Config
 from ..utils.logger import setup_logger
+from ..utils.serialization import dumps
 
 logger = setup_logger(__name__)
 
+# Characters gathered from the renderer before each write to the sink
+WRITE_CHUNK_CHARS = 64 * 1024
+
+# Pieces a format's writer thread may fall behind the renderer by
+WRITE_QUEUE_SIZE = 4
+
+
+class ReportSection(NamedTuple):
+    """One top-level entry of the report content, ready for any renderer."""
+
+    key: str
+    heading: str
+    # 'fields' for a dict, 'items' for a list, 'text' for anything else
+    kind: str
+    # (label, value) pairs for fields, (None, value) for items and text
+    entries: List[Tuple[Optional[str], str]]
+    data: Any
+
+
+def report_sections(content: Dict[str, Any]) -> Iterator[ReportSection]:
+    """
+    Read report content as sections, one at a time.
+
+    Args:
+        content: Report content; each key is a section
+
+    Yields:
+        ReportSection: Sections in content order
+    """
+    for key, data in content.items():
+        heading = key.replace('_', ' ').title()
+        if isinstance(data, dict):
+            entries = [(name.replace('_', ' ').title(), f"{value}") for name, value in data.items()]
+            yield ReportSection(key, heading, 'fields', entries, data)
+        elif isinstance(data, list):
+            yield ReportSection(key, heading, 'items', [(None, f"{item}") for item in data], data)
+        else:
+            yield ReportSection(key, heading, 'text', [(None, str(data))], data)
+
+
+class _Renderer:
+    """Renders a report's header, each section and footer as lines."""
+
+    def header(self, title: str, generated: str) -> Iterator[str]:
+        return iter(())
+
+    def section(self, section: ReportSection) -> Iterator[str]:
+        return iter(())
+
+    def footer(self) -> Iterator[str]:
+        return iter(())
+
+
+class _MarkdownRenderer(_Renderer):
+
+    def header(self, title: str, generated: str) -> Iterator[str]:
+        yield from [f"# {title}", "", f"**Generated:** {generated}", "", "---", ""]
+
+    def section(self, section: ReportSection) -> Iterator[str]:
+        yield f"## {section.heading}"
+        yield ""
+        if section.kind == 'fields':
+            for label, value in section.entries:
+                yield f"**{label}:** {value}"
+                yield ""
+        elif section.kind == 'items':
+            for _, value in section.entries:
+                yield f"- {value}"
+            yield ""
+        else:
+            yield section.entries[0][1]
+            yield ""
+
+
+class _HtmlRenderer(_Renderer):
+
+    def header(self, title: str, generated: str) -> Iterator[str]:
+        yield from [
+            "<!DOCTYPE html>",
+            "<html>",
+            "<head>",
+            f"    <title>{title}</title>",
+            "    <style>",
+            "        body { font-family: Arial, sans-serif; max-width: 800px; margin: 40px auto; padding: 20px; }",
+            "        h1 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }",
+            "        h2 { color: #34495e; margin-top: 30px; }",
+            "        .metadata { color: #7f8c8d; font-style: italic; }",
+            "        .section { margin: 20px 0; }",
+            "        ul { line-height: 1.8; }",
+            "    </style>",
+            "</head>",
+            "<body>",
+            f"    <h1>{title}</h1>",
+            f"    <p class='metadata'>Generated: {generated}</p>",
+            "    <hr>"
+        ]
+
+    def section(self, section: ReportSection) -> Iterator[str]:
+        yield "    <div class='section'>"
+        yield f"        <h2>{section.heading}</h2>"
+        if section.kind == 'fields':
+            yield "        <ul>"
+            for label, value in section.entries:
+                yield f"            <li><strong>{label}:</strong> {value}</li>"
+            yield "        </ul>"
+        elif section.kind == 'items':
+            yield "        <ul>"
+            for _, value in section.entries:
+                yield f"            <li>{value}</li>"
+            yield "        </ul>"
+        else:
+            yield f"        <p>{section.entries[0][1]}</p>"
+        yield "    </div>"
+
+    def footer(self) -> Iterator[str]:
+        yield from ["</body>", "</html>"]
+
+
+class _TextRenderer(_Renderer):
+
+    def header(self, title: str, generated: str) -> Iterator[str]:
+        yield from ["=" * 80, title.center(80), "=" * 80, "", f"Generated: {generated}", "", "-" * 80, ""]
+
+    def section(self, section: ReportSection) -> Iterator[str]:
+        yield section.heading.upper()
+        yield "-" * 40
+        if section.kind == 'fields':
+            for label, value in section.entries:
+                yield f"{label}: {value}"
+        elif section.kind == 'items':
+            for _, value in section.entries:
+                yield f"  • {value}"
+        else:
+            yield section.entries[0][1]
+        yield ""
+
+    def footer(self) -> Iterator[str]:
+        yield "=" * 80
+
+
+class _JsonRenderer(_Renderer):
+    """JSON with one line per section, so it can be written as the sections arrive."""
+
+    def __init__(self):
+        # The previous section's line, written once we know whether a comma follows it
+        self._pending: Optional[str] = None
+
+    def header(self, title: str, generated: str) -> Iterator[str]:
+        yield "{"
+        yield f'  "title": {json.dumps(title, ensure_ascii=False)},'
+        yield f'  "generated": {json.dumps(generated)},'
+        yield '  "content": {'
+
+    def section(self, section: ReportSection) -> Iterator[str]:
+        if self._pending is not None:
+            yield self._pending + ","
+        self._pending = (f"    {json.dumps(section.key, ensure_ascii=False)}: "
+                         f"{json.dumps(section.data, ensure_ascii=False, default=str)}")
+
+    def footer(self) -> Iterator[str]:
+        if self._pending is not None:
+            yield self._pending
+        yield "  }"
+        yield "}"
+
+
+# Renderer per format name, including the accepted aliases
+RENDERERS: Dict[str, Type[_Renderer]] = {
+    'md': _MarkdownRenderer,
+    'markdown': _MarkdownRenderer,
+    'html': _HtmlRenderer,
+    'txt': _TextRenderer,
+    'text': _TextRenderer,
+    'json': _JsonRenderer,
+}
+
+# Canonical format name (and file extension) of each alias
+FORMAT_ALIASES: Dict[str, str] = {'markdown': 'md', 'text': 'txt'}
+
 
 class ReportGeneratorTool(BaseTool):
     """
     Tool for generating formatted curriculum review reports.
-    Creates reports in Markdown, HTML, or plain text format.
+    Creates reports in Markdown, HTML, plain text or JSON format.
     """
     
     name: str = "Report Generator"
     description: str = (
         "Generates formatted curriculum review reports. "
-        "Creates professional reports in Markdown, HTML, or text format. "
-        "Input should be a JSON string with 'title', 'content', 'format' (md/html/txt), "
-        "and optional 'filename'. Example: {\"title\": \"Review Report\", \"content\": {...}, \"format\": \"md\"}"
+        "Creates professional reports in Markdown, HTML, text or JSON format. "
+        "Input should be a JSON string with 'title', 'content', 'format' (md/html/txt/json), "
+        "and optional 'filename'. Example: {\"title\": \"Review Report\", \"content\": {...}, \"format\": \"md\"}. "
+        "Use 'formats' (e.g., [\"md\", \"html\"]) instead of 'format' to write several formats at once."
     )
     
+    compact_output: bool = Field(default_factory=lambda: Config.COMPACT_TOOL_OUTPUT)
+    
     def _run(self, report_data: str) -> str:
         """
         Generate a formatted report.
@@ -44,40 +237,35 @@ class ReportGeneratorTool(BaseTool):
             
             title = data.get('title', 'Curriculum Review Report')
             content = data.get('content', {})
+            if data.get('formats'):
+                return self._run_formats(title, content, data['formats'], data.get('filename'))
             format_type = data.get('format', 'md').lower()
             filename = data.get('filename', self._generate_filename(format_type))
             
-            # Generate report based on format
-            if format_type == 'md' or format_type == 'markdown':
-                report_content = self._generate_markdown(title, content)
-            elif format_type == 'html':
-                report_content = self._generate_html(title, content)
-            elif format_type == 'txt' or format_type == 'text':
-                report_content = self._generate_text(title, content)
-            else:
+            if format_type not in RENDERERS:
                 return json.dumps({
                     "success": False,
-                    "error": f"Unsupported format: {format_type}. Use 'md', 'html', or 'txt'"
+                    "error": f"Unsupported format: {format_type}. Use 'md', 'html', 'txt' or 'json'"
                 })
             
-            # Save report to file
+            # Stream the report straight into its file
             output_path = Config.OUTPUT_DIR / filename
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+                size_bytes = self.render(title, content, format_type, f)
             
             result = {
                 "success": True,
                 "file_path": str(output_path),
                 "filename": filename,
                 "format": format_type,
-                "size_bytes": len(report_content)
+                "size_bytes": size_bytes
             }
             
             logger.info(f"Generated report: {filename}")
-            return json.dumps(result, indent=2)
-            
+            return dumps(result, self.compact_output)
+        
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON input: {e}")
             return json.dumps({
@@ -91,6 +279,152 @@ class ReportGeneratorTool(BaseTool):
                 "error": str(e)
             })
     
+    def _run_formats(self, title: str, content: Dict[str, Any], formats: Union[str, List[str]],
+                     filename: Optional[str]) -> str:
+        """Write the report in every requested format; files share the filename's stem."""
+        if isinstance(formats, str):
+            formats = [formats]
+        # Aliases name the same file, so normalize before dropping duplicates
+        formats = list(dict.fromkeys(
+            FORMAT_ALIASES.get(format_type.lower(), format_type.lower()) for format_type in formats
+        ))
+        unsupported = [format_type for format_type in formats if format_type not in RENDERERS]
+        if unsupported:
+            return json.dumps({
+                "success": False,
+                "error": f"Unsupported format: {', '.join(unsupported)}. Use 'md', 'html', 'txt' or 'json'"
+            })
+        
+        base = Path(filename) if filename else Path(self._generate_filename('md'))
+        output_dir = Config.OUTPUT_DIR / base.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = {format_type: output_dir / f"{base.stem}.{format_type}" for format_type in formats}
+        
+        with ExitStack() as stack:
+            sinks = {
+                format_type: stack.enter_context(open(path, 'w', encoding='utf-8'))
+                for format_type, path in paths.items()
+            }
+            sizes = self.render_many(title, content, sinks)
+        
+        files = [
+            {"format": format_type, "file_path": str(path), "filename": path.name,
+             "size_bytes": sizes[format_type]}
+            for format_type, path in paths.items()
+        ]
+        logger.info(f"Generated report: {', '.join(path.name for path in paths.values())}")
+        return dumps({"success": True, "formats": formats, "files": files}, self.compact_output)
+    
+    def render(self, title: str, content: Dict[str, Any], format_type: str, sink: Any) -> int:
+        """
+        Stream a report to a writable text sink.
+        
+        Args:
+            title: Report title
+            content: Report sections
+            format_type: 'md', 'html', 'txt' or 'json' (or 'markdown', 'text')
+            sink: Any object with ``write(str)``, e.g. a file opened in text mode
+        
+        Returns:
+            int: UTF-8 bytes written
+        
+        Raises:
+            ValueError: If the format is not supported
+        
+        Example:
+            >>> with open("review.md", "w", encoding="utf-8") as f:
+            ...     size = report_generator_tool.render("Grade 3 Review", content, "md", f)
+        """
+        size_bytes = 0
+        for chunk in self._chunks(title, content, format_type):
+            sink.write(chunk)
+            size_bytes += len(chunk.encode('utf-8'))
+        return size_bytes
+    
+    async def render_async(self, title: str, content: Dict[str, Any], format_type: str, sink: Any) -> int:
+        """
+        Stream a report to an asynchronous sink.
+        
+        ``sink.write`` may return an awaitable (e.g., an aiofiles file). A sink
+        with ``drain`` (e.g., asyncio.StreamWriter) is given UTF-8 bytes and
+        drained after every write, so a slow reader applies back-pressure.
+        
+        Args:
+            title: Report title
+            content: Report sections
+            format_type: 'md', 'html', 'txt' or 'json' (or 'markdown', 'text')
+            sink: Writable sink
+        
+        Returns:
+            int: UTF-8 bytes written
+        
+        Raises:
+            ValueError: If the format is not supported
+        """
+        drain = getattr(sink, 'drain', None)
+        size_bytes = 0
+        for chunk in self._chunks(title, content, format_type):
+            encoded = chunk.encode('utf-8')
+            written = sink.write(encoded if drain is not None else chunk)
+            if inspect.isawaitable(written):
+                await written
+            if drain is not None:
+                await drain()
+            size_bytes += len(encoded)
+        return size_bytes
+    
+    def render_many(self, title: str, content: Dict[str, Any], sinks: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Render a report in several formats in a single pass over its content.
+        
+        Each section is read once and handed to every format's renderer.
+        Each format is written to its sink by its own thread, so the sinks
+        are written concurrently while the next sections are rendered.
+        
+        Args:
+            title: Report title
+            content: Report sections
+            sinks: Writable text sink per format (e.g., {"md": md_file, "json": json_file})
+        
+        Returns:
+            Dict[str, int]: UTF-8 bytes written per format
+        
+        Raises:
+            ValueError: If a format is not supported
+        
+        Example:
+            >>> with open("review.md", "w") as md, open("review.html", "w") as html:
+            ...     sizes = report_generator_tool.render_many("Grade 3 Review", content, {"md": md, "html": html})
+        """
+        renderers = {format_type: _renderer_for(format_type) for format_type in sinks}
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        writers = {format_type: _ThreadedWriter(sink) for format_type, sink in sinks.items()}
+        try:
+            for format_type, renderer in renderers.items():
+                writers[format_type].write_lines(renderer.header(title, generated))
+            for section in report_sections(content):
+                for format_type, renderer in renderers.items():
+                    writers[format_type].write_lines(renderer.section(section))
+            for format_type, renderer in renderers.items():
+                writers[format_type].write_lines(renderer.footer())
+        finally:
+            for writer in writers.values():
+                writer.finish()
+            sizes = {format_type: writer.wait() for format_type, writer in writers.items()}
+        return sizes
+    
+    def _chunks(self, title: str, content: Dict[str, Any], format_type: str) -> Iterator[str]:
+        """Rendered report in pieces of about WRITE_CHUNK_CHARS characters."""
+        return _batched(_joined(self._lines(title, content, format_type)), WRITE_CHUNK_CHARS)
+    
+    def _lines(self, title: str, content: Dict[str, Any], format_type: str) -> Iterator[str]:
+        """Yield the lines of a report in one format."""
+        renderer = _renderer_for(format_type)
+        yield from renderer.header(title, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        for section in report_sections(content):
+            yield from renderer.section(section)
+        yield from renderer.footer()
+    
     def _generate_filename(self, format_type: str) -> str:
         """Generate a timestamped filename."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -98,113 +432,98 @@ class ReportGeneratorTool(BaseTool):
     
     def _generate_markdown(self, title: str, content: Dict[str, Any]) -> str:
         """Generate Markdown report."""
-        lines = [
-            f"# {title}",
-            "",
-            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "---",
-            ""
-        ]
-        
-        # Add content sections
-        for section, data in content.items():
-            lines.append(f"## {section.replace('_', ' ').title()}")
-            lines.append("")
-            
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    lines.append(f"**{key.replace('_', ' ').title()}:** {value}")
-                    lines.append("")
-            elif isinstance(data, list):
-                for item in data:
-                    lines.append(f"- {item}")
-                lines.append("")
-            else:
-                lines.append(str(data))
-                lines.append("")
-        
-        return "\n".join(lines)
+        return "".join(_joined(self._lines(title, content, 'md')))
     
     def _generate_html(self, title: str, content: Dict[str, Any]) -> str:
         """Generate HTML report."""
-        lines = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            f"    <title>{title}</title>",
-            "    <style>",
-            "        body { font-family: Arial, sans-serif; max-width: 800px; margin: 40px auto; padding: 20px; }",
-            "        h1 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }",
-            "        h2 { color: #34495e; margin-top: 30px; }",
-            "        .metadata { color: #7f8c8d; font-style: italic; }",
-            "        .section { margin: 20px 0; }",
-            "        ul { line-height: 1.8; }",
-            "    </style>",
-            "</head>",
-            "<body>",
-            f"    <h1>{title}</h1>",
-            f"    <p class='metadata'>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
-            "    <hr>"
-        ]
-        
-        for section, data in content.items():
-            lines.append(f"    <div class='section'>")
-            lines.append(f"        <h2>{section.replace('_', ' ').title()}</h2>")
-            
-            if isinstance(data, dict):
-                lines.append("        <ul>")
-                for key, value in data.items():
-                    lines.append(f"            <li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>")
-                lines.append("        </ul>")
-            elif isinstance(data, list):
-                lines.append("        <ul>")
-                for item in data:
-                    lines.append(f"            <li>{item}</li>")
-                lines.append("        </ul>")
-            else:
-                lines.append(f"        <p>{data}</p>")
-            
-            lines.append("    </div>")
-        
-        lines.extend([
-            "</body>",
-            "</html>"
-        ])
-        
-        return "\n".join(lines)
+        return "".join(_joined(self._lines(title, content, 'html')))
     
     def _generate_text(self, title: str, content: Dict[str, Any]) -> str:
         """Generate plain text report."""
-        lines = [
-            "=" * 80,
-            title.center(80),
-            "=" * 80,
-            "",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "-" * 80,
-            ""
-        ]
-        
-        for section, data in content.items():
-            lines.append(section.replace('_', ' ').title().upper())
-            lines.append("-" * 40)
-            
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    lines.append(f"{key.replace('_', ' ').title()}: {value}")
-            elif isinstance(data, list):
-                for item in data:
-                    lines.append(f"  • {item}")
-            else:
-                lines.append(str(data))
-            
-            lines.append("")
-        
-        lines.append("=" * 80)
-        
-        return "\n".join(lines)
+        return "".join(_joined(self._lines(title, content, 'txt')))
+
+
+def _renderer_for(format_type: str) -> _Renderer:
+    """New renderer for a format."""
+    renderer = RENDERERS.get(format_type.lower())
+    if renderer is None:
+        raise ValueError(f"Unsupported format: {format_type}. Use 'md', 'html', 'txt' or 'json'")
+    return renderer()
+
+
+class _ThreadedWriter:
+    """Writes one format's lines to its sink from a background thread, newline-separated."""
+
+    def __init__(self, sink: Any):
+        self._sink = sink
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._separator = ""
+        self._size_bytes = 0
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self._pending.append(self._separator)
+            self._pending.append(line)
+            self._pending_chars += len(line) + len(self._separator)
+            self._separator = "\n"
+            if self._pending_chars >= WRITE_CHUNK_CHARS:
+                self._flush()
+
+    def finish(self) -> None:
+        """Hand the rest of the lines to the thread; no more may be written."""
+        self._flush()
+        self._queue.put(None)
+
+    def wait(self) -> int:
+        """Wait for the thread to write everything; returns UTF-8 bytes written."""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._size_bytes
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._queue.put("".join(self._pending))
+            self._pending, self._pending_chars = [], 0
+
+    def _drain(self) -> None:
+        while (chunk := self._queue.get()) is not None:
+            # After a failure keep taking chunks, so the renderer never blocks on a full queue
+            if self._error is not None:
+                continue
+            try:
+                self._sink.write(chunk)
+                self._size_bytes += len(chunk.encode('utf-8'))
+            except Exception as e:
+                self._error = e
+
+
+def _joined(lines: Iterable[str]) -> Iterator[str]:
+    """Yield lines separated by newlines, like a streamed ``"\\n".join(lines)``."""
+    separator = ""
+    for line in lines:
+        yield separator
+        yield line
+        separator = "\n"
+
+
+def _batched(fragments: Iterable[str], size: int) -> Iterator[str]:
+    """Gather small fragments into strings of at least ``size`` characters (the last may be shorter)."""
+    pending = []
+    pending_chars = 0
+    for fragment in fragments:
+        pending.append(fragment)
+        pending_chars += len(fragment)
+        if pending_chars >= size:
+            yield "".join(pending)
+            pending, pending_chars = [], 0
+    if pending:
+        yield "".join(pending)
 
 
 # Create tool instance for easy import
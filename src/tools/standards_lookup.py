@@ -7,8 +7,10 @@ from crewai.tools import BaseTool
 from pydantic import Field
 import json
 
-from ..utils.standards_loader import StandardsLoader
+from ..utils.config import Config
+from ..utils.standards_loader import StandardsLoader, get_standards_loader
 from ..utils.logger import setup_logger
+from ..utils.serialization import dumps
 
 logger = setup_logger(__name__)
 
@@ -25,10 +27,13 @@ class StandardsLookupTool(BaseTool):
         "Can retrieve standards by grade level (K-12), domain (e.g., OA, NBT, NF), "
         "or specific standard ID (e.g., 3.OA.A.1). "
         "Also provides access to the 8 Standards for Mathematical Practice. "
-        "Input can be: 'grade:3', 'standard:3.OA.A.1', 'practices', or 'domain:3.OA'"
+        "Input can be: 'grade:3', 'standard:3.OA.A.1', 'practices', or 'domain:3.OA'. "
+        "To find the few standards about a topic, use full-text search: "
+        "'search:fractions on a number line', optionally with '|grade=3' and/or '|k=10'"
     )
     
-    standards_loader: StandardsLoader = Field(default_factory=StandardsLoader)
+    standards_loader: StandardsLoader = Field(default_factory=get_standards_loader)
+    compact_output: bool = Field(default_factory=lambda: Config.COMPACT_TOOL_OUTPUT)
     
     def _run(self, query: str) -> str:
         """
@@ -54,7 +59,7 @@ class StandardsLookupTool(BaseTool):
                     "data": practices
                 }
                 logger.info("Retrieved mathematical practices")
-                return json.dumps(result, indent=2)
+                return dumps(result, self.compact_output)
             
             # Handle grade level query
             if query.startswith('grade:'):
@@ -73,7 +78,7 @@ class StandardsLookupTool(BaseTool):
                     "standards": standards
                 }
                 logger.info(f"Retrieved {len(standards)} standards for grade {grade}")
-                return json.dumps(result, indent=2)
+                return dumps(result, self.compact_output)
             
             # Handle specific standard query
             if query.startswith('standard:'):
@@ -97,7 +102,7 @@ class StandardsLookupTool(BaseTool):
                     }
                     logger.warning(f"Standard not found: {standard_id}")
                 
-                return json.dumps(result, indent=2)
+                return dumps(result, self.compact_output)
             
             # Handle domain query
             if query.startswith('domain:'):
@@ -121,15 +126,22 @@ class StandardsLookupTool(BaseTool):
                         "standards": standards
                     }
                     logger.info(f"Retrieved {len(standards)} standards for domain {grade}.{domain}")
-                    return json.dumps(result, indent=2)
+                    return dumps(result, self.compact_output)
+            
+            # Handle full-text search query
+            if query.startswith('search:'):
+                return self._search(query)
             
             # Unknown query format
             result = {
                 "success": False,
                 "query": query,
-                "error": "Invalid query format. Use: 'grade:3', 'standard:3.OA.A.1', 'practices', or 'domain:3.OA'"
+                "error": (
+                    "Invalid query format. Use: 'grade:3', 'standard:3.OA.A.1', 'practices', "
+                    "'domain:3.OA', or 'search:<text>'"
+                )
             }
-            return json.dumps(result, indent=2)
+            return dumps(result, self.compact_output)
             
         except Exception as e:
             logger.error(f"Error looking up standards: {e}")
@@ -139,6 +151,34 @@ class StandardsLookupTool(BaseTool):
                 "error": str(e)
             })
 
+    
+    def _search(self, query: str) -> str:
+        """
+        Run a full-text search query of the form 'search:<text>[|grade=3][|k=5]'.
+        
+        Args:
+            query: Normalized query string
+            
+        Returns:
+            str: JSON string with the top-ranked standards and practices
+        """
+        text, *option_parts = query.split(':', 1)[1].split('|')
+        options = dict(part.split('=', 1) for part in option_parts if '=' in part)
+        grade = options.get('grade', '').strip().upper() or None
+        top_k = int(options.get('k', Config.STANDARDS_SEARCH_TOP_K))
+        
+        hits = self.standards_loader.search(text.strip(), top_k=top_k, grade=grade)
+        result = {
+            "success": True,
+            "query": query,
+            "type": "search",
+            "grade": grade,
+            "results_count": len(hits),
+            "results": [dict(record, score=score) for record, score in hits]
+        }
+        logger.info(f"Search '{text.strip()}' returned {len(hits)} standards")
+        return dumps(result, self.compact_output)
+
 
 # Create tool instance for easy import
 standards_lookup_tool = StandardsLookupTool()
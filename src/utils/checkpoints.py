@@ -0,0 +1,255 @@
+"""
+Per-task checkpoints for review runs.
+
+Each completed task's pydantic output is saved as JSON in a run directory
+under ``Config.OUTPUT_DIR / "runs"``. The directory is keyed by the
+curriculum's SHA-256 digest and the grade level. Each file name carries the
+task name and task version, and each entry records a digest of the task's
+input. Re-running the same review loads the saved outputs, so only the
+tasks that had not finished call the LLM again. A new task version or a
+changed input misses the checkpoint and is recomputed.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from .config import Config
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def content_digest(content: Any) -> str:
+    """
+    Digest of a task input.
+
+    Args:
+        content: Text, a registered CurriculumContext (its text is hashed),
+            a pydantic model (its JSON is hashed) or any other value (its str)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    if isinstance(content, BaseModel):
+        content = content.model_dump_json()
+    content = getattr(content, 'content', content)
+    return hashlib.sha256(str(content).encode('utf-8')).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Saved task outputs for one curriculum and grade level.
+
+    Example:
+        >>> store = CheckpointStore.for_curriculum(curriculum_text, grade_level="3")
+        >>> store.save("math_practices", "1", output, curriculum_text)
+        >>> store.load("math_practices", "1", MathPracticesOutput, curriculum_text)
+        MathPracticesOutput(...)
+    """
+
+    def __init__(self, run_dir: Path):
+        """
+        Initialize the store.
+
+        Args:
+            run_dir: Directory holding this run's checkpoints
+        """
+        self.run_dir = Path(run_dir)
+        self.hits = 0
+        self.misses = 0
+        # Leaf jobs load checkpoints from several threads
+        self._lock = threading.Lock()
+
+    def _count(self, hit: bool) -> None:
+        """Record a checkpoint hit or miss."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @classmethod
+    def for_curriculum(
+        cls,
+        curriculum_content: str,
+        grade_level: str,
+        root: Optional[Path] = None
+    ) -> "CheckpointStore":
+        """
+        Get the store for a curriculum and grade level.
+
+        Args:
+            curriculum_content: Full curriculum text
+            grade_level: Target grade level
+            root: Parent of all run directories (default: Config.OUTPUT_DIR / "runs")
+
+        Returns:
+            CheckpointStore: Store in ``<root>/<digest[:16]>_grade<grade_level>``
+        """
+        if root is None:
+            root = Config.OUTPUT_DIR / "runs"
+        digest = content_digest(curriculum_content)[:16]
+        return cls(Path(root) / f"{digest}_grade{grade_level}")
+
+    @classmethod
+    def for_document(
+        cls,
+        document_id: str,
+        grade_level: str,
+        root: Optional[Path] = None
+    ) -> "CheckpointStore":
+        """
+        Get the store that follows a curriculum across revisions.
+
+        Unlike ``for_curriculum``, the directory does not depend on the
+        text, so every draft of a curriculum shares it; incremental reviews
+        key each output by the digest of the segment it reviewed instead.
+
+        Args:
+            document_id: Name the curriculum's reviews are tracked under
+            grade_level: Target grade level
+            root: Parent of all document directories (default: Config.OUTPUT_DIR / "incremental")
+
+        Returns:
+            CheckpointStore: Store in ``<root>/<document_id>_grade<grade_level>``
+        """
+        if root is None:
+            root = Config.OUTPUT_DIR / "incremental"
+        name = "".join(char if char.isalnum() or char in "-_." else "_" for char in document_id.strip())
+        return cls(Path(root) / f"{name or 'untitled'}_grade{grade_level}")
+
+    def _path(self, task: str, version: str) -> Path:
+        return self.run_dir / f"{task}.v{version}.json"
+
+    def load(self, task: str, version: str, model: Type[ModelT], task_input: Any = None) -> Optional[ModelT]:
+        """
+        Load a task's saved output.
+
+        Args:
+            task: Task key (e.g., "math_practices" or "math_practices[2]" for a chunk)
+            version: Task version
+            model: Output model class
+            task_input: The task's input; the checkpoint is used only if it was saved for the same input
+
+        Returns:
+            Optional[ModelT]: Saved output, or None if there is no usable checkpoint
+        """
+        path = self._path(task, version)
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+            if task_input is not None and entry.get('input_digest') != content_digest(task_input):
+                raise ValueError("input changed since the checkpoint was saved")
+            output = model.model_validate(entry['output'])
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except (OSError, KeyError, ValueError, ValidationError) as e:
+            logger.warning(f"Ignoring checkpoint {path.name}: {e}")
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+        logger.info(f"Loaded checkpoint for {task} from {self.run_dir.name}")
+        return output
+
+    def save(self, task: str, version: str, output: BaseModel, task_input: Any = None) -> Optional[Path]:
+        """
+        Save a task's output atomically.
+
+        Args:
+            task: Task key
+            version: Task version
+            output: Task output
+            task_input: The task's input, recorded as a digest
+
+        Returns:
+            Optional[Path]: Checkpoint file, or None if it could not be written
+        """
+        path = self._path(task, version)
+        entry = {
+            'task': task,
+            'version': version,
+            'model': type(output).__name__,
+            'saved_at': datetime.now().isoformat(),
+            'input_digest': content_digest(task_input) if task_input is not None else None,
+            'output': output.model_dump(mode='json'),
+        }
+        try:
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.run_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning(f"Could not write checkpoint for {task}: {e}")
+            return None
+        return path
+
+    def discard(self, task_pattern: str) -> int:
+        """
+        Delete the checkpoints whose task key matches a pattern.
+
+        Args:
+            task_pattern: Task key in which '*' matches any characters (e.g., "*@0123abcd");
+                everything else, including the brackets of chunk keys, is literal
+
+        Returns:
+            int: Number of checkpoints removed
+        """
+        pattern = "*".join(glob.escape(part) for part in task_pattern.split("*"))
+        removed = 0
+        for path in self.run_dir.glob(f"{pattern}.v*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """
+        Delete every checkpoint in the run directory.
+
+        Returns:
+            int: Number of checkpoints removed
+        """
+        removed = 0
+        for path in self.run_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+def get_checkpoint_store(
+    curriculum_content: str,
+    grade_level: str,
+    enabled: Optional[bool] = None,
+    fresh: bool = False
+) -> Optional[CheckpointStore]:
+    """
+    Get the checkpoint store for a review run, if checkpointing is enabled.
+
+    Args:
+        curriculum_content: Full curriculum text
+        grade_level: Target grade level
+        enabled: Whether to checkpoint (default: Config.CHECKPOINTS_ENABLED)
+        fresh: Delete existing checkpoints first, so every task runs again
+
+    Returns:
+        Optional[CheckpointStore]: Store, or None if checkpointing is disabled
+    """
+    if enabled is None:
+        enabled = Config.CHECKPOINTS_ENABLED
+    if not enabled:
+        return None
+    store = CheckpointStore.for_curriculum(curriculum_content, grade_level)
+    if fresh:
+        store.clear()
+    return store
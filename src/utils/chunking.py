@@ -0,0 +1,248 @@
+"""
+Token-budgeted chunking of curriculum text.
+
+Long curricula are split at unit, lesson and section boundaries into chunks
+that each fit a token budget, so every chunk can be reviewed independently
+and the results merged afterwards. Lessons larger than the budget are split
+further at paragraph, then line boundaries.
+"""
+
+import math
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from ..models.curriculum import CurriculumChunk, CurriculumDocument
+from .config import Config
+from .logger import setup_logger
+from .segmentation import segment_curriculum
+
+logger = setup_logger(__name__)
+
+# Rough characters-per-token ratio for English text when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Non-lesson blocks shorter than this are joined to the next block by segment_blocks
+MIN_SEGMENT_TOKENS = 64
+
+# (start_line, end_line, label, text)
+_Piece = Tuple[int, int, str, str]
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding once, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # ImportError, or the encoding file could not be fetched
+        logger.debug(f"tiktoken unavailable, estimating tokens from characters: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text.
+
+    Uses tiktoken's ``cl100k_base`` encoding when installed, otherwise
+    estimates one token per ``CHARS_PER_TOKEN`` characters.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int: Token count
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _block_starts(document: CurriculumDocument) -> List[Tuple[int, str]]:
+    """Get (start_line, label) for every unit, lesson and section, in document order."""
+    starts = {1: document.title or "Front matter"}
+    for section in document.sections:
+        starts[section.start_line] = section.title
+    for unit in document.units:
+        unit_label = f"Unit {unit.number}" if unit.number else unit.title
+        starts[unit.start_line] = unit_label
+        for lesson in unit.lessons:
+            lesson_label = f"Lesson {lesson.number}" if lesson.number else lesson.title
+            starts[lesson.start_line] = f"{unit_label} > {lesson_label}"
+        for section in unit.sections:
+            starts[section.start_line] = f"{unit_label} > {section.title}"
+    return sorted(starts.items())
+
+
+def _block_pieces(lines: List[str], starts: List[Tuple[int, str]], max_tokens: int) -> List[_Piece]:
+    """Cut lines into one piece per non-empty block, splitting blocks that exceed the budget."""
+    pieces: List[_Piece] = []
+    for position, (start, label) in enumerate(starts):
+        end = starts[position + 1][0] - 1 if position + 1 < len(starts) else len(lines)
+        block = "\n".join(lines[start - 1:end])
+        if not block.strip():
+            continue
+        if count_tokens(block) <= max_tokens:
+            pieces.append((start, end, label, block))
+        else:
+            pieces.extend(_split_oversized(lines, start, end, label, max_tokens))
+    return pieces
+
+
+def _split_oversized(lines: List[str], start: int, end: int, label: str, max_tokens: int) -> List[_Piece]:
+    """Split a block that exceeds the budget at paragraph, then line, then character boundaries."""
+    pieces: List[_Piece] = []
+    paragraph_start = start
+    for line_num in range(start, end + 1):
+        is_break = not lines[line_num - 1].strip()
+        if is_break or line_num == end:
+            paragraph_end = line_num if not is_break else line_num - 1
+            if paragraph_end >= paragraph_start:
+                pieces.append((paragraph_start, paragraph_end, label,
+                               "\n".join(lines[paragraph_start - 1:paragraph_end])))
+            paragraph_start = line_num + 1
+
+    result: List[_Piece] = []
+    for piece_start, piece_end, _, text in pieces:
+        if count_tokens(text) <= max_tokens:
+            result.append((piece_start, piece_end, label, text))
+            continue
+        for line_num in range(piece_start, piece_end + 1):
+            line = lines[line_num - 1]
+            if count_tokens(line) <= max_tokens:
+                result.append((line_num, line_num, label, line))
+                continue
+            width = max_tokens * CHARS_PER_TOKEN // 2
+            result.extend(
+                (line_num, line_num, label, line[offset:offset + width])
+                for offset in range(0, len(line), width)
+            )
+    return result
+
+
+def chunk_curriculum(
+    text: str,
+    max_tokens: Optional[int] = None,
+    document: Optional[CurriculumDocument] = None
+) -> List[CurriculumChunk]:
+    """
+    Split curriculum text into chunks of at most ``max_tokens`` tokens.
+
+    Consecutive units, lessons and sections are packed together until the
+    next one would exceed the budget, so chunks never cut a lesson unless
+    the lesson alone is larger than the budget.
+
+    Args:
+        text: Curriculum text
+        max_tokens: Token budget per chunk (default: Config.CHUNK_MAX_TOKENS)
+        document: Already segmented document for ``text``, if available
+
+    Returns:
+        List[CurriculumChunk]: Chunks in document order
+    """
+    if max_tokens is None:
+        max_tokens = Config.CHUNK_MAX_TOKENS
+    if max_tokens < 1:
+        raise ValueError(f"max_tokens must be positive, got {max_tokens}")
+
+    lines = text.splitlines()
+    if document is None:
+        document = segment_curriculum(text)
+    pieces = _block_pieces(lines, _block_starts(document), max_tokens)
+
+    chunks: List[CurriculumChunk] = []
+    current: List[_Piece] = []
+    current_tokens = 0
+
+    def flush() -> None:
+        if not current:
+            return
+        first_label, last_label = current[0][2], current[-1][2]
+        chunk_text = "\n".join(piece[3] for piece in current)
+        chunks.append(CurriculumChunk(
+            index=len(chunks),
+            label=first_label if first_label == last_label else f"{first_label} to {last_label}",
+            text=chunk_text,
+            start_line=current[0][0],
+            end_line=current[-1][1],
+            token_count=count_tokens(chunk_text),
+        ))
+
+    for piece in pieces:
+        piece_tokens = count_tokens(piece[3])
+        # +1 allows for the newline joining this piece to the previous one
+        if current and current_tokens + piece_tokens + 1 > max_tokens:
+            flush()
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += piece_tokens + (1 if len(current) > 1 else 0)
+    flush()
+
+    logger.info(f"Split {len(lines)} lines into {len(chunks)} chunks of at most {max_tokens} tokens")
+    return chunks
+
+
+def segment_blocks(
+    text: str,
+    max_tokens: Optional[int] = None,
+    document: Optional[CurriculumDocument] = None,
+    min_tokens: int = MIN_SEGMENT_TOKENS
+) -> List[CurriculumChunk]:
+    """
+    Split curriculum text into one chunk per lesson.
+
+    Unlike ``chunk_curriculum``, blocks are not packed together, so an edit
+    to one lesson changes only that lesson's chunk. Headings and other
+    blocks that are not lessons and are shorter than ``min_tokens`` (e.g.,
+    a unit title and its one-line overview) are joined to the block that
+    follows them. Lessons larger than the budget are still split.
+
+    Args:
+        text: Curriculum text
+        max_tokens: Token budget per chunk (default: Config.CHUNK_MAX_TOKENS)
+        document: Already segmented document for ``text``, if available
+        min_tokens: Smallest non-lesson block that becomes a chunk of its own
+
+    Returns:
+        List[CurriculumChunk]: Chunks in document order, labelled with their lesson
+    """
+    if max_tokens is None:
+        max_tokens = Config.CHUNK_MAX_TOKENS
+    if max_tokens < 1:
+        raise ValueError(f"max_tokens must be positive, got {max_tokens}")
+
+    lines = text.splitlines()
+    if document is None:
+        document = segment_curriculum(text)
+    starts = _block_starts(document)
+    lesson_starts = {lesson.start_line for unit in document.units for lesson in unit.lessons}
+    lesson_labels = {label for start, label in starts if start in lesson_starts}
+
+    # (pieces, label of the block that closed the group)
+    groups: List[Tuple[List[_Piece], str]] = []
+    carried: List[_Piece] = []
+    for piece in _block_pieces(lines, starts, max_tokens):
+        carried.append(piece)
+        if piece[2] in lesson_labels or count_tokens(piece[3]) >= min_tokens:
+            groups.append((carried, piece[2]))
+            carried = []
+    if carried and groups:
+        groups[-1][0].extend(carried)
+    elif carried:
+        groups.append((carried, carried[0][2]))
+
+    segments = []
+    for index, (group, label) in enumerate(groups):
+        # Blank lines before the next block would make a lesson's text depend on what follows it
+        segment_text = "\n".join(piece[3] for piece in group).rstrip()
+        segments.append(CurriculumChunk(
+            index=index,
+            label=label,
+            text=segment_text,
+            start_line=group[0][0],
+            end_line=group[-1][1],
+            token_count=count_tokens(segment_text),
+        ))
+
+    logger.info(f"Split {len(lines)} lines into {len(segments)} lesson segments")
+    return segments
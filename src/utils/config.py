@@ -23,6 +23,7 @@ class Config:
     STANDARDS_DIR = DATA_DIR / "standards"
     INPUT_DIR = DATA_DIR / "input"
     OUTPUT_DIR = DATA_DIR / "output"
+    CACHE_DIR = DATA_DIR / "cache"
     
     # API Configuration
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
@@ -35,6 +36,48 @@ class Config:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     DEBUG_MODE: bool = os.getenv("DEBUG_MODE", "False").lower() == "true"
     
+    # Document Extraction Cache
+    EXTRACTION_CACHE_ENABLED: bool = os.getenv("EXTRACTION_CACHE_ENABLED", "True").lower() == "true"
+    EXTRACTION_CACHE_MAX_MB: int = int(os.getenv("EXTRACTION_CACHE_MAX_MB", "256"))
+    EXTRACTION_CACHE_MAX_ENTRIES: int = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "500"))
+    
+    # LLM Response Cache (opt-in; replays identical prompts from CACHE_DIR)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "False").lower() == "true"
+    LLM_CACHE_TTL_HOURS: float = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+    LLM_CACHE_MAX_MB: int = int(os.getenv("LLM_CACHE_MAX_MB", "256"))
+    
+    # Offline Fake LLM (load testing without network; latency spec e.g. "lognormal:1.5,0.4")
+    FAKE_LLM_ENABLED: bool = os.getenv("FAKE_LLM_ENABLED", "False").lower() == "true"
+    FAKE_LLM_LATENCY: str = os.getenv("FAKE_LLM_LATENCY", "fixed:0")
+    FAKE_LLM_SEED: Optional[int] = int(os.environ["FAKE_LLM_SEED"]) if os.getenv("FAKE_LLM_SEED") else None
+    
+    # PDF Extraction (0 workers = one per CPU core)
+    PDF_EXTRACTION_WORKERS: int = int(os.getenv("PDF_EXTRACTION_WORKERS", "0"))
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "50"))
+    
+    # Standards Loading (binary snapshot cached under CACHE_DIR)
+    STANDARDS_SNAPSHOT_ENABLED: bool = os.getenv("STANDARDS_SNAPSHOT_ENABLED", "True").lower() == "true"
+    STANDARDS_SEARCH_TOP_K: int = int(os.getenv("STANDARDS_SEARCH_TOP_K", "5"))
+    
+    # Tool Output Format
+    COMPACT_TOOL_OUTPUT: bool = os.getenv("COMPACT_TOOL_OUTPUT", "False").lower() == "true"
+    CONTENT_BY_REFERENCE: bool = os.getenv("CONTENT_BY_REFERENCE", "False").lower() == "true"
+    CONTENT_PREVIEW_CHARS: int = int(os.getenv("CONTENT_PREVIEW_CHARS", "500"))
+    
+    # Review Execution
+    CHUNK_MAX_TOKENS: int = int(os.getenv("CHUNK_MAX_TOKENS", "6000"))
+    MAX_CONCURRENT_TASKS: int = int(os.getenv("MAX_CONCURRENT_TASKS", "4"))
+    CHECKPOINTS_ENABLED: bool = os.getenv("CHECKPOINTS_ENABLED", "True").lower() == "true"
+    RUN_PROFILES_ENABLED: bool = os.getenv("RUN_PROFILES_ENABLED", "True").lower() == "true"
+    
+    # Batch Reviews (0 requests per minute = no rate limit)
+    LLM_REQUESTS_PER_MINUTE: float = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+    BATCH_MAX_WORKERS: int = int(os.getenv("BATCH_MAX_WORKERS", "2"))
+    BATCH_MAX_RETRIES: int = int(os.getenv("BATCH_MAX_RETRIES", "2"))
+    
+    # Set once the missing-configuration warning has been shown
+    _warned: bool = False
+    
     @classmethod
     def validate(cls) -> bool:
         """
@@ -53,6 +96,26 @@ class Config:
             )
         return True
     
+    @classmethod
+    def warn_if_invalid(cls) -> bool:
+        """
+        Print a warning once per process if required configuration is missing.
+        
+        Called by code paths that build agents, so commands that never use an
+        LLM do not warn.
+        
+        Returns:
+            bool: True if configuration is valid
+        """
+        try:
+            return cls.validate()
+        except ValueError as e:
+            if not cls._warned:
+                cls._warned = True
+                print(f"Warning: {e}")
+                print("Create a .env file with your API keys. See .env.example for reference.")
+            return False
+    
     @classmethod
     def get_model_name(cls) -> str:
         """
@@ -62,11 +125,3 @@ class Config:
             str: Model name to use
         """
         return cls.OPENAI_MODEL_NAME
-
-
-# Validate configuration on import
-try:
-    Config.validate()
-except ValueError as e:
-    print(f"Warning: {e}")
-    print("Create a .env file with your API keys. See .env.example for reference.")
@@ -0,0 +1,86 @@
+"""
+Process-wide store for large tool payloads passed by reference.
+
+Instead of inlining megabytes of extracted text in every tool observation,
+tools can register the text once and hand the agent a short handle such as
+``doc-3f2a9c1e7b4d5a60`` that resolves back to the full content.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+HANDLE_PREFIX = "doc-"
+
+
+class ContentStore:
+    """
+    Bounded, content-addressed store of text payloads.
+    """
+    
+    def __init__(self, max_entries: int = 128):
+        """
+        Initialize the content store.
+        
+        Args:
+            max_entries: Maximum number of payloads kept; least recently used are dropped
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def put(self, content: str) -> str:
+        """
+        Register content and return its handle.
+        
+        Identical content always maps to the same handle.
+        
+        Args:
+            content: Text to store
+            
+        Returns:
+            str: Handle for the content
+        """
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+        handle = f"{HANDLE_PREFIX}{digest}"
+        
+        with self._lock:
+            self._entries[handle] = content
+            self._entries.move_to_end(handle)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicted content handle {evicted}")
+        return handle
+    
+    def get(self, handle: str) -> Optional[str]:
+        """
+        Resolve a handle to its content.
+        
+        Args:
+            handle: Handle returned by ``put``
+            
+        Returns:
+            Optional[str]: Stored content, or None if unknown or evicted
+        """
+        with self._lock:
+            content = self._entries.get(handle.strip())
+            if content is not None:
+                self._entries.move_to_end(handle.strip())
+            return content
+    
+    def __contains__(self, handle: str) -> bool:
+        with self._lock:
+            return handle.strip() in self._entries
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared store used by the tools
+content_store = ContentStore()
@@ -0,0 +1,265 @@
+"""
+Shared curriculum context for a review run.
+
+A curriculum is registered once and referenced by a short id (e.g.
+``cur-3f2a9c1e7b4d5a60``) in task descriptions. Agents read only the
+sections they need through the Curriculum Reader tool, so prompt size no
+longer grows with the number of tasks times the document length.
+
+Runs register their contexts inside ``registered_curricula()``, which
+releases them when the run ends, so the registry holds only the documents
+of runs in progress.
+"""
+
+import hashlib
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from ..models.curriculum import CurriculumDocument
+from .logger import setup_logger
+from .segmentation import segment_curriculum
+
+logger = setup_logger(__name__)
+
+CONTEXT_PREFIX = "cur-"
+
+_LINES_RE = re.compile(r'^lines?\s+(\d+)\s*-\s*(\d+)$', re.IGNORECASE)
+_NUMBERED_RE = re.compile(r'^(unit|lesson)\s+(\S+)$', re.IGNORECASE)
+
+# Ids registered in the innermost ``registered_curricula()`` block, if any
+_scope: ContextVar[Optional[List[str]]] = ContextVar('curriculum_scope', default=None)
+
+
+class CurriculumContext:
+    """
+    A registered curriculum document with section-level access.
+    """
+
+    def __init__(self, context_id: str, content: str, grade_level: Optional[str] = None,
+                 title: Optional[str] = None):
+        """
+        Initialize the context.
+
+        Args:
+            context_id: Registry id
+            content: Full curriculum text
+            grade_level: Target grade level, if known
+            title: Display title, if known
+        """
+        self.context_id = context_id
+        self.content = content
+        self.grade_level = grade_level
+        self.title = title
+        self._document: Optional[CurriculumDocument] = None
+        self._lock = threading.Lock()
+
+    @property
+    def document(self) -> CurriculumDocument:
+        """Segmented document, built on first access."""
+        if self._document is None:
+            with self._lock:
+                if self._document is None:
+                    self._document = segment_curriculum(self.content)
+        return self._document
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the curriculum text."""
+        return self.document.line_count
+
+    def outline(self) -> str:
+        """
+        Render the document outline, or a line count for unstructured text.
+
+        Returns:
+            str: Outline text
+        """
+        outline = self.document.outline()
+        return outline or f"(no units or lessons detected; {self.line_count} lines of text)"
+
+    def read(self, selector: Optional[str] = None) -> Optional[str]:
+        """
+        Read part of the curriculum.
+
+        Args:
+            selector: One of ``outline`` (default), ``full``, ``objectives``,
+                ``unit <n>``, ``lesson <n>``, ``lines <a>-<b>`` or a section title
+                (e.g. ``Assessment``)
+
+        Returns:
+            Optional[str]: Selected text, or None if nothing matches
+        """
+        selector = (selector or 'outline').strip()
+        lowered = selector.lower()
+
+        if lowered == 'outline':
+            return self.outline()
+        if lowered in ('full', 'all'):
+            return self.content
+        if lowered == 'objectives':
+            objectives = self.document.all_objectives()
+            return "\n".join(f"- {objective}" for objective in objectives) if objectives else None
+
+        lines = _LINES_RE.match(selector)
+        if lines:
+            start, end = int(lines.group(1)), int(lines.group(2))
+            if start < 1 or end < start:
+                return None
+            return "\n".join(self.content.splitlines()[start - 1:end]) or None
+
+        numbered = _NUMBERED_RE.match(selector)
+        if numbered:
+            kind, number = numbered.group(1).lower(), numbered.group(2)
+            segment = (self.document.get_unit(number) if kind == 'unit'
+                       else self.document.get_lesson(number))
+            if segment is not None:
+                return segment.text
+
+        section = self.document.get_section(selector)
+        return section.text if section is not None else None
+
+    def to_prompt(self) -> str:
+        """
+        Render the reference block that replaces inline content in task descriptions.
+
+        Returns:
+            str: Context id, size, outline and reader instructions
+        """
+        return (
+            f"Curriculum id: {self.context_id} ({self.line_count} lines, "
+            f"{len(self.content)} characters)\n"
+            f"Outline:\n{self.outline()}\n\n"
+            f"The full text is NOT included here. Use the Curriculum Reader tool to read it, "
+            f"e.g. '{self.context_id}|lesson 1', '{self.context_id}|unit 2', "
+            f"'{self.context_id}|objectives', '{self.context_id}|lines 1-80' or "
+            f"'{self.context_id}|full'. Read only the sections you need."
+        )
+
+
+class CurriculumRegistry:
+    """
+    Process-wide registry of curriculum contexts keyed by id.
+
+    Contexts are reference-counted: each ``register`` call must be matched
+    by a ``release``, and a context is dropped when its last holder releases
+    it, so concurrent runs over the same text can share one context.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._contexts: Dict[str, CurriculumContext] = {}
+        self._holders: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register(self, content: str, grade_level: Optional[str] = None,
+                 title: Optional[str] = None) -> CurriculumContext:
+        """
+        Register curriculum text, reusing the existing context for identical text.
+
+        Args:
+            content: Full curriculum text
+            grade_level: Target grade level, if known
+            title: Display title, if known
+
+        Returns:
+            CurriculumContext: Registered context
+        """
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+        context_id = f"{CONTEXT_PREFIX}{digest}"
+
+        with self._lock:
+            context = self._contexts.get(context_id)
+            if context is None:
+                context = CurriculumContext(context_id, content, grade_level, title)
+                self._contexts[context_id] = context
+                logger.info(f"Registered curriculum context {context_id} ({len(content)} characters)")
+            self._holders[context_id] = self._holders.get(context_id, 0) + 1
+        return context
+
+    def get(self, context_id: str) -> Optional[CurriculumContext]:
+        """
+        Look up a registered context.
+
+        Args:
+            context_id: Id returned by ``register``
+
+        Returns:
+            Optional[CurriculumContext]: Context, or None if unknown
+        """
+        with self._lock:
+            return self._contexts.get(context_id.strip())
+
+    def release(self, context_id: str) -> None:
+        """
+        Release one hold on a context, dropping it once no run holds it.
+
+        Args:
+            context_id: Id returned by ``register``
+        """
+        context_id = context_id.strip()
+        with self._lock:
+            holders = self._holders.get(context_id, 0) - 1
+            if holders > 0:
+                self._holders[context_id] = holders
+                return
+            self._holders.pop(context_id, None)
+            if self._contexts.pop(context_id, None) is not None:
+                logger.debug(f"Released curriculum context {context_id}")
+
+    def __contains__(self, context_id: str) -> bool:
+        with self._lock:
+            return context_id.strip() in self._contexts
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._contexts)
+
+
+# Shared registry used by the tasks and the Curriculum Reader tool
+curriculum_registry = CurriculumRegistry()
+
+
+def register_curriculum(content: str, grade_level: Optional[str] = None,
+                        title: Optional[str] = None) -> CurriculumContext:
+    """
+    Register curriculum text with the shared registry.
+
+    Inside a ``registered_curricula()`` block the context is released when
+    the block exits; otherwise the caller must release it.
+
+    Args:
+        content: Full curriculum text
+        grade_level: Target grade level, if known
+        title: Display title, if known
+
+    Returns:
+        CurriculumContext: Registered context
+    """
+    context = curriculum_registry.register(content, grade_level, title)
+    scope = _scope.get()
+    if scope is not None:
+        scope.append(context.context_id)
+    return context
+
+
+@contextmanager
+def registered_curricula() -> Iterator[None]:
+    """
+    Release the contexts registered inside the block when it exits.
+
+    Example:
+        >>> with registered_curricula():
+        ...     context = register_curriculum(text, "3")
+        ...     crew.kickoff()
+    """
+    scope: List[str] = []
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+        for context_id in scope:
+            curriculum_registry.release(context_id)
@@ -0,0 +1,271 @@
+"""
+Content-addressed cache for extracted document text.
+
+Entries are keyed by the SHA-256 digest of the source file plus an
+extractor variant string (extractor version, page range, ...), so a copied
+or renamed file still hits the cache while any change to the file or to
+the extraction logic produces a new key.
+
+Two layers are used:
+- an in-process LRU dictionary for repeated calls within a run
+- an on-disk JSON store under ``Config.CACHE_DIR`` for reuse across runs,
+  bounded by total size and entry count with least-recently-used eviction
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .config import Config
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ExtractionCache:
+    """
+    Two-level LRU cache of extracted document content and metadata.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        memory_entries: int = 64
+    ):
+        """
+        Initialize the extraction cache.
+
+        Args:
+            cache_dir: Directory for on-disk entries. If None, uses
+                ``Config.CACHE_DIR / "extraction"``.
+            max_bytes: Maximum total size of on-disk entries
+            max_entries: Maximum number of on-disk entries
+            memory_entries: Maximum number of entries kept in memory
+        """
+        if cache_dir is None:
+            cache_dir = Config.CACHE_DIR / "extraction"
+        if max_bytes is None:
+            max_bytes = Config.EXTRACTION_CACHE_MAX_MB * 1024 * 1024
+        if max_entries is None:
+            max_entries = Config.EXTRACTION_CACHE_MAX_ENTRIES
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._disk_index: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def file_digest(self, path: Path) -> str:
+        """
+        Get the SHA-256 digest of a file.
+
+        Digests are memoized by (path, size, mtime) so unchanged files are
+        only hashed once per process.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            str: Hex digest of the file contents
+        """
+        stat = path.stat()
+        stat_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            digest = self._digests.get(stat_key)
+        if digest is not None:
+            return digest
+
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        with self._lock:
+            self._digests[stat_key] = digest
+        return digest
+
+    def make_key(self, path: Path, variant: str) -> str:
+        """
+        Build the cache key for a file and extractor variant.
+
+        Args:
+            path: Path to the source file
+            variant: Extractor version and options (e.g., "v1", "v1:pages=1-10")
+
+        Returns:
+            str: Cache key
+        """
+        digest = self.file_digest(path)
+        return hashlib.sha256(f"{digest}:{variant}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Optional[Dict]: Cached entry if present, None otherwise
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(entry_path)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if self._disk_index is not None and key in self._disk_index:
+                self._disk_index.move_to_end(key)
+            self._remember(key, entry)
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry in memory and on disk, evicting old entries if needed.
+
+        Args:
+            key: Cache key from ``make_key``
+            entry: JSON-serializable entry to store
+        """
+        with self._lock:
+            self._remember(key, entry)
+
+        entry_path = self._entry_path(key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_name, entry_path)
+            size = entry_path.stat().st_size
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry: {e}")
+            return
+
+        with self._lock:
+            index = self._load_disk_index()
+            self._disk_bytes += size - index.pop(key, 0)
+            index[key] = size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all cached entries from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            for entry_path in self.cache_dir.glob('*/*.json'):
+                try:
+                    entry_path.unlink()
+                except OSError:
+                    pass
+            self._disk_index = OrderedDict()
+            self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict: Hit/miss counters and entry counts
+        """
+        with self._lock:
+            index = self._load_disk_index()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "disk_entries": len(index),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the on-disk location of an entry."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert an entry into the in-memory LRU. Caller holds the lock."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load_disk_index(self) -> "OrderedDict[str, int]":
+        """Scan the cache directory once, ordered oldest access first."""
+        if self._disk_index is None:
+            entries = []
+            for entry_path in self.cache_dir.glob('*/*.json'):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, entry_path.stem, stat.st_size))
+            entries.sort()
+            self._disk_index = OrderedDict((key, size) for _, key, size in entries)
+            self._disk_bytes = sum(size for _, _, size in entries)
+        return self._disk_index
+
+    def _evict(self) -> None:
+        """Drop least recently used disk entries over the limits. Caller holds the lock."""
+        index = self._load_disk_index()
+        while index and (len(index) > self.max_entries or self._disk_bytes > self.max_bytes):
+            key, size = index.popitem(last=False)
+            self._disk_bytes -= size
+            self._memory.pop(key, None)
+            try:
+                self._entry_path(key).unlink()
+            except OSError:
+                pass
+            logger.debug(f"Evicted extraction cache entry {key}")
+
+
+_default_cache: Optional[ExtractionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """
+    Get the process-wide extraction cache.
+
+    Returns:
+        Optional[ExtractionCache]: Shared cache, or None if caching is disabled
+    """
+    global _default_cache
+
+    if not Config.EXTRACTION_CACHE_ENABLED:
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ExtractionCache()
+        return _default_cache
@@ -11,6 +11,12 @@ from .logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Curriculum formats the document analyzer can read
+CURRICULUM_SUFFIXES = ('.txt', '.md', '.pdf', '.docx', '.doc', '.html', '.htm')
+
+# Formats that can be read without the document analyzer tool (and crewai)
+PLAIN_TEXT_SUFFIXES = ('.txt', '.md')
+
 
 def ensure_directory(path: Path) -> Path:
     """
@@ -92,6 +98,32 @@ def list_files(directory: Path, pattern: str = "*", recursive: bool = False) ->
     return files
 
 
+def read_curriculum(filepath: Path, pages: Optional[str] = None) -> str:
+    """
+    Read curriculum text, using the document analyzer only for rich formats.
+    
+    Args:
+        filepath: Path to the curriculum document
+        pages: Optional PDF page range (e.g., "40-60")
+        
+    Returns:
+        str: Extracted text
+        
+    Raises:
+        ValueError: If the document cannot be read
+    """
+    path = Path(filepath)
+    if path.suffix.lower() in PLAIN_TEXT_SUFFIXES and not pages:
+        return path.read_text(encoding='utf-8')
+    
+    from ..tools.document_analyzer import DocumentAnalyzerTool, parse_page_range
+    
+    tool = DocumentAnalyzerTool()
+    page_range = parse_page_range(pages) if pages else None
+    # ExtractionError is a ValueError
+    return tool._extract_cached(path, path.suffix.lower(), page_range)
+
+
 def read_text_file(filepath: Path) -> str:
     """
     Read content from a text file.
@@ -0,0 +1,70 @@
+"""
+Helpers for deferring expensive module-level objects until first use.
+"""
+
+import importlib
+import sys
+import threading
+from typing import Any, Callable, Dict
+
+
+def lazy_module_attributes(module_name: str, factories: Dict[str, Callable[[], Any]]) -> Callable[[str], Any]:
+    """
+    Build a module ``__getattr__`` that creates attributes on first access.
+    
+    Each attribute is created once by calling its factory, then stored on
+    the module so later lookups are ordinary attribute hits.
+    
+    Args:
+        module_name: ``__name__`` of the module defining the attributes
+        factories: Attribute name -> zero-argument factory
+        
+    Returns:
+        Callable[[str], Any]: Function to assign to the module's ``__getattr__``
+        
+    Example:
+        >>> __getattr__ = lazy_module_attributes(__name__, {
+        ...     "grade_level_checker_agent": create_grade_level_checker_agent,
+        ... })
+    """
+    lock = threading.Lock()
+    
+    def __getattr__(name: str) -> Any:
+        factory = factories.get(name)
+        if factory is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        
+        module = sys.modules[module_name]
+        with lock:
+            if name not in module.__dict__:
+                setattr(module, name, factory())
+        return module.__dict__[name]
+    
+    return __getattr__
+
+
+def lazy_package_exports(package_name: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a package ``__getattr__`` that imports submodules on first access.
+    
+    Lets a package keep its public names in ``__all__`` without importing
+    every submodule (and their heavy dependencies) when the package itself
+    is imported.
+    
+    Args:
+        package_name: ``__name__`` of the package
+        exports: Exported name -> relative submodule that defines it (e.g. ``".standards_lookup"``)
+        
+    Returns:
+        Callable[[str], Any]: Function to assign to the package's ``__getattr__``
+    """
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        
+        value = getattr(importlib.import_module(submodule, package_name), name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+    
+    return __getattr__
@@ -0,0 +1,219 @@
+"""
+Persistent cache of LLM responses.
+
+Responses are stored in a SQLite database under ``Config.CACHE_DIR``. Each
+key is a digest of everything that determines a response: the model name,
+the full message list (the prompt plus every tool observation so far),
+temperature, stop words, the requested response model and the tools
+offered for native function calling. Re-running a
+review whose prompts have not changed replays the stored responses
+instead of calling the model.
+
+Entries expire after a time-to-live. Once the database grows past its size
+limit, the least recently used entries are evicted.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import Config
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LLM response cache with TTL and size-based LRU eviction.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Database file. If None, uses ``Config.CACHE_DIR / "llm_responses.sqlite3"``.
+            ttl_seconds: Entry lifetime; 0 or less keeps entries until evicted
+                (default: Config.LLM_CACHE_TTL_HOURS)
+            max_bytes: Maximum total response size (default: Config.LLM_CACHE_MAX_MB)
+        """
+        if path is None:
+            path = Config.CACHE_DIR / "llm_responses.sqlite3"
+        if ttl_seconds is None:
+            ttl_seconds = Config.LLM_CACHE_TTL_HOURS * 3600
+        if max_bytes is None:
+            max_bytes = Config.LLM_CACHE_MAX_MB * 1024 * 1024
+
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: Any,
+        temperature: Optional[float] = None,
+        stop: Optional[list] = None,
+        response_model: Optional[str] = None,
+        tools: Optional[list] = None
+    ) -> str:
+        """
+        Build the cache key for an LLM call.
+
+        Args:
+            model: Model name
+            messages: Prompt string or message list, including tool observations
+            temperature: Sampling temperature
+            stop: Stop sequences
+            response_model: Name of the structured response model, if any
+            tools: Tool schemas offered for native function calling, if any
+
+        Returns:
+            str: Hex SHA-256 key
+        """
+        fields = {
+            'model': model,
+            'messages': messages,
+            'temperature': temperature,
+            'stop': sorted(stop or []),
+            'response_model': response_model,
+        }
+        if tools:
+            # Added only when present, so keys of text-protocol calls are unchanged
+            fields['tools'] = tools
+        payload = json.dumps(
+            fields,
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response, dropping it if it has expired.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Optional[str]: Stored response, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl_seconds > 0 and now - row[1] > self.ttl_seconds:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """
+        Store a response, evicting least recently used entries if over the size limit.
+
+        Args:
+            key: Key from ``make_key``
+            model: Model name, recorded for inspection
+            response: Response text
+        """
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove expired entries, then the least recently used until under the size limit."""
+        if self.ttl_seconds > 0:
+            self._db.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, int]: Entry count, total bytes, and hits and misses in this process
+        """
+        with self._lock:
+            entries, total = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {'entries': entries, 'bytes': total, 'hits': self.hits, 'misses': self.misses}
+
+
+_default_cache: Optional[LLMResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide LLM response cache.
+
+    Returns:
+        Optional[LLMResponseCache]: Shared cache, or None if caching is disabled
+    """
+    global _default_cache
+
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMResponseCache()
+        return _default_cache
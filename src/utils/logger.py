@@ -30,8 +30,8 @@ def setup_logger(name: str = "curriculum_review", level: str = None) -> logging.
     # Remove existing handlers to avoid duplicates
     logger.handlers = []
     
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Create console handler; stderr keeps stdout free for command output (e.g., --json)
+    console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.DEBUG if Config.DEBUG_MODE else logging.INFO)
     
     # Create formatter
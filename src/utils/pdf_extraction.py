@@ -0,0 +1,183 @@
+"""
+PDF text extraction helpers.
+
+Kept free of crewai and other heavy imports so that worker processes used
+for parallel extraction start quickly.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+# Inclusive 1-based page range; an open end means "to the last page"
+PageRange = Tuple[int, Optional[int]]
+
+# Each worker gets several smaller shards so uneven pages balance out
+_SHARDS_PER_WORKER = 4
+
+
+def count_pdf_pages(path: Path) -> int:
+    """
+    Count the pages in a PDF file.
+
+    Args:
+        path: Path to the PDF file
+
+    Returns:
+        int: Number of pages
+    """
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def iter_pdf_pages(path: Path, pages: Optional[PageRange] = None) -> Iterator[str]:
+    """
+    Yield the text of each PDF page as a '--- Page N ---' chunk.
+
+    Each page's parsed layout is released before the next page is read, so
+    memory use stays flat regardless of document length.
+
+    Args:
+        path: Path to the PDF file
+        pages: Optional (first_page, last_page) range, 1-based and inclusive
+
+    Yields:
+        str: Text of one page, skipping pages with no extractable text
+    """
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        yield from _iter_open_pdf_pages(pdf, pages)
+
+
+def _iter_open_pdf_pages(pdf: Any, pages: Optional[PageRange] = None) -> Iterator[str]:
+    """Yield '--- Page N ---' chunks from an already opened pdfplumber document."""
+    first_page, last_page = pages if pages is not None else (1, None)
+    page_count = len(pdf.pages)
+    if last_page is None or last_page > page_count:
+        last_page = page_count
+
+    for page_num in range(first_page, last_page + 1):
+        page = pdf.pages[page_num - 1]
+        try:
+            text = page.extract_text()
+        finally:
+            # Drop the parsed layout objects before moving on
+            page.close()
+        if text:
+            yield f"--- Page {page_num} ---\n{text}"
+
+
+def _extract_shard(path: str, first_page: int, last_page: int) -> List[str]:
+    """Extract one contiguous shard of pages (runs in a worker process)."""
+    return list(iter_pdf_pages(Path(path), (first_page, last_page)))
+
+
+def shard_page_range(first_page: int, last_page: int, shard_count: int) -> List[Tuple[int, int]]:
+    """
+    Split an inclusive page range into contiguous, ordered shards.
+
+    Args:
+        first_page: First page of the range
+        last_page: Last page of the range
+        shard_count: Desired number of shards
+
+    Returns:
+        List[Tuple[int, int]]: Inclusive (first, last) page pairs
+    """
+    total = last_page - first_page + 1
+    size = max(1, math.ceil(total / max(1, shard_count)))
+    return [
+        (start, min(start + size - 1, last_page))
+        for start in range(first_page, last_page + 1, size)
+    ]
+
+
+def resolve_worker_count(workers: Optional[int]) -> int:
+    """
+    Resolve a configured worker count, where 0 or None means one per CPU.
+
+    Args:
+        workers: Configured worker count
+
+    Returns:
+        int: Number of worker processes to use
+    """
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def extract_pdf_pages(
+    path: Path,
+    pages: Optional[PageRange] = None,
+    workers: Optional[int] = None,
+    min_parallel_pages: int = 50
+) -> List[str]:
+    """
+    Extract PDF page chunks, sharding large documents across processes.
+
+    See ``extract_pdf_document``, which also returns the page count.
+
+    Args:
+        path: Path to the PDF file
+        pages: Optional (first_page, last_page) range
+        workers: Number of worker processes (0 or None for one per CPU)
+        min_parallel_pages: Minimum page count before using a process pool
+
+    Returns:
+        List[str]: '--- Page N ---' chunks in page order
+    """
+    return extract_pdf_document(path, pages, workers, min_parallel_pages)[0]
+
+
+def extract_pdf_document(
+    path: Path,
+    pages: Optional[PageRange] = None,
+    workers: Optional[int] = None,
+    min_parallel_pages: int = 50
+) -> Tuple[List[str], int]:
+    """
+    Extract PDF page chunks and the document's page count in one pass.
+
+    Page chunks are returned in page order. Documents (or page ranges)
+    shorter than ``min_parallel_pages``, or a worker count of 1, are
+    extracted serially in the calling process.
+
+    Args:
+        path: Path to the PDF file
+        pages: Optional (first_page, last_page) range
+        workers: Number of worker processes (0 or None for one per CPU)
+        min_parallel_pages: Minimum page count before using a process pool
+
+    Returns:
+        Tuple[List[str], int]: '--- Page N ---' chunks in page order, and the
+            total number of pages in the document
+    """
+    workers = resolve_worker_count(workers)
+    first_page, last_page = pages if pages is not None else (1, None)
+
+    if workers > 1:
+        page_count = count_pdf_pages(path)
+        if last_page is None or last_page > page_count:
+            last_page = page_count
+        if last_page - first_page + 1 >= min_parallel_pages:
+            shards = shard_page_range(first_page, last_page, workers * _SHARDS_PER_WORKER)
+            workers = min(workers, len(shards))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    _extract_shard,
+                    [str(path)] * len(shards),
+                    [start for start, _ in shards],
+                    [end for _, end in shards],
+                )
+                return [chunk for shard in results for chunk in shard], page_count
+
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return list(_iter_open_pdf_pages(pdf, (first_page, last_page))), len(pdf.pages)
@@ -0,0 +1,305 @@
+"""
+Per-run instrumentation of review crews.
+
+``RunProfiler`` records, for every LLM and tool call made while it is
+active, which agent and task made it, how long it took and how many
+tokens it used. It collects them through crewai's global LLM and tool
+call hooks. The active profiler is held in a context variable, so
+concurrent runs (e.g., batch items) each see only their own calls; worker
+threads that run crews must be started with ``submit_in_context``.
+
+Cache hit rates and rate-limit waits are different: they are read from
+process-wide counters at the start and end of the run, so they cover
+everything the process did in that window, including concurrent runs.
+Only caches owned by the run (e.g., its checkpoint store) are exact.
+
+Example:
+    >>> with RunProfiler("concurrent") as profiler:
+    ...     result = run_leaf_jobs(jobs, "3")
+    >>> profile = profiler.finish()
+    >>> print(profile.tasks["math_practices"].total_tokens)
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..models.profile import CacheStats, ProfileStats, RunProfile, TaskProfile, ToolStats
+from .config import Config
+from .extraction_cache import get_extraction_cache
+from .file_utils import save_json
+from .llm_cache import get_llm_response_cache
+from .logger import setup_logger
+from .rate_limit import get_llm_rate_limiter
+from .standards_snapshot import snapshot_stats
+
+logger = setup_logger(__name__)
+
+_active: contextvars.ContextVar[Optional["RunProfiler"]] = contextvars.ContextVar(
+    "active_run_profiler", default=None
+)
+# Start time and token counters of the call in progress on each thread
+_pending = threading.local()
+
+_hooks_installed = False
+_install_lock = threading.Lock()
+
+_USAGE_FIELDS = ('prompt_tokens', 'completion_tokens', 'total_tokens')
+
+
+def task_label(task: Any) -> str:
+    """Name a crewai task: its name, else its output model, else the start of its description."""
+    if task is None:
+        return "unknown"
+    if getattr(task, 'name', None):
+        return task.name
+    model = getattr(task, 'output_pydantic', None) or getattr(task, 'output_json', None)
+    if model is not None:
+        return model.__name__
+    return str(getattr(task, 'description', 'unknown'))[:40]
+
+
+def submit_in_context(executor: Executor, fn: Callable, *args, **kwargs) -> Future:
+    """
+    Submit work to a thread pool with the caller's context variables.
+
+    Pool threads do not inherit context variables, so calls made by crews
+    run there would otherwise not reach the caller's profiler.
+
+    Args:
+        executor: Thread pool
+        fn: Callable to run
+        *args: Positional arguments for ``fn``
+        **kwargs: Keyword arguments for ``fn``
+
+    Returns:
+        Future: Future of ``fn``'s result
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+class RunProfiler:
+    """
+    Collects per-agent and per-task time, LLM usage and tool usage for one run.
+    """
+
+    def __init__(self, mode: str, curriculum_title: Optional[str] = None, grade_level: Optional[str] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            mode: Review mode recorded in the profile
+            curriculum_title: Title recorded in the profile
+            grade_level: Grade level recorded in the profile
+        """
+        self.profile = RunProfile(mode=mode, curriculum_title=curriculum_title, grade_level=grade_level)
+        self._lock = threading.Lock()
+        # Per task run, keyed by task object id: the task (kept alive so the id stays
+        # unique), its label, its agent's role, and its first call start and last call end
+        self._spans: Dict[int, Tuple[Any, str, Optional[str], float, float]] = {}
+        self._cache_baselines: Dict[str, Tuple[Any, int, int]] = {}
+        self._started = 0.0
+        self._token = None
+        self._wait_baseline = 0.0
+
+    def __enter__(self) -> "RunProfiler":
+        _install_hooks()
+        self._started = time.perf_counter()
+        self._token = _active.set(self)
+        limiter = get_llm_rate_limiter()
+        self._wait_baseline = limiter.total_wait if limiter is not None else 0.0
+        llm_cache = get_llm_response_cache()
+        if llm_cache is not None:
+            self.track_cache('llm_responses', llm_cache)
+        extraction_cache = get_extraction_cache()
+        if extraction_cache is not None:
+            self.track_cache('extraction', extraction_cache)
+        if Config.STANDARDS_SNAPSHOT_ENABLED:
+            self.track_cache('standards_snapshot', snapshot_stats)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active.reset(self._token)
+        self.profile.seconds = round(time.perf_counter() - self._started, 3)
+        limiter = get_llm_rate_limiter()
+        if limiter is not None:
+            self.profile.rate_limit_wait_seconds = round(limiter.total_wait - self._wait_baseline, 3)
+
+    def track_cache(self, name: str, cache: Any) -> None:
+        """
+        Report a cache's hit rate over the rest of the run.
+
+        The rate is the change in the cache's counters while the run is
+        active, so a cache shared with concurrent runs counts their hits too.
+
+        Args:
+            name: Name for the cache in the profile
+            cache: Any object with ``hits`` and ``misses`` counters
+        """
+        self._cache_baselines[name] = (cache, cache.hits, cache.misses)
+
+    def record_llm_call(self, task: Any, agent: Any, started: float, ended: float,
+                        usage: Dict[str, int]) -> None:
+        """Add one LLM call made by ``agent`` for ``task``."""
+        with self._lock:
+            for stats in self._targets(task, agent, started, ended):
+                stats.llm_calls += 1
+                stats.llm_seconds += ended - started
+                for field in _USAGE_FIELDS:
+                    setattr(stats, field, getattr(stats, field) + usage.get(field, 0))
+
+    def record_tool_call(self, task: Any, agent: Any, tool_name: str, started: float, ended: float) -> None:
+        """Add one tool invocation made by ``agent`` for ``task``."""
+        with self._lock:
+            for stats in self._targets(task, agent, started, ended):
+                stats.tool_calls += 1
+                stats.tool_seconds += ended - started
+                tool = stats.tools.setdefault(tool_name, ToolStats())
+                tool.calls += 1
+                tool.seconds += ended - started
+
+    def _targets(self, task: Any, agent: Any, started: float, ended: float):
+        """Stats objects a call counts towards; also extends the task run's span."""
+        label = task_label(task)
+        role = getattr(agent, 'role', None)
+        key = id(task)
+        if key in self._spans:
+            _, _, _, first, last = self._spans[key]
+            self._spans[key] = (task, label, role, min(first, started), max(last, ended))
+        else:
+            self._spans[key] = (task, label, role, started, ended)
+        task_stats = self.profile.tasks.setdefault(label, TaskProfile(agent=role))
+        targets = [self.profile.totals, task_stats]
+        if role is not None:
+            targets.append(self.profile.agents.setdefault(role, ProfileStats()))
+        return targets
+
+    def finish(self, stages: Optional[Dict[str, float]] = None) -> RunProfile:
+        """
+        Complete the profile: task and agent wall times, cache hit rates and stage timings.
+
+        Args:
+            stages: Wall-clock seconds per stage reported by the runner
+
+        Returns:
+            RunProfile: The run's profile
+        """
+        profile = self.profile
+        with self._lock:
+            for stats in [profile.totals, *profile.agents.values(), *profile.tasks.values()]:
+                stats.seconds = 0.0
+            for task in profile.tasks.values():
+                task.runs = 0
+            for _, label, role, first, last in self._spans.values():
+                span = last - first
+                profile.tasks[label].seconds += span
+                profile.tasks[label].runs += 1
+                if role is not None:
+                    profile.agents[role].seconds += span
+            profile.totals.seconds = profile.seconds
+            for stats in [profile.totals, *profile.agents.values(), *profile.tasks.values()]:
+                stats.seconds = round(stats.seconds, 3)
+                stats.llm_seconds = round(stats.llm_seconds, 3)
+                stats.tool_seconds = round(stats.tool_seconds, 3)
+                for tool in stats.tools.values():
+                    tool.seconds = round(tool.seconds, 3)
+
+        for name, (cache, hits, misses) in self._cache_baselines.items():
+            hits, misses = cache.hits - hits, cache.misses - misses
+            profile.caches[name] = CacheStats(
+                hits=hits, misses=misses,
+                hit_rate=round(hits / (hits + misses), 3) if hits + misses else None,
+            )
+        if stages:
+            profile.stages = dict(stages)
+        return profile
+
+
+def save_run_profile(profile: Optional[RunProfile], filename: str,
+                     directory: Optional[Path] = None) -> Optional[Path]:
+    """
+    Save a run profile as JSON next to its report.
+
+    Args:
+        profile: Profile to save (nothing is saved for None)
+        filename: Name of the file (e.g., "unit3_profile.json")
+        directory: Directory to save in (default: output directory)
+
+    Returns:
+        Optional[Path]: Saved file, or None if there was no profile or
+            RUN_PROFILES_ENABLED is off
+    """
+    if profile is None or not Config.RUN_PROFILES_ENABLED:
+        return None
+    return save_json(profile.model_dump(mode='json'), filename, directory)
+
+
+def _install_hooks() -> None:
+    """Register the profiling hooks with crewai once per process."""
+    global _hooks_installed
+    with _install_lock:
+        if _hooks_installed:
+            return
+        from crewai.hooks import (
+            register_after_llm_call_hook,
+            register_after_tool_call_hook,
+            register_before_llm_call_hook,
+            register_before_tool_call_hook,
+        )
+
+        register_before_llm_call_hook(_before_llm_call)
+        register_after_llm_call_hook(_after_llm_call)
+        register_before_tool_call_hook(_before_tool_call)
+        register_after_tool_call_hook(_after_tool_call)
+        _hooks_installed = True
+
+
+def _token_counters(llm: Any) -> Dict[str, int]:
+    """Lifetime token counters of an LLM instance (empty for model-name strings)."""
+    summary = getattr(llm, 'get_token_usage_summary', None)
+    if summary is None:
+        return {}
+    usage = summary()
+    return {field: getattr(usage, field, 0) for field in _USAGE_FIELDS}
+
+
+def _before_llm_call(context) -> None:
+    """crewai hook: note when the call started and the LLM's token counters."""
+    if _active.get() is not None:
+        _pending.llm = (time.perf_counter(), _token_counters(context.llm))
+    return None
+
+
+def _after_llm_call(context) -> None:
+    """crewai hook: record the finished call with the tokens it added."""
+    profiler = _active.get()
+    pending = getattr(_pending, 'llm', None)
+    if profiler is None or pending is None:
+        return None
+    _pending.llm = None
+    started, before = pending
+    after = _token_counters(context.llm)
+    usage = {field: after.get(field, 0) - before.get(field, 0) for field in after}
+    profiler.record_llm_call(context.task, context.agent, started, time.perf_counter(), usage)
+    return None
+
+
+def _before_tool_call(context) -> None:
+    """crewai hook: note when the tool call started."""
+    if _active.get() is not None:
+        _pending.tool = time.perf_counter()
+    return None
+
+
+def _after_tool_call(context) -> None:
+    """crewai hook: record the finished tool call."""
+    profiler = _active.get()
+    started = getattr(_pending, 'tool', None)
+    if profiler is None or started is None:
+        return None
+    _pending.tool = None
+    profiler.record_tool_call(context.task, context.agent, context.tool_name, started, time.perf_counter())
+    return None
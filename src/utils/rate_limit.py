@@ -0,0 +1,167 @@
+"""
+Process-wide rate limiting for LLM requests.
+
+Concurrent reviews share one API key, so the request budget has to be
+shared as well. ``RateLimiter`` is a thread-safe token bucket;
+``install_llm_rate_limit`` registers it as a crewai before-LLM-call hook
+so every agent in every crew waits for a slot before calling the model.
+
+LLM wrappers that can answer without a request (e.g. ``CachedLLM`` on a
+cache hit) set ``acquires_rate_limit_slot`` and wait in
+``llm_request_slot()`` only when they actually forward a call.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from .config import Config
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket allowing ``requests_per_minute`` requests, with bursts of up to ``burst``.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=60, burst=5)
+        >>> limiter.acquire()  # Returns seconds spent waiting
+        0.0
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Sustained request rate; 0 or less disables limiting
+            burst: Requests allowed back to back (default: one second's worth, at least 1)
+            clock: Monotonic clock, replaceable in tests
+            sleep: Sleep function, replaceable in tests
+        """
+        self.requests_per_minute = requests_per_minute
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(self.rate)))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether requests are being limited."""
+        return self.rate > 0
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # The token is borrowed from the future; wait until it has refilled
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be made.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+            with self._lock:
+                self.total_wait += wait
+        return wait
+
+
+_installed: Optional[RateLimiter] = None
+_install_lock = threading.Lock()
+
+# Set while a caller holds the slot for the request it is making
+_holding_slot: ContextVar[bool] = ContextVar('holding_llm_slot', default=False)
+
+
+def get_llm_rate_limiter() -> Optional[RateLimiter]:
+    """Get the limiter installed for LLM calls, if any."""
+    return _installed
+
+
+def install_llm_rate_limit(requests_per_minute: Optional[float] = None) -> Optional[RateLimiter]:
+    """
+    Limit the rate of every LLM call made by crewai agents in this process.
+
+    Calling again changes the limit of the installed hook rather than
+    adding a second one.
+
+    Args:
+        requests_per_minute: Request budget (default: Config.LLM_REQUESTS_PER_MINUTE);
+            0 removes the limit
+
+    Returns:
+        Optional[RateLimiter]: The installed limiter, or None if limiting is disabled
+    """
+    global _installed
+    if requests_per_minute is None:
+        requests_per_minute = Config.LLM_REQUESTS_PER_MINUTE
+
+    from crewai.hooks import register_before_llm_call_hook, unregister_before_llm_call_hook
+
+    with _install_lock:
+        if _installed is not None:
+            unregister_before_llm_call_hook(_wait_for_slot)
+            _installed = None
+        if requests_per_minute <= 0:
+            return None
+        _installed = RateLimiter(requests_per_minute)
+        register_before_llm_call_hook(_wait_for_slot)
+        logger.info(f"LLM calls limited to {requests_per_minute:g} requests per minute")
+        return _installed
+
+
+@contextmanager
+def llm_request_slot() -> Iterator[float]:
+    """
+    Wait for a slot on the installed limiter and hold it for one request.
+
+    The before-LLM-call hook does not wait again for calls made inside the block.
+
+    Yields:
+        float: Seconds spent waiting
+    """
+    limiter = _installed
+    waited = limiter.acquire() if limiter is not None else 0.0
+    token = _holding_slot.set(True)
+    try:
+        yield waited
+    finally:
+        _holding_slot.reset(token)
+
+
+def _wait_for_slot(context) -> None:
+    """crewai before-LLM-call hook that waits on the installed limiter."""
+    limiter = _installed
+    if limiter is None or _holding_slot.get():
+        return None
+    if getattr(context.llm, 'acquires_rate_limit_slot', False):
+        return None
+    limiter.acquire()
+    return None
@@ -0,0 +1,185 @@
+"""
+Curriculum text segmentation.
+
+Splits extracted curriculum text into units, lessons, objectives and
+practice problems. Kept free of crewai so it can be used from the command
+line and other pure-local code paths without paying for agent framework imports.
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.curriculum import (
+    CurriculumDocument,
+    CurriculumLesson,
+    CurriculumSection,
+    CurriculumUnit,
+    PracticeProblem,
+)
+
+
+_MD_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_SEGMENT_NUMBER = r'(\d+(?:\.\d+)?|[IVXLC]+|[A-Za-z])'
+_UNIT_RE = re.compile(r'^(?:unit|module)\s+' + _SEGMENT_NUMBER + r'\s*(?:[:.\-–—]\s*(.*)|$)', re.IGNORECASE)
+_LESSON_RE = re.compile(r'^lesson\s+' + _SEGMENT_NUMBER + r'\s*(?:[:.\-–—]\s*(.*)|$)', re.IGNORECASE)
+_LABEL_RE = re.compile(r'^\*{0,2}\s*([A-Za-z][A-Za-z /&()-]{0,40}?)\s*:\s*\*{0,2}\s*(.*)$')
+_BULLET_RE = re.compile(r'^\s*(?:[-*\u2022]|(\d+)[.)])\s+(.*\S)')
+
+# Heading levels assumed for plain-text (non-Markdown) unit and lesson lines
+_PLAIN_UNIT_LEVEL = 2
+_PLAIN_LESSON_LEVEL = 3
+
+
+def _is_objective_label(label: str) -> bool:
+    """Check whether a label introduces learning objectives."""
+    return label.lower().rstrip('s') in ('objective', 'learning objective', 'learning goal', 'goal')
+
+
+def _is_practice_label(label: str) -> bool:
+    """Check whether a label introduces practice problems."""
+    label = label.lower()
+    return 'practice' in label or 'problems' in label or 'exercises' in label
+
+
+def _classify_heading(line: str) -> Optional[Tuple[str, int, Optional[str], str]]:
+    """
+    Classify a line as a unit, lesson or section heading.
+    
+    Returns:
+        Optional[Tuple]: (kind, level, number, title), or None for body text
+    """
+    stripped = line.strip()
+    heading = _MD_HEADING_RE.match(stripped)
+    if heading:
+        level = len(heading.group(1))
+        text = heading.group(2).strip('*').strip()
+    elif len(stripped) <= 120:
+        level = None
+        text = stripped
+    else:
+        return None
+    
+    for kind, pattern, plain_level in (
+        ('unit', _UNIT_RE, _PLAIN_UNIT_LEVEL),
+        ('lesson', _LESSON_RE, _PLAIN_LESSON_LEVEL)
+    ):
+        match = pattern.match(text)
+        if match:
+            return kind, level or plain_level, match.group(1), (match.group(2) or '').strip()
+    
+    if level is not None:
+        return 'section', level, None, text
+    return None
+
+
+def segment_curriculum(text: str) -> CurriculumDocument:
+    """
+    Segment curriculum text into units, lessons, objectives and practice problems.
+    
+    Recognizes Markdown headings ('## Unit 1: ...', '### Lesson 2: ...') as
+    well as plain-text 'Unit 1: ...' / 'Lesson 2: ...' lines such as those
+    produced by PDF extraction. Other headings become sections of the
+    enclosing unit, or top-level sections when outside any unit.
+    
+    Args:
+        text: Extracted curriculum text
+        
+    Returns:
+        CurriculumDocument: Typed document tree
+    """
+    lines = text.splitlines()
+    document = CurriculumDocument(line_count=len(lines))
+    
+    def span(start: int, end: int) -> Tuple[int, str]:
+        # Trim trailing blank lines from a 1-based inclusive line range
+        while end > start and not lines[end - 1].strip():
+            end -= 1
+        return end, "\n".join(lines[start - 1:end])
+    
+    unit: Optional[Dict[str, Any]] = None
+    lesson: Optional[Dict[str, Any]] = None
+    section: Optional[Dict[str, Any]] = None
+    mode: Optional[str] = None
+    
+    def close_lesson(end: int) -> None:
+        nonlocal lesson
+        if lesson is not None:
+            lesson['end_line'], lesson['text'] = span(lesson['start_line'], end)
+            unit['lessons'].append(CurriculumLesson(**{k: v for k, v in lesson.items() if k != 'level'}))
+            lesson = None
+    
+    def close_section(end: int) -> None:
+        nonlocal section
+        if section is not None:
+            target = section.pop('target')
+            section['end_line'], section['text'] = span(section['start_line'], end)
+            target.append(CurriculumSection(**{k: v for k, v in section.items() if k != 'level'}))
+            section = None
+    
+    def close_unit(end: int) -> None:
+        nonlocal unit
+        close_lesson(end)
+        close_section(end)
+        if unit is not None:
+            unit['end_line'], unit['text'] = span(unit['start_line'], end)
+            document.units.append(CurriculumUnit(**{k: v for k, v in unit.items() if k != 'level'}))
+            unit = None
+    
+    for line_num, line in enumerate(lines, 1):
+        heading = _classify_heading(line) if line.strip() else None
+        
+        # Sub-headings nested inside a lesson stay part of the lesson
+        if heading and lesson is not None and heading[0] == 'section' and heading[1] > lesson['level']:
+            heading = None
+        
+        if heading:
+            kind, level, number, title = heading
+            mode = None
+            close_lesson(line_num - 1)
+            close_section(line_num - 1)
+            
+            if kind == 'unit':
+                close_unit(line_num - 1)
+                unit = {'number': number, 'title': title, 'lessons': [], 'sections': [],
+                        'start_line': line_num, 'level': level}
+            elif kind == 'lesson':
+                if unit is None:
+                    unit = {'number': None, 'title': 'Lessons', 'lessons': [], 'sections': [],
+                            'start_line': line_num, 'level': level - 1}
+                lesson = {'number': number, 'title': title, 'objectives': [],
+                          'practice_problems': [], 'start_line': line_num, 'level': level}
+            elif level == 1 and document.title is None and unit is None and not document.sections:
+                document.title = title
+            else:
+                if unit is not None and level <= unit['level']:
+                    close_unit(line_num - 1)
+                target = unit['sections'] if unit is not None else document.sections
+                section = {'title': title, 'start_line': line_num, 'level': level, 'target': target}
+            continue
+        
+        if lesson is None or not line.strip():
+            continue
+        
+        bullet = _BULLET_RE.match(line)
+        label = None if bullet else _LABEL_RE.match(line.strip())
+        if label:
+            name, rest = label.group(1), label.group(2).strip('* ').strip()
+            if _is_objective_label(name):
+                mode = 'objectives'
+                if rest:
+                    lesson['objectives'].append(rest)
+            elif _is_practice_label(name):
+                mode = 'practice'
+            else:
+                mode = None
+        elif bullet and mode == 'objectives':
+            lesson['objectives'].append(bullet.group(2))
+        elif bullet and mode == 'practice':
+            number = int(bullet.group(1)) if bullet.group(1) else None
+            lesson['practice_problems'].append(PracticeProblem(number=number, text=bullet.group(2)))
+        elif not bullet:
+            mode = None
+    
+    close_unit(len(lines))
+    close_section(len(lines))
+    return document
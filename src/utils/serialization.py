@@ -0,0 +1,40 @@
+"""
+JSON serialization for tool outputs.
+
+Tool observations are fed back into the LLM prompt, so the compact mode
+drops indentation and non-ASCII escaping and uses orjson when it is
+installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def dumps(data: Any, compact: bool = False) -> str:
+    """
+    Serialize tool output to a JSON string.
+    
+    Args:
+        data: JSON-serializable data
+        compact: If True, emit minimal JSON (no whitespace, UTF-8 kept as-is)
+        
+    Returns:
+        str: JSON string
+    """
+    if not compact:
+        return json.dumps(data, indent=2)
+    
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            # orjson is stricter (e.g., integers over 64 bits); use json instead
+            pass
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
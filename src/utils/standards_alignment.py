@@ -0,0 +1,165 @@
+"""
+Deterministic standards alignment pre-pass.
+
+Scores every lesson and objective of a curriculum against every standard
+using TF-IDF cosine similarity, producing a shortlist of candidate
+alignments in milliseconds. Tasks receive this map as structured context so
+the LLM verifies candidates instead of discovering alignments from scratch.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from ..models.alignment import CandidateCoverageMap, SegmentAlignment, StandardCandidate
+from ..models.curriculum import CurriculumDocument
+from .logger import setup_logger
+from .segmentation import segment_curriculum
+from .standards_loader import StandardsLoader, get_standards_loader
+from .text_search import tokenize
+
+logger = setup_logger(__name__)
+
+_STANDARD_ID_RE = re.compile(r'\b(?:K|\d{1,2})\.[A-Z]{1,4}\.[A-Z]\.\d+\b')
+
+# Stemmed words common to lesson boilerplate that carry no alignment signal
+_CURRICULUM_STOPWORDS = frozenset(tokenize(
+    "student students will understand understanding lesson objective content practice "
+    "problems example examples solve write draw"
+))
+
+SparseVector = Dict[str, float]
+
+
+def _terms(text: str) -> List[str]:
+    """Tokenize text for matching, dropping curriculum boilerplate words."""
+    return [term for term in tokenize(text) if term not in _CURRICULUM_STOPWORDS]
+
+
+def _tf_idf(tokens: Sequence[str], idf: Dict[str, float], default_idf: float) -> SparseVector:
+    """Build an L2-normalized TF-IDF vector with sublinear term frequency."""
+    vector = {
+        term: (1 + math.log(count)) * idf.get(term, default_idf)
+        for term, count in Counter(tokens).items()
+    }
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+
+def _cosine(a: SparseVector, b: SparseVector) -> float:
+    """Dot product of two normalized sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+
+def _segment_document(curriculum: Union[str, CurriculumDocument]) -> CurriculumDocument:
+    """Segment raw text, or pass through an already segmented document."""
+    if isinstance(curriculum, CurriculumDocument):
+        return curriculum
+    return segment_curriculum(curriculum)
+
+
+def match_curriculum_to_standards(
+    curriculum: Union[str, CurriculumDocument],
+    grade_level: Optional[str] = None,
+    loader: Optional[StandardsLoader] = None,
+    top_k: int = 3,
+    min_score: float = 0.1
+) -> CandidateCoverageMap:
+    """
+    Map curriculum lessons and objectives to candidate standards.
+
+    Every standard in the loader is scored, not only the target grade's, so
+    content pitched at another grade shows up as an off-grade match.
+
+    Args:
+        curriculum: Curriculum text or segmented document
+        grade_level: Target grade level, used to report uncovered standards
+        loader: Standards loader (default: shared process-wide loader)
+        top_k: Maximum candidates per segment
+        min_score: Minimum cosine similarity for a candidate
+
+    Returns:
+        CandidateCoverageMap: Candidate standards per segment plus coverage summary
+    """
+    document = _segment_document(curriculum)
+    source_text = curriculum if isinstance(curriculum, str) else "\n".join(
+        [unit.text for unit in document.units] + [section.text for section in document.sections]
+    )
+    if loader is None:
+        loader = get_standards_loader()
+
+    standards = [
+        (grade, standard)
+        for grade in loader.get_grades()
+        for standard in loader.get_all_standards_for_grade(grade)
+    ]
+    standard_tokens = [
+        _terms(f"{standard.get('description', '')} {standard.get('domain_name', '')}")
+        for _, standard in standards
+    ]
+
+    document_frequency = Counter(term for tokens in standard_tokens for term in set(tokens))
+    corpus_size = len(standards)
+    idf = {
+        term: math.log((1 + corpus_size) / (1 + df)) + 1
+        for term, df in document_frequency.items()
+    }
+    default_idf = math.log(1 + corpus_size) + 1
+    standard_vectors = [_tf_idf(tokens, idf, default_idf) for tokens in standard_tokens]
+
+    segments: List[Tuple[str, str, str, str]] = []
+    for unit in document.units:
+        unit_label = f"Unit {unit.number}" if unit.number else unit.title
+        for lesson in unit.lessons:
+            lesson_label = f"Lesson {lesson.number}" if lesson.number else lesson.title
+            location = f"{unit_label} > {lesson_label}"
+            # Title and objectives are the most specific signals, so count them twice
+            emphasis = " ".join([lesson.title] + lesson.objectives)
+            segments.append(('lesson', location, lesson.title, f"{emphasis} {emphasis} {lesson.text}"))
+            for objective in lesson.objectives:
+                segments.append(('objective', location, objective, objective))
+
+    if not segments:
+        # Unstructured text: treat the whole document as a single lesson
+        segments.append(('lesson', 'Document', document.title or 'Entire document', source_text))
+
+    coverage_map = CandidateCoverageMap(grade_level=grade_level)
+    for kind, location, label, text in segments:
+        vector = _tf_idf(_terms(text), idf, default_idf)
+        scored = sorted(
+            ((_cosine(vector, standard_vector), index)
+             for index, standard_vector in enumerate(standard_vectors)),
+            key=lambda item: (-item[0], item[1])
+        )
+        candidates = [
+            StandardCandidate(
+                standard_id=standards[index][1].get("id", ""),
+                grade=standards[index][0],
+                description=standards[index][1].get("description", ""),
+                score=round(min(score, 1.0), 4)
+            )
+            for score, index in scored[:top_k]
+            if score >= min_score
+        ]
+        coverage_map.segments.append(
+            SegmentAlignment(kind=kind, location=location, text=label, candidates=candidates)
+        )
+        if kind == 'lesson':
+            for candidate in candidates:
+                coverage_map.coverage.setdefault(candidate.standard_id, []).append(location)
+
+    coverage_map.cited_standards = list(dict.fromkeys(_STANDARD_ID_RE.findall(source_text)))
+
+    if grade_level is not None:
+        coverage_map.uncovered_standards = [
+            standard.get("id")
+            for standard in loader.get_all_standards_for_grade(str(grade_level))
+            if standard.get("id") not in coverage_map.coverage
+            and standard.get("id") not in coverage_map.cited_standards
+        ]
+
+    logger.info(f"Matched {len(segments)} curriculum segments against {corpus_size} standards")
+    return coverage_map
@@ -3,58 +3,169 @@ Utility for loading and querying CCSSM standards.
 """
 
 import json
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from .config import Config
 from .logger import setup_logger
+from .standards_snapshot import build_snapshot, load_snapshot
+from .text_search import BM25Index
 
 logger = setup_logger(__name__)
 
 
+class StandardRecord(dict):
+    """
+    Read-only standard dictionary.
+    
+    Records are built once at load time and shared by every lookup, so they
+    reject mutation; use ``dict(record)`` to get a modifiable copy.
+    """
+    
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Standard records are read-only; use dict(record) for a mutable copy")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        return (StandardRecord, (dict(self),))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+
+
 class StandardsLoader:
     """
     Load and query Common Core State Standards for Mathematics.
     """
     
-    def __init__(self, standards_file: Optional[Path] = None):
+    def __init__(self, standards_file: Optional[Path] = None, use_snapshot: Optional[bool] = None):
         """
         Initialize the standards loader.
         
+        Standards are read lazily on first access.
+        
         Args:
             standards_file: Path to standards JSON file. If None, uses default.
+            use_snapshot: Whether to read (and refresh) the binary snapshot.
+                If None, uses Config.STANDARDS_SNAPSHOT_ENABLED.
         """
         if standards_file is None:
             standards_file = Config.STANDARDS_DIR / "ccssm_standards.json"
+        if use_snapshot is None:
+            use_snapshot = Config.STANDARDS_SNAPSHOT_ENABLED
         
         self.standards_file = standards_file
-        self.standards_data = self._load_standards()
-        logger.info(f"Loaded standards from {standards_file}")
+        self.use_snapshot = use_snapshot
+        self._standards_data: Optional[Dict] = None
+        self._search_index: Optional[BM25Index] = None
+        self._load_lock = threading.Lock()
+    
+    @property
+    def standards_data(self) -> Dict:
+        """Raw standards data, loaded and indexed on first access."""
+        if self._standards_data is None:
+            with self._load_lock:
+                if self._standards_data is None:
+                    data = self._load_standards()
+                    self._build_indexes(data)
+                    self._standards_data = data
+                    logger.info(f"Loaded standards from {self.standards_file}")
+        return self._standards_data
+    
+    def _ensure_loaded(self) -> None:
+        """Load and index the standards if that has not happened yet."""
+        if self._standards_data is None:
+            self.standards_data
     
     def _load_standards(self) -> Dict:
         """
-        Load standards from JSON file.
+        Load standards from the binary snapshot, or from JSON if it is stale.
         
         Returns:
             Dict: Standards data
         """
+        if self.use_snapshot:
+            data = load_snapshot(self.standards_file)
+            if data is not None:
+                return data
+        
         try:
             with open(self.standards_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                data = json.load(f)
         except FileNotFoundError:
             logger.error(f"Standards file not found: {self.standards_file}")
             return {}
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing standards JSON: {e}")
             return {}
+        
+        if self.use_snapshot:
+            try:
+                build_snapshot(self.standards_file, data)
+            except OSError as e:
+                logger.warning(f"Could not write standards snapshot: {e}")
+        return data
     
-    def get_mathematical_practices(self) -> List[Dict]:
+    def _build_indexes(self, data: Dict) -> None:
+        """
+        Build flat lookup indexes over the nested standards data.
+        
+        Creates id -> standard, grade -> standards and (grade, domain) ->
+        standards maps of shared read-only records so lookups are
+        constant-time and allocation-free.
+        
+        Args:
+            data: Raw standards data
+        """
+        self._practices: Tuple[StandardRecord, ...] = tuple(
+            StandardRecord(practice)
+            for practice in data.get("mathematical_practices", [])
+        )
+        self._practices_by_id: Dict[str, StandardRecord] = {
+            practice.get("id"): practice for practice in self._practices
+        }
+        self._standards_by_id: Dict[str, StandardRecord] = {}
+        self._grade_by_id: Dict[str, str] = {}
+        self._standards_by_grade: Dict[str, Tuple[StandardRecord, ...]] = {}
+        self._standards_by_domain: Dict[Tuple[str, str], Tuple[StandardRecord, ...]] = {}
+        
+        for grade, grade_data in data.get("grade_levels", {}).items():
+            grade_standards = []
+            for domain_code, domain_data in grade_data.get("domains", {}).items():
+                domain_standards = tuple(
+                    StandardRecord(
+                        standard,
+                        domain=domain_code,
+                        domain_name=domain_data.get("name", "")
+                    )
+                    for standard in domain_data.get("standards", [])
+                )
+                self._standards_by_domain[(grade, domain_code)] = domain_standards
+                grade_standards.extend(domain_standards)
+                for standard in domain_standards:
+                    self._standards_by_id[standard.get("id")] = standard
+                    self._grade_by_id[standard.get("id")] = grade
+            self._standards_by_grade[grade] = tuple(grade_standards)
+        
+        logger.debug(f"Indexed {len(self._standards_by_id)} standards "
+                     f"across {len(self._standards_by_grade)} grade levels")
+    
+    def get_mathematical_practices(self) -> Tuple[Dict, ...]:
         """
         Get all 8 Standards for Mathematical Practice.
         
         Returns:
-            List[Dict]: List of mathematical practices
+            Tuple[Dict, ...]: Read-only mathematical practice records
         """
-        return self.standards_data.get("mathematical_practices", [])
+        self._ensure_loaded()
+        return self._practices
     
     def get_grade_level_standards(self, grade: str) -> Dict:
         """
@@ -82,7 +193,7 @@ class StandardsLoader:
         grade_data = self.get_grade_level_standards(grade)
         return grade_data.get("domains", {})
     
-    def get_domain_standards(self, grade: str, domain: str) -> List[Dict]:
+    def get_domain_standards(self, grade: str, domain: str) -> Tuple[Dict, ...]:
         """
         Get standards for a specific domain within a grade level.
         
@@ -91,11 +202,10 @@ class StandardsLoader:
             domain: Domain code (e.g., "OA", "NBT", "NF")
             
         Returns:
-            List[Dict]: List of standards in the domain
+            Tuple[Dict, ...]: Read-only standards in the domain
         """
-        domains = self.get_domains(grade)
-        domain_data = domains.get(domain, {})
-        return domain_data.get("standards", [])
+        self._ensure_loaded()
+        return self._standards_by_domain.get((str(grade), domain), ())
     
     def search_standard(self, standard_id: str) -> Optional[Dict]:
         """
@@ -107,44 +217,83 @@ class StandardsLoader:
         Returns:
             Optional[Dict]: Standard data if found, None otherwise
         """
-        # Parse standard ID (format: grade.domain.cluster.standard)
-        parts = standard_id.split(".")
-        if len(parts) < 2:
+        # Standard IDs have the format grade.domain.cluster.standard
+        if "." not in standard_id:
             logger.warning(f"Invalid standard ID format: {standard_id}")
             return None
         
-        grade = parts[0]
-        domain = parts[1]
-        
-        standards = self.get_domain_standards(grade, domain)
-        for standard in standards:
-            if standard.get("id") == standard_id:
-                return standard
-        
-        return None
+        self._ensure_loaded()
+        return self._standards_by_id.get(standard_id)
     
-    def get_all_standards_for_grade(self, grade: str) -> List[Dict]:
+    def get_all_standards_for_grade(self, grade: str) -> Tuple[Dict, ...]:
         """
         Get all standards for a grade level across all domains.
         
+        Each standard includes its 'domain' code and 'domain_name'.
+        
         Args:
             grade: Grade level
             
         Returns:
-            List[Dict]: All standards for the grade level
+            Tuple[Dict, ...]: Read-only standards for the grade level
         """
-        all_standards = []
-        domains = self.get_domains(grade)
+        self._ensure_loaded()
+        return self._standards_by_grade.get(str(grade), ())
+    
+    def get_grades(self) -> Tuple[str, ...]:
+        """
+        Get the grade levels present in the standards data.
+        
+        Returns:
+            Tuple[str, ...]: Grade levels in file order
+        """
+        self._ensure_loaded()
+        return tuple(self._standards_by_grade)
+    
+    def search(self, query: str, top_k: int = 5, grade: Optional[str] = None) -> List[Tuple[Dict, float]]:
+        """
+        Full-text search over standard and mathematical practice descriptions.
+        
+        Uses a BM25-ranked inverted index of stemmed terms, built on first
+        use. Misspelled query terms are matched to close index terms.
+        
+        Args:
+            query: Free-text query (e.g., "fractions on a number line")
+            top_k: Maximum number of results
+            grade: Optional grade level to restrict content standards to;
+                mathematical practices always match
+            
+        Returns:
+            List[Tuple[Dict, float]]: (standard or practice record, score), best first
+        """
+        index = self._get_search_index()
         
-        for domain_code, domain_data in domains.items():
-            standards = domain_data.get("standards", [])
-            for standard in standards:
-                standard_with_domain = standard.copy()
-                standard_with_domain["domain"] = domain_code
-                standard_with_domain["domain_name"] = domain_data.get("name", "")
-                all_standards.append(standard_with_domain)
+        predicate = None
+        if grade is not None:
+            grade = str(grade)
+            predicate = lambda key: key not in self._grade_by_id or self._grade_by_id[key] == grade
         
-        return all_standards
+        return [
+            (self._standards_by_id.get(key) or self._practices_by_id[key], score)
+            for key, score in index.search(query, top_k=top_k, predicate=predicate)
+        ]
+    
+    def _get_search_index(self) -> BM25Index:
+        """Build the full-text index on first use."""
+        self._ensure_loaded()
+        if self._search_index is None:
+            with self._load_lock:
+                if self._search_index is None:
+                    documents = [
+                        (standard_id, f"{standard.get('description', '')} {standard.get('domain_name', '')}")
+                        for standard_id, standard in self._standards_by_id.items()
+                    ]
+                    documents.extend(
+                        (practice_id, f"{practice.get('title', '')} {practice.get('description', '')}")
+                        for practice_id, practice in self._practices_by_id.items()
+                    )
+                    self._search_index = BM25Index(documents)
+        return self._search_index
     
     def get_metadata(self) -> Dict:
         """
@@ -156,5 +305,46 @@ class StandardsLoader:
         return self.standards_data.get("metadata", {})
 
 
-# Create default loader instance
-default_loader = StandardsLoader()
+_loaders: Dict[Path, StandardsLoader] = {}
+_loaders_lock = threading.Lock()
+
+
+def get_standards_loader(standards_file: Optional[Path] = None) -> StandardsLoader:
+    """
+    Get the process-wide shared loader for a standards file.
+    
+    The file is parsed and indexed once per process; every caller asking
+    for the same file receives the same read-only loader. Worker processes
+    started by fork inherit an already-loaded store.
+    
+    Args:
+        standards_file: Path to standards JSON file. If None, uses default.
+        
+    Returns:
+        StandardsLoader: Shared loader instance
+    """
+    if standards_file is None:
+        standards_file = Config.STANDARDS_DIR / "ccssm_standards.json"
+    key = Path(standards_file).resolve()
+    
+    loader = _loaders.get(key)
+    if loader is None:
+        with _loaders_lock:
+            loader = _loaders.get(key)
+            if loader is None:
+                loader = StandardsLoader(key)
+                _loaders[key] = loader
+    return loader
+
+
+def clear_standards_loaders() -> None:
+    """Drop all shared loaders so the next lookup re-reads the standards files."""
+    with _loaders_lock:
+        _loaders.clear()
+
+
+def __getattr__(name: str):
+    # Keep 'default_loader' importable without loading standards at import time
+    if name == "default_loader":
+        return get_standards_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
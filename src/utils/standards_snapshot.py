@@ -0,0 +1,212 @@
+"""
+Precompiled binary snapshots of standards JSON files.
+
+A snapshot stores the parsed standards data in ``marshal`` format behind a
+small header recording the snapshot format, the Python version that wrote
+it and the SHA-256, size and mtime of the source JSON. Loading memory-maps
+the file and unmarshals it, which is considerably faster than parsing JSON
+for large multi-state corpora. A snapshot whose source hash no longer
+matches is treated as stale and ignored.
+
+Build snapshots for every file in ``data/standards/`` with:
+
+    python -m src.utils.standards_snapshot
+"""
+
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import Config
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SNAPSHOT_MAGIC = b"CCSSMSNP"
+SNAPSHOT_FORMAT_VERSION = 1
+
+# magic, format version, python major, python minor, source size, source mtime_ns, source sha256
+_HEADER = struct.Struct("<8sHBBQQ32s")
+
+
+class SnapshotStats:
+    """
+    Counts of snapshot loads that found a current snapshot (hits) or not (misses).
+    """
+
+    def __init__(self):
+        """Initialize zeroed counters."""
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool) -> None:
+        """
+        Count one snapshot load.
+
+        Args:
+            hit: Whether the load returned snapshot data
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+# Process-wide counters, reported in run profiles
+snapshot_stats = SnapshotStats()
+
+
+def get_snapshot_path(source_file: Path) -> Path:
+    """
+    Get the snapshot location for a standards JSON file.
+
+    The name includes a digest of the resolved source path, so files with
+    the same name in different directories get separate snapshots.
+
+    Args:
+        source_file: Path to the standards JSON file
+
+    Returns:
+        Path: Snapshot path under ``Config.CACHE_DIR``
+    """
+    source_file = Path(source_file).resolve()
+    path_digest = hashlib.sha256(str(source_file).encode('utf-8')).hexdigest()[:12]
+    return Config.CACHE_DIR / "standards" / f"{source_file.stem}-{path_digest}.snapshot"
+
+
+def _file_sha256(path: Path) -> bytes:
+    """Hash a file's contents."""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(chunk)
+    return sha.digest()
+
+
+def build_snapshot(
+    source_file: Path,
+    data: Optional[Dict[str, Any]] = None,
+    snapshot_path: Optional[Path] = None
+) -> Path:
+    """
+    Compile a standards JSON file into a binary snapshot.
+
+    Args:
+        source_file: Path to the standards JSON file
+        data: Already-parsed contents of the source file, if available
+        snapshot_path: Output path. If None, uses ``get_snapshot_path``.
+
+    Returns:
+        Path: Path to the written snapshot
+    """
+    source_file = Path(source_file)
+    if snapshot_path is None:
+        snapshot_path = get_snapshot_path(source_file)
+
+    stat = source_file.stat()
+    digest = _file_sha256(source_file)
+    if data is None:
+        with open(source_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_FORMAT_VERSION,
+        sys.version_info.major,
+        sys.version_info.minor,
+        stat.st_size,
+        stat.st_mtime_ns,
+        digest,
+    )
+
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=snapshot_path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(header)
+        f.write(marshal.dumps(data))
+    os.replace(tmp_name, snapshot_path)
+
+    logger.info(f"Built standards snapshot {snapshot_path}")
+    return snapshot_path
+
+
+def load_snapshot(source_file: Path, snapshot_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load standards data from a snapshot if it is current.
+
+    The source size and mtime are compared first; only when they differ is
+    the source re-hashed, so an unchanged file costs one ``stat`` call.
+
+    Args:
+        source_file: Path to the standards JSON file the snapshot was built from
+        snapshot_path: Snapshot path. If None, uses ``get_snapshot_path``.
+
+    Returns:
+        Optional[Dict]: Standards data, or None if the snapshot is missing,
+            unreadable or stale
+    """
+    data = _read_snapshot(Path(source_file), snapshot_path)
+    snapshot_stats.record(hit=data is not None)
+    return data
+
+
+def _read_snapshot(source_file: Path, snapshot_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Read a snapshot, returning None if it is missing, unreadable or stale."""
+    if snapshot_path is None:
+        snapshot_path = get_snapshot_path(source_file)
+
+    try:
+        with open(snapshot_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) < _HEADER.size:
+                return None
+            magic, version, py_major, py_minor, size, mtime_ns, digest = \
+                _HEADER.unpack_from(mapped, 0)
+            if (magic != SNAPSHOT_MAGIC
+                    or version != SNAPSHOT_FORMAT_VERSION
+                    or (py_major, py_minor) != sys.version_info[:2]):
+                logger.debug(f"Ignoring incompatible standards snapshot {snapshot_path}")
+                return None
+
+            stat = source_file.stat()
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                if stat.st_size != size or _file_sha256(source_file) != digest:
+                    logger.info(f"Standards snapshot is stale: {snapshot_path}")
+                    return None
+
+            return marshal.loads(mapped[_HEADER.size:])
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        logger.debug(f"Could not read standards snapshot {snapshot_path}: {e}")
+        return None
+
+
+def build_all_snapshots(standards_dir: Optional[Path] = None) -> List[Path]:
+    """
+    Compile every standards JSON file in a directory.
+
+    Args:
+        standards_dir: Directory of standards JSON files (default: Config.STANDARDS_DIR)
+
+    Returns:
+        List[Path]: Paths of the written snapshots
+    """
+    if standards_dir is None:
+        standards_dir = Config.STANDARDS_DIR
+    return [build_snapshot(source) for source in sorted(Path(standards_dir).glob("*.json"))]
+
+
+if __name__ == "__main__":
+    sources = [Path(arg) for arg in sys.argv[1:]]
+    built = [build_snapshot(source) for source in sources] if sources else build_all_snapshots()
+    for path in built:
+        print(path)
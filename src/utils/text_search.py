@@ -0,0 +1,167 @@
+"""
+Lightweight full-text search utilities.
+
+Provides tokenization with a small suffix-stripping stemmer and an
+in-memory BM25 index with fuzzy matching of misspelled query terms.
+"""
+
+import difflib
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from how in into is it its of on or that the their
+them they this to was were what when where which who will with within using use
+""".split())
+
+# Suffix rewrites applied in order; the first match wins
+_SUFFIXES = (
+    ("ational", "ate"),
+    ("ization", "ize"),
+    ("ation", "ate"),
+    ("ness", ""),
+    ("ment", ""),
+    ("ies", "y"),
+    ("sses", "ss"),
+    ("ing", ""),
+    ("ed", ""),
+    ("ly", ""),
+    ("es", "e"),
+    ("s", ""),
+)
+
+# Weight given to a fuzzy (misspelling) match relative to an exact term
+FUZZY_WEIGHT = 0.7
+FUZZY_CUTOFF = 0.8
+
+
+def stem(word: str) -> str:
+    """
+    Reduce a word to a crude stem by stripping common English suffixes.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        str: Stemmed word
+    """
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix == "s" and word.endswith(("ss", "us", "is")):
+                return word
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase, stemmed, stopword-free tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List[str]: Tokens in order
+    """
+    return [stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    In-memory BM25 index over short documents.
+    """
+
+    def __init__(self, documents: Iterable[Tuple[Hashable, str]], k1: float = 1.5, b: float = 0.75):
+        """
+        Build the index.
+
+        Args:
+            documents: (key, text) pairs
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+        """
+        self.k1 = k1
+        self.b = b
+        self.keys: List[Hashable] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+
+        for key, text in documents:
+            doc_id = len(self.keys)
+            tokens = tokenize(text)
+            self.keys.append(key)
+            self._lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                self._postings[term].append((doc_id, count))
+
+        self._postings = dict(self._postings)
+        self._vocabulary = sorted(self._postings)
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        doc_count = len(self.keys)
+        self._idf = {
+            term: math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def expand_query(self, query: str) -> Dict[str, float]:
+        """
+        Map query text to weighted index terms, adding fuzzy matches for unknown terms.
+
+        Args:
+            query: Free-text query
+
+        Returns:
+            Dict[str, float]: Index term -> weight
+        """
+        weights: Dict[str, float] = {}
+        for term in tokenize(query):
+            if term in self._postings:
+                weights[term] = max(weights.get(term, 0.0), 1.0)
+                continue
+            for match in difflib.get_close_matches(term, self._vocabulary, n=2, cutoff=FUZZY_CUTOFF):
+                weights[match] = max(weights.get(match, 0.0), FUZZY_WEIGHT)
+        return weights
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        predicate: Optional[Callable[[Hashable], bool]] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Rank documents against a query.
+
+        Args:
+            query: Free-text query
+            top_k: Maximum number of results
+            predicate: Optional filter on document keys
+
+        Returns:
+            List[Tuple[Hashable, float]]: (key, score) pairs, best first
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        for term, weight in self.expand_query(query).items():
+            idf = self._idf[term]
+            for doc_id, count in self._postings[term]:
+                length_norm = 1 - self.b + self.b * self._lengths[doc_id] / (self._avg_length or 1)
+                scores[doc_id] += weight * idf * count * (self.k1 + 1) / (count + self.k1 * length_norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        results = []
+        for doc_id, score in ranked:
+            key = self.keys[doc_id]
+            if predicate is None or predicate(key):
+                results.append((key, round(score, 4)))
+                if len(results) >= top_k:
+                    break
+        return results
+
@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.utils.config import Config
+
+
+@pytest.fixture(autouse=True)
+def no_checkpoints(monkeypatch):
+    """Keep review runs from reading or writing checkpoints under data/output unless a test opts in."""
+    monkeypatch.setattr(Config, "CHECKPOINTS_ENABLED", False)
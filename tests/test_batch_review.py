@@ -0,0 +1,174 @@
+"""Tests for batch reviews and the shared LLM rate limiter."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.crews import batch_review
+from src.crews.batch_review import discover_batch_items, infer_grade_level, run_batch_review
+from src.models import BatchSummary, FinalReviewReport, LeafReviewResults, ReviewRunResult
+from src.utils.rate_limit import RateLimiter
+
+DELAY = 0.2
+
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def write_series(folder: Path) -> None:
+    for grade in ("K", "1", "2"):
+        (folder / f"grade{grade}").mkdir()
+        (folder / f"grade{grade}" / "unit1.txt").write_text(f"Grade {grade} Unit 1\n\nLesson 1: Counting\n")
+    (folder / "notes.csv").write_text("not a curriculum")
+
+
+@pytest.fixture
+def fake_review(monkeypatch):
+    """Replace the review with a fixed delay; content containing FLAKY fails once."""
+    state = {"running": 0, "peak": 0, "calls": []}
+    lock = threading.Lock()
+
+    def run(content, grade_level, curriculum_title=None, **kwargs):
+        with lock:
+            state["calls"].append(content)
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            flaky = "FLAKY" in content and state["calls"].count(content) == 1
+        time.sleep(DELAY)
+        with lock:
+            state["running"] -= 1
+        if flaky or "BROKEN" in content:
+            raise RuntimeError("rate limited")
+        title = curriculum_title or content.splitlines()[0]
+        report = FinalReviewReport(
+            curriculum_title=title, grade_level=grade_level, overall_rating=75,
+            standards_alignment_score=75, content_quality_score=75, pedagogical_score=75,
+            equity_score=75, assessment_score=75,
+            executive_summary="Solid.", recommendation_summary="Add practice.",
+        )
+        return ReviewRunResult(
+            curriculum_title=title, grade_level=grade_level, report=report,
+            leaf_results=LeafReviewResults(grade_level=grade_level),
+            token_usage={"total_tokens": 50},
+        )
+
+    monkeypatch.setattr(batch_review, "run_concurrent_review", run)
+    return state
+
+
+def test_grade_level_is_inferred_from_names():
+    assert infer_grade_level(Path("series/Grade-3/unit1.pdf")) == "3"
+    assert infer_grade_level(Path("series/kindergarten/unit1.pdf")) == "K"
+    assert infer_grade_level(Path("math_g5_workbook.docx")) == "5"
+    assert infer_grade_level(Path("algebra1.pdf")) is None
+
+
+def test_discover_directory_and_manifest(tmp_path):
+    write_series(tmp_path)
+    items = discover_batch_items(tmp_path)
+    assert [(item.path.parent.name, item.grade_level) for item in items] == [
+        ("grade1", "1"), ("grade2", "2"), ("gradeK", "K"),
+    ]
+
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"items": [
+        "grade1/unit1.txt", {"path": "grade2/unit1.txt", "grade_level": "4", "title": "Custom"},
+    ]}))
+    items = discover_batch_items(manifest)
+    assert items[0].path == tmp_path / "grade1" / "unit1.txt"
+    assert items[1].grade_level == "4" and items[1].title == "Custom"
+
+
+def test_batch_runs_items_concurrently_and_writes_index(tmp_path, fake_review):
+    write_series(tmp_path)
+    items = discover_batch_items(tmp_path)
+    output = tmp_path / "out"
+
+    started = time.perf_counter()
+    summary = run_batch_review(items, output, max_workers=3, requests_per_minute=0)
+    elapsed = time.perf_counter() - started
+
+    assert fake_review["peak"] == 3
+    assert elapsed < DELAY * 2.5
+    assert summary.count("completed") == 3
+    index = BatchSummary.model_validate_json((output / "index.json").read_text())
+    assert index.finished_at is not None
+    for item in index.items:
+        report = FinalReviewReport.model_validate_json(Path(item.report_path).read_text())
+        assert report.grade_level == item.grade_level
+        assert item.token_usage == {"total_tokens": 50}
+
+
+def test_failed_items_are_retried_and_isolated(tmp_path, fake_review):
+    (tmp_path / "grade3_flaky.txt").write_text("FLAKY grade 3")
+    (tmp_path / "grade4_broken.txt").write_text("BROKEN grade 4")
+    (tmp_path / "unlabelled.txt").write_text("No grade here")
+
+    summary = run_batch_review(
+        discover_batch_items(tmp_path), tmp_path / "out", max_workers=3, max_retries=1,
+        requests_per_minute=0, retry_delay=0,
+    )
+
+    results = {Path(item.source).name: item for item in summary.items}
+    assert results["grade3_flaky.txt"].status == "completed"
+    assert results["grade3_flaky.txt"].attempts == 2
+    assert results["grade4_broken.txt"].status == "failed"
+    assert results["grade4_broken.txt"].attempts == 2
+    assert results["grade4_broken.txt"].error == "rate limited"
+    assert "No grade level" in results["unlabelled.txt"].error
+
+
+def test_batch_resumes_from_index(tmp_path, fake_review):
+    write_series(tmp_path)
+    items = discover_batch_items(tmp_path)
+    output = tmp_path / "out"
+    run_batch_review(items[:2], output, max_workers=2, requests_per_minute=0)
+    fake_review["calls"].clear()
+
+    summary = run_batch_review(items, output, max_workers=2, requests_per_minute=0)
+
+    assert len(fake_review["calls"]) == 1
+    assert summary.count("completed") == 3
+
+    run_batch_review(items, output, max_workers=2, requests_per_minute=0, resume=False)
+    assert len(fake_review["calls"]) == 4
+
+
+def test_rate_limiter_spaces_requests_after_burst():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=120, burst=2, clock=clock, sleep=clock.sleep)
+
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.5)
+    assert waits[3] == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_rate_limiter_is_shared_across_threads():
+    limiter = RateLimiter(requests_per_minute=600, burst=1)
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(4)]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One request immediately, then one every 0.1s
+    assert time.perf_counter() - started >= 0.28
+    assert RateLimiter(0).acquire() == 0.0
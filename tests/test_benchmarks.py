@@ -0,0 +1,75 @@
+"""Tests for the benchmark runner."""
+
+import copy
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.runner import (
+    compare_results,
+    latest_results,
+    param_cases,
+    run_benchmarks,
+    save_results,
+    time_case,
+)
+
+
+class Squares:
+    params = [[1, 2], ["a", "b"]]
+
+    def setup(self, size, label):
+        if label == "b":
+            raise NotImplementedError("label b unavailable")
+        self.values = list(range(size * 100))
+
+    def time_square(self, size, label):
+        [value * value for value in self.values]
+
+
+def test_cases_cover_the_parameter_grid():
+    assert param_cases(Squares) == [(1, "a"), (1, "b"), (2, "a"), (2, "b")]
+    assert time_case(Squares, "time_square", (1, "b"), repeat=3, min_time=0) == {
+        "skipped": "label b unavailable"
+    }
+
+    timing = time_case(Squares, "time_square", (2, "a"), repeat=3, min_time=0.01)
+    assert timing["repeat"] == 3
+    assert 0 < timing["min"] <= timing["median"]
+    assert timing["number"] * timing["min"] < 1
+
+
+def test_run_saves_results_and_flags_regressions(tmp_path):
+    run = run_benchmarks("models.LargeReportValidation.*", repeat=2, min_time=0, quiet=True)
+    assert set(run["results"]) == {
+        "models.LargeReportValidation.time_dump_json", "models.LargeReportValidation.time_validate_json",
+    }
+    assert set(run["results"]["models.LargeReportValidation.time_dump_json"]) == {"(10)", "(100)", "(1000)"}
+
+    first = save_results(run, tmp_path)
+    slower = copy.deepcopy(run)
+    slower["created_at"] = "2999-01-01T00:00:00"
+    for cases in slower["results"].values():
+        cases["(1000)"]["median"] *= 3
+    second = save_results(slower, tmp_path)
+
+    assert latest_results(run["machine"]["name"], tmp_path) == second
+    assert latest_results(run["machine"]["name"], tmp_path, exclude=second) == first
+    rows = compare_results(run, slower)
+    assert [row["status"] for row in rows[:2]] == ["regression", "regression"]
+    assert all(row["case"] == "(1000)" for row in rows[:2])
+    assert {row["status"] for row in rows[2:]} == {"same"}
+
+
+def test_cli_fails_on_regression_against_a_baseline(tmp_path, capsys):
+    baseline = run_benchmarks("models.OutputValidation.time_dump_json", repeat=1, min_time=0, quiet=True)
+    for cases in baseline["results"].values():
+        for timing in cases.values():
+            timing["median"] /= 1000
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(baseline))
+
+    status = main(["-b", "models.OutputValidation.time_dump_json", "--quick", "--no-save",
+                   "--compare-to", str(baseline_path), "--fail-on-regression"])
+
+    assert status == 1
+    assert "regression" in capsys.readouterr().out
@@ -0,0 +1,128 @@
+"""Tests for per-task checkpoints and resuming review runs."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from crewai import CrewOutput
+
+from src.crews import concurrent_review, leaf_tasks
+from src.crews.concurrent_review import run_concurrent_review
+from src.crews.review_pipeline import run_review_pipeline
+from src.models import FinalReviewReport, LEAF_TASK_NAMES, MathPracticesOutput
+from src.utils.checkpoints import CheckpointStore
+from src.utils.config import Config
+
+from .test_concurrent_review import make_output
+from .test_review_pipeline import CURRICULUM
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "CHECKPOINTS_ENABLED", True)
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path)
+    return tmp_path / "runs"
+
+
+@pytest.fixture
+def fake_crews(monkeypatch):
+    """Record leaf and synthesis calls; leaf tasks named in ``failing`` raise."""
+    state = {"leaf_calls": [], "synthesis_calls": 0, "failing": set()}
+
+    def run_leaf(name, curriculum_content, grade_level, llm=None, verbose=False, **task_kwargs):
+        state["leaf_calls"].append(name)
+        if name in state["failing"]:
+            raise RuntimeError("connection reset")
+        return CrewOutput(raw="", pydantic=make_output(name))
+
+    def run_synthesis(leaf_results, curriculum_title, llm=None, verbose=False):
+        state["synthesis_calls"] += 1
+        report = FinalReviewReport(
+            curriculum_title=curriculum_title, grade_level="3", overall_rating=70,
+            standards_alignment_score=70, content_quality_score=70, pedagogical_score=70,
+            equity_score=70, assessment_score=70,
+            executive_summary="Solid.", recommendation_summary="Add practice.",
+        )
+        return CrewOutput(raw="", pydantic=report)
+
+    monkeypatch.setattr(leaf_tasks, "run_leaf_task", run_leaf)
+    monkeypatch.setattr(concurrent_review, "run_synthesis", run_synthesis)
+    return state
+
+
+def test_store_round_trip_and_invalidation(tmp_path):
+    store = CheckpointStore.for_curriculum(CURRICULUM, "3", root=tmp_path)
+    output = make_output("math_practices", 72.0)
+
+    store.save("math_practices", "1", output, CURRICULUM)
+
+    assert store.run_dir.name.endswith("_grade3")
+    assert store.load("math_practices", "1", MathPracticesOutput, CURRICULUM) == output
+    assert store.load("math_practices", "2", MathPracticesOutput, CURRICULUM) is None
+    assert store.load("math_practices", "1", MathPracticesOutput, CURRICULUM + "edited") is None
+    assert CheckpointStore.for_curriculum(CURRICULUM, "4", root=tmp_path).run_dir != store.run_dir
+    assert store.clear() == 1
+
+
+def test_discard_treats_only_star_as_a_wildcard(tmp_path):
+    store = CheckpointStore.for_curriculum(CURRICULUM, "3", root=tmp_path)
+    output = make_output("math_practices")
+    for key in ("math_practices[2]", "math_practices2", "equity_review@ab12", "math_practices@ab12"):
+        store.save(key, "1", output)
+
+    assert store.discard("math_practices[2]") == 1
+    assert store.load("math_practices2", "1", MathPracticesOutput) == output
+    assert store.discard("*@ab12") == 2
+    assert sorted(path.name for path in store.run_dir.iterdir()) == ["math_practices2.v1.json"]
+
+
+def test_hit_and_miss_counts_are_thread_safe(tmp_path):
+    store = CheckpointStore.for_curriculum(CURRICULUM, "3", root=tmp_path)
+    store.save("math_practices", "1", make_output("math_practices"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda task: store.load(task, "1", MathPracticesOutput),
+                          ["math_practices", "equity_review"] * 100))
+
+    assert (store.hits, store.misses) == (100, 100)
+
+
+def test_rerun_resumes_at_failed_task(checkpoint_dir, fake_crews):
+    fake_crews["failing"] = {"equity_review"}
+    first = run_concurrent_review(CURRICULUM, "3")
+    assert "equity_review" in first.leaf_results.failures
+    assert sorted(fake_crews["leaf_calls"]) == sorted(LEAF_TASK_NAMES)
+
+    fake_crews.update(leaf_calls=[], synthesis_calls=0, failing=set())
+    second = run_concurrent_review(CURRICULUM, "3")
+    assert fake_crews["leaf_calls"] == ["equity_review"]
+    assert fake_crews["synthesis_calls"] == 1
+    assert set(second.leaf_results.completed_tasks()) == set(LEAF_TASK_NAMES)
+
+    fake_crews.update(leaf_calls=[], synthesis_calls=0)
+    third = run_concurrent_review(CURRICULUM, "3")
+    assert fake_crews["leaf_calls"] == []
+    assert fake_crews["synthesis_calls"] == 0
+    assert third.report.overall_rating == second.report.overall_rating
+
+    run_concurrent_review(CURRICULUM, "3", fresh=True)
+    assert len(fake_crews["leaf_calls"]) == len(LEAF_TASK_NAMES)
+
+
+def test_dag_pipeline_uses_checkpoints(checkpoint_dir, fake_crews):
+    fake_crews["failing"] = {"math_practices"}
+    first = run_review_pipeline(CURRICULUM, "3")
+    assert first.report is not None
+    assert "math_practices" in first.leaf_results.failures
+    assert fake_crews["synthesis_calls"] == 1
+
+    fake_crews.update(leaf_calls=[], failing=set())
+    second = run_review_pipeline(CURRICULUM, "3")
+    assert fake_crews["leaf_calls"] == ["math_practices"]
+    assert fake_crews["synthesis_calls"] == 2
+    assert second.report is not None
+    assert second.report.review_metadata["mode"] == "dag"
+
+
+def test_checkpoints_can_be_disabled(checkpoint_dir, fake_crews):
+    run_concurrent_review(CURRICULUM, "3", checkpoint=False)
+    assert not checkpoint_dir.exists()
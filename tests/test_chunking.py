@@ -0,0 +1,106 @@
+"""Tests for token-budgeted chunking and merging of per-chunk outputs."""
+
+from pathlib import Path
+
+import pytest
+
+from src.crews.reducers import merge_outputs
+from src.models import GradeLevelCheckOutput, MathPracticesOutput
+from src.utils.chunking import chunk_curriculum, count_tokens, segment_blocks
+
+SAMPLE_PATH = Path(__file__).resolve().parent.parent / "data" / "input" / "sample_grade3_curriculum.txt"
+
+
+@pytest.fixture
+def sample_text():
+    return SAMPLE_PATH.read_text(encoding="utf-8")
+
+
+def test_whole_document_fits_one_chunk(sample_text):
+    chunks = chunk_curriculum(sample_text, max_tokens=100_000)
+
+    assert len(chunks) == 1
+    assert chunks[0].text == sample_text.rstrip("\n")
+
+
+def test_chunks_respect_budget_and_lesson_boundaries(sample_text):
+    chunks = chunk_curriculum(sample_text, max_tokens=150)
+    lines = sample_text.splitlines()
+
+    assert len(chunks) > 1
+    assert all(chunk.token_count <= 150 for chunk in chunks)
+    assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+    # Chunks are contiguous and start on a heading
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.start_line == previous.end_line + 1
+        assert lines[chunk.start_line - 1].startswith("#")
+    assert any("Lesson 3" in chunk.label for chunk in chunks)
+
+
+def test_oversized_lesson_is_split():
+    body = "\n\n".join(f"Paragraph {i}: " + "count the equal groups " * 10 for i in range(20))
+    text = f"## Unit 1: Groups\n\n### Lesson 1: Equal Groups\n\n{body}\n"
+
+    chunks = chunk_curriculum(text, max_tokens=120)
+
+    assert len(chunks) > 2
+    assert all(count_tokens(chunk.text) <= 120 for chunk in chunks)
+    assert "Paragraph 19" in chunks[-1].text
+
+
+def test_merge_outputs_weights_scores_and_unions_lists():
+    first = GradeLevelCheckOutput(
+        grade_level="3", appropriateness_score=90, scaffolding_quality="Excellent",
+        appropriate_topics=["Multiplication as equal groups"], recommendations=["Add visuals"]
+    )
+    second = GradeLevelCheckOutput(
+        grade_level="3", appropriateness_score=60, scaffolding_quality="Fair",
+        too_advanced_topics=["Long division"], recommendations=["add visuals.", "Slow pacing"]
+    )
+
+    merged = merge_outputs(GradeLevelCheckOutput, [first, second], weights=[3, 1])
+
+    assert merged.appropriateness_score == pytest.approx(82.5)
+    assert merged.scaffolding_quality == "Good"
+    assert merged.recommendations == ["Add visuals", "Slow pacing"]
+    assert merged.too_advanced_topics == ["Long division"]
+    assert merged.grade_level == "3"
+
+
+def test_merge_outputs_merges_dicts_per_key():
+    first = MathPracticesOutput(
+        overall_score=70, practice_scores={"MP1": 80, "MP2": 60},
+        practice_opportunities={"MP1": ["Lesson 1 word problems"]}
+    )
+    second = MathPracticesOutput(
+        overall_score=50, practice_scores={"MP1": 40, "MP4": 90},
+        practice_opportunities={"MP1": ["Lesson 3 challenge"], "MP4": ["Fraction strips"]}
+    )
+
+    merged = merge_outputs(MathPracticesOutput, [first, second])
+
+    assert merged.overall_score == 60
+    assert merged.practice_scores == {"MP1": 60, "MP2": 60, "MP4": 90}
+    assert merged.practice_opportunities["MP1"] == ["Lesson 1 word problems", "Lesson 3 challenge"]
+
+
+def test_merge_outputs_requires_outputs():
+    with pytest.raises(ValueError):
+        merge_outputs(GradeLevelCheckOutput, [])
+
+
+def test_segments_are_one_per_lesson(sample_text):
+    segments = segment_blocks(sample_text, max_tokens=100_000)
+
+    assert [segment.label for segment in segments][:3] == [
+        "Unit 1 > Lesson 1", "Unit 1 > Lesson 2", "Unit 2 > Lesson 3",
+    ]
+    # The title and unit headings are joined to the lesson after them
+    assert segments[0].start_line == 1
+    assert segments[2].text.startswith("## Unit 2")
+    # Segments cover every line in order; trailing blank lines are not part of a lesson's text
+    lines = sample_text.splitlines()
+    assert all(first.end_line + 1 == second.start_line for first, second in zip(segments, segments[1:]))
+    assert segments[-1].end_line == len(lines)
+    for segment in segments:
+        assert segment.text == "\n".join(lines[segment.start_line - 1:segment.end_line]).rstrip()
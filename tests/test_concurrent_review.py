@@ -0,0 +1,113 @@
+"""Tests for concurrent execution of the leaf specialist tasks."""
+
+import time
+
+import pytest
+from crewai import CrewOutput
+
+from src.crews import leaf_tasks
+from src.crews.leaf_tasks import LEAF_TASKS, LeafJob, run_leaf_jobs
+from src.crews.map_reduce_review import run_map_reduce_review
+from src.models import CandidateCoverageMap, GradeLevelCheckOutput, LEAF_TASK_NAMES
+from src.utils.chunking import chunk_curriculum
+from src.utils.standards_alignment import match_curriculum_to_standards
+
+DELAY = 0.3
+
+
+def make_output(name, score=80.0):
+    """Build a valid output for a leaf task with every score set to ``score``."""
+    model = LEAF_TASKS[name].output_model
+    values = {
+        field: score for field, info in model.model_fields.items()
+        if info.is_required() and info.annotation is float
+    }
+    if model is GradeLevelCheckOutput:
+        values.update(grade_level="3", scaffolding_quality="Good")
+    return model(**values)
+
+
+@pytest.fixture
+def slow_leaf_task(monkeypatch):
+    """Replace the crew run with a fixed delay so timing reflects scheduling only."""
+    calls = []
+
+    def run(name, curriculum_content, grade_level, llm=None, verbose=False, **task_kwargs):
+        calls.append((name, curriculum_content))
+        if "FAIL" in curriculum_content and name == "equity_review":
+            raise RuntimeError("rate limited")
+        time.sleep(DELAY)
+        score = 90.0 if "Excerpt 1 of" in curriculum_content else 60.0
+        return CrewOutput(raw="", pydantic=make_output(name, score))
+
+    monkeypatch.setattr(leaf_tasks, "run_leaf_task", run)
+    return calls
+
+
+def test_leaf_jobs_run_concurrently(slow_leaf_task):
+    jobs = [LeafJob(name, 0, "Document", "Lesson text") for name in LEAF_TASK_NAMES]
+
+    started = time.perf_counter()
+    outputs, failures, timings, _ = run_leaf_jobs(jobs, "3", max_workers=5)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < DELAY * 2.5
+    assert set(outputs) == set(LEAF_TASK_NAMES)
+    assert not failures
+    assert set(timings) == set(LEAF_TASK_NAMES)
+
+
+def test_worker_limit_bounds_concurrency(slow_leaf_task):
+    jobs = [LeafJob(name, 0, "Document", "Lesson text") for name in LEAF_TASK_NAMES[:2]]
+
+    started = time.perf_counter()
+    run_leaf_jobs(jobs, "3", max_workers=1)
+
+    assert time.perf_counter() - started >= DELAY * 2
+
+
+def test_failures_do_not_stop_other_tasks(slow_leaf_task):
+    results = run_map_reduce_review("FAIL\nLesson text", "3", max_tokens=10_000, max_workers=5)
+
+    assert results.equity_review is None
+    assert results.failures["equity_review"] == ["Front matter: rate limited"]
+    assert "equity_review" not in results.completed_tasks()
+    assert len(results.completed_tasks()) == 4
+
+
+def test_map_reduce_merges_chunk_outputs(slow_leaf_task):
+    text = "## Unit 1: Groups\n" + "equal groups " * 40 + "\n## Unit 2: Fractions\n" + "unit fractions " * 40
+
+    results = run_map_reduce_review(text, "3", task_names=["grade_level_check"], max_tokens=150)
+
+    assert len(results.chunks) == 2
+    assert len(slow_leaf_task) == 2
+    assert 60 < results.grade_level_check.appropriateness_score < 90
+    assert set(results.timings) == {"grade_level_check[0]", "grade_level_check[1]"}
+
+
+def test_grade_level_checks_get_a_coverage_map_of_their_own_chunk(monkeypatch):
+    kwargs = {}
+
+    def run(name, curriculum_content, grade_level, llm=None, verbose=False, **task_kwargs):
+        kwargs.setdefault(name, []).append(task_kwargs)
+        return CrewOutput(raw="", pydantic=make_output(name))
+
+    monkeypatch.setattr(leaf_tasks, "run_leaf_task", run)
+    text = "## Unit 1: Groups\n" + "equal groups " * 40 + "\n## Unit 2: Fractions\n" + "unit fractions " * 40
+
+    run_map_reduce_review(text, "3", max_tokens=150)
+
+    coverage = [call["candidate_alignment"] for call in kwargs["grade_level_check"]]
+    expected = [match_curriculum_to_standards(chunk.text, grade_level="3")
+                for chunk in chunk_curriculum(text, 150)]
+    assert len(coverage) == 2
+    assert all(isinstance(item, CandidateCoverageMap) for item in coverage)
+    assert sorted(item.model_dump_json() for item in coverage) == sorted(item.model_dump_json() for item in expected)
+    assert coverage[0] != coverage[1]
+    assert all(call == {} for call in kwargs["math_practices"])
+
+
+def test_unknown_task_rejected():
+    with pytest.raises(ValueError, match="Unknown leaf tasks"):
+        run_map_reduce_review("text", "3", task_names=["spelling"])
@@ -0,0 +1,96 @@
+"""Tests for shared curriculum contexts and the Curriculum Reader tool."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.agents.equity_reviewer import create_equity_reviewer_agent
+from src.tasks import create_equity_review_task, create_math_practices_task
+from src.tools.curriculum_reader import CurriculumReaderTool
+from src.utils.curriculum_context import (
+    CurriculumRegistry,
+    curriculum_registry,
+    register_curriculum,
+    registered_curricula,
+)
+
+SAMPLE_PATH = Path(__file__).resolve().parent.parent / "data" / "input" / "sample_grade3_curriculum.txt"
+
+
+@pytest.fixture
+def registry():
+    return CurriculumRegistry()
+
+
+@pytest.fixture
+def context(registry):
+    return registry.register(SAMPLE_PATH.read_text(encoding="utf-8"), grade_level="3")
+
+
+def test_register_reuses_context_for_identical_text(registry, context):
+    again = registry.register(context.content)
+
+    assert again is context
+    assert context.context_id.startswith("cur-")
+    assert len(registry) == 1
+
+
+def test_context_is_dropped_when_its_last_holder_releases_it(registry, context):
+    registry.register(context.content)
+
+    registry.release(context.context_id)
+    assert context.context_id in registry
+    registry.release(context.context_id)
+    assert context.context_id not in registry
+    assert len(registry) == 0
+
+
+def test_registered_curricula_releases_contexts_on_exit():
+    with pytest.raises(RuntimeError):
+        with registered_curricula():
+            context = register_curriculum("Lesson 1: Arrays\nStudents build arrays.", "3")
+            assert context.context_id in curriculum_registry
+            raise RuntimeError("run failed")
+
+    assert context.context_id not in curriculum_registry
+
+
+def test_read_selectors(context):
+    assert context.read("lesson 3").startswith("### Lesson 3: Introduction to Fractions")
+    assert context.read("unit 1").startswith("## Unit 1")
+    assert context.read("full") == context.content
+    assert context.read("lines 1-2") == "\n".join(context.content.splitlines()[:2])
+    assert "Assessment" in context.read("assessment")
+    assert "Lesson 2: Division as Fair Sharing" in context.read()
+    assert context.read("lesson 99") is None
+
+
+def test_reader_tool(registry, context):
+    tool = CurriculumReaderTool(registry=registry)
+
+    result = json.loads(tool._run(f"{context.context_id}|lesson 1"))
+    assert result["success"]
+    assert result["content"].startswith("### Lesson 1")
+
+    missing = json.loads(tool._run("cur-0000000000000000|lesson 1"))
+    assert not missing["success"]
+
+    unmatched = json.loads(tool._run(f"{context.context_id}|chapter nine"))
+    assert not unmatched["success"]
+    assert "Unit 1" in unmatched["outline"]
+
+
+def test_tasks_reference_context_instead_of_inlining(context):
+    agent = create_equity_reviewer_agent()
+    lesson_text = context.read("lesson 1")
+
+    inline = create_equity_review_task(agent, context.content, "3")
+    referenced = create_equity_review_task(agent, context, "3")
+    practices = create_math_practices_task(agent, context, "3")
+
+    assert lesson_text in inline.description
+    for task in (referenced, practices):
+        assert lesson_text not in task.description
+        assert context.context_id in task.description
+        assert {tool.name for tool in task.tools} == {"Document Analyzer", "Curriculum Reader"}
@@ -0,0 +1,206 @@
+"""Tests for the Document Analyzer tool and its extraction cache."""
+
+import json
+
+import pytest
+
+from src.tools.document_analyzer import DocumentAnalyzerTool, parse_page_range
+from src.utils.extraction_cache import ExtractionCache
+from src.utils.pdf_extraction import extract_pdf_pages, shard_page_range
+
+from .helpers import make_pdf
+
+
+def make_tool(tmp_path, **cache_kwargs):
+    cache = ExtractionCache(cache_dir=tmp_path / "cache", **cache_kwargs)
+    return DocumentAnalyzerTool(extraction_cache=cache), cache
+
+
+def test_repeated_calls_hit_cache(tmp_path):
+    doc = tmp_path / "lesson.txt"
+    doc.write_text("Lesson 1: Multiplication as equal groups", encoding="utf-8")
+    tool, cache = make_tool(tmp_path)
+
+    first = json.loads(tool._run(str(doc)))
+    second = json.loads(tool._run(str(doc)))
+
+    assert first["content"] == second["content"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["disk_entries"] == 1
+
+
+def test_cache_is_keyed_by_content_not_path(tmp_path):
+    original = tmp_path / "a.md"
+    copy = tmp_path / "b.md"
+    original.write_text("# Unit 1", encoding="utf-8")
+    copy.write_text("# Unit 1", encoding="utf-8")
+    tool, cache = make_tool(tmp_path)
+
+    tool._run(str(original))
+    result = json.loads(tool._run(str(copy)))
+
+    assert result["file_name"] == "b.md"
+    assert cache.stats()["hits"] == 1
+
+
+def test_changed_file_misses_cache(tmp_path):
+    doc = tmp_path / "lesson.txt"
+    doc.write_text("version one", encoding="utf-8")
+    tool, _ = make_tool(tmp_path)
+    tool._run(str(doc))
+
+    doc.write_text("version two, edited", encoding="utf-8")
+    result = json.loads(tool._run(str(doc)))
+
+    assert result["content"] == "version two, edited"
+
+
+def test_cache_persists_across_instances(tmp_path):
+    doc = tmp_path / "lesson.txt"
+    doc.write_text("Fractions on a number line", encoding="utf-8")
+    make_tool(tmp_path)[0]._run(str(doc))
+
+    tool, cache = make_tool(tmp_path)
+    tool._run(str(doc))
+
+    assert cache.stats()["hits"] == 1
+
+
+def test_lru_eviction_by_entry_count(tmp_path):
+    tool, cache = make_tool(tmp_path, max_entries=2)
+    for i in range(3):
+        doc = tmp_path / f"doc{i}.txt"
+        doc.write_text(f"document {i}", encoding="utf-8")
+        tool._run(str(doc))
+
+    assert cache.stats()["disk_entries"] == 2
+
+
+def test_unsupported_type_is_reported(tmp_path):
+    doc = tmp_path / "slides.ppt"
+    doc.write_bytes(b"binary")
+    tool, _ = make_tool(tmp_path)
+
+    result = json.loads(tool._run(str(doc)))
+
+    assert result["success"] is False
+    assert "Unsupported file type" in result["error"]
+
+
+def test_failed_extraction_is_reported_and_not_cached(tmp_path):
+    doc = tmp_path / "broken.pdf"
+    doc.write_bytes(b"not a pdf")
+    tool, cache = make_tool(tmp_path)
+
+    result = json.loads(tool._run(str(doc)))
+
+    assert result["success"] is False
+    assert result["error"].startswith("Error extracting PDF")
+    assert cache.stats()["disk_entries"] == 0
+
+
+def test_cached_pdf_keeps_metadata(tmp_path):
+    pdf = make_pdf(tmp_path / "book.pdf", ["alpha", "beta", "gamma"])
+    tool, cache = make_tool(tmp_path)
+    tool._run(f"{pdf}#pages=2")
+
+    result = json.loads(make_tool(tmp_path)[0]._run(f"{pdf}#pages=2"))
+
+    assert result["metadata"]["page_count"] == 3
+    assert result["metadata"]["size_bytes"] == pdf.stat().st_size
+    assert cache.stats()["disk_entries"] == 1
+
+
+def test_pdf_page_range_query(tmp_path):
+    pdf = make_pdf(tmp_path / "book.pdf", [f"Page text {i}" for i in range(1, 6)])
+    tool, _ = make_tool(tmp_path)
+
+    result = json.loads(tool._run(f"{pdf}#pages=2-3"))
+
+    assert result["success"] is True
+    assert "--- Page 2 ---" in result["content"]
+    assert "--- Page 3 ---" in result["content"]
+    assert "Page text 4" not in result["content"]
+    assert result["metadata"]["pages"] == "2-3"
+
+
+def test_iter_content_yields_pdf_pages_in_order(tmp_path):
+    pdf = make_pdf(tmp_path / "book.pdf", ["alpha", "beta", "gamma"])
+    tool, _ = make_tool(tmp_path)
+
+    chunks = list(tool.iter_content(str(pdf), pages=parse_page_range("2-")))
+
+    assert chunks == ["--- Page 2 ---\nbeta", "--- Page 3 ---\ngamma"]
+
+
+@pytest.mark.parametrize("name", ["notes.txt", "notes.md"])
+def test_iter_content_yields_text_file_content(tmp_path, name):
+    text = "# Unit 1\nLesson 1: Fractions"
+    path = tmp_path / name
+    path.write_text(text)
+    tool, _ = make_tool(tmp_path)
+
+    assert list(tool.iter_content(str(path))) == [text]
+
+
+def test_page_range_rejected_for_text_files(tmp_path):
+    doc = tmp_path / "lesson.txt"
+    doc.write_text("text", encoding="utf-8")
+    tool, _ = make_tool(tmp_path)
+
+    result = json.loads(tool._run(f"{doc}#pages=1-2"))
+
+    assert result["success"] is False
+    with pytest.raises(ValueError, match="only supported for PDF"):
+        list(tool.iter_content(str(doc), pages=(1, 2)))
+
+
+def test_shard_page_range_covers_range_in_order():
+    shards = shard_page_range(3, 12, 4)
+
+    assert shards[0][0] == 3 and shards[-1][1] == 12
+    assert all(a[1] + 1 == b[0] for a, b in zip(shards, shards[1:]))
+
+
+def test_parallel_pdf_extraction_matches_serial(tmp_path):
+    pdf = make_pdf(tmp_path / "book.pdf", [f"Lesson {i}" for i in range(1, 13)])
+
+    serial = extract_pdf_pages(pdf, workers=1)
+    parallel = extract_pdf_pages(pdf, workers=2, min_parallel_pages=4)
+
+    assert parallel == serial
+    assert len(parallel) == 12
+
+
+def test_compact_output_has_no_whitespace_padding(tmp_path):
+    doc = tmp_path / "lesson.txt"
+    doc.write_text("Fractions × number lines", encoding="utf-8")
+    cache = ExtractionCache(cache_dir=tmp_path / "cache")
+    tool = DocumentAnalyzerTool(extraction_cache=cache, compact_output=True)
+
+    output = tool._run(str(doc))
+
+    assert "\n" not in output
+    assert json.loads(output)["content"] == "Fractions × number lines"
+    assert len(output) < len(DocumentAnalyzerTool(extraction_cache=cache)._run(str(doc)))
+
+
+def test_content_by_reference_round_trip(tmp_path):
+    doc = tmp_path / "lesson.txt"
+    doc.write_text("Unit 1 " * 500, encoding="utf-8")
+    tool = DocumentAnalyzerTool(extraction_cache=None, content_by_reference=True)
+
+    result = json.loads(tool._run(str(doc)))
+    resolved = json.loads(tool._run(result["content_handle"]))
+
+    assert "content" not in result
+    assert len(result["preview"]) < result["length"]
+    assert resolved["content"] == doc.read_text(encoding="utf-8")
+
+
+def test_unknown_handle_is_reported(tmp_path):
+    tool = DocumentAnalyzerTool(extraction_cache=None)
+
+    result = json.loads(tool._run("doc-0000000000000000"))
+
+    assert result["success"] is False
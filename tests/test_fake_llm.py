@@ -0,0 +1,125 @@
+"""Tests for the offline fake LLM."""
+
+import json
+import random
+
+import pytest
+
+from src.agents import create_grade_level_checker_agent
+from src.crews.concurrent_review import run_concurrent_review
+from src.crews.leaf_tasks import LEAF_TASKS, build_leaf_task
+from src.llms.factory import agent_memory_enabled, create_agent_llm
+from src.llms.fake_llm import FakeLLM, LatencyDistribution, sample_output
+from src.models import (
+    ContentQualityOutput,
+    FinalReviewReport,
+    GradeLevelCheckOutput,
+    LEAF_TASK_NAMES,
+    StandardsAlignmentOutput,
+)
+from src.utils.config import Config
+
+from .test_review_pipeline import CURRICULUM
+
+OUTPUT_MODELS = [spec.output_model for spec in LEAF_TASKS.values()] + [
+    StandardsAlignmentOutput, ContentQualityOutput, FinalReviewReport,
+]
+
+
+@pytest.mark.parametrize("model", OUTPUT_MODELS, ids=lambda model: model.__name__)
+def test_sampled_outputs_validate(model):
+    data = sample_output(model, random.Random(0), {"grade_level": "4"})
+
+    output = model.model_validate(data)
+
+    if "grade_level" in model.model_fields:
+        assert output.grade_level == "4"
+
+
+@pytest.mark.parametrize("spec, kind, params", [
+    ("0.5", "fixed", (0.5,)),
+    ("uniform:0.2,1.0", "uniform", (0.2, 1.0)),
+    ("lognormal:1.5,0.4", "lognormal", (1.5, 0.4)),
+    ("exponential:2", "exponential", (2.0,)),
+])
+def test_latency_specs_parse(spec, kind, params):
+    latency = LatencyDistribution.parse(spec)
+
+    assert (latency.kind, latency.params) == (kind, params)
+    assert all(latency.sample(random.Random(seed)) >= 0 for seed in range(20))
+
+
+@pytest.mark.parametrize("spec", ["gamma:1,2", "uniform:1", "normal:"])
+def test_bad_latency_specs_are_rejected(spec):
+    with pytest.raises(ValueError):
+        LatencyDistribution.parse(spec)
+
+
+def test_uniform_latency_stays_in_range():
+    latency = LatencyDistribution.parse("uniform:0.2,0.4")
+    rng = random.Random(1)
+
+    assert all(0.2 <= latency.sample(rng) <= 0.4 for _ in range(100))
+
+
+def test_call_returns_final_answer_and_tracks_usage():
+    llm = FakeLLM(
+        seed=3, canned={"GradeLevelCheckOutput": {"appropriateness_score": 55.0,
+                                                  "scaffolding_quality": "Fair for grade {grade_level}"}},
+    )
+    agent, task = build_leaf_task("grade_level_check", CURRICULUM, "4", llm=llm)
+
+    response = agent.llm.call(f"TARGET GRADE LEVEL: 4\n{CURRICULUM}", from_task=task)
+
+    assert response.startswith("Thought:")
+    output = GradeLevelCheckOutput.model_validate_json(response.split("Final Answer:", 1)[1])
+    assert output.appropriateness_score == 55.0
+    assert output.scaffolding_quality == "Fair for grade 4"
+    assert agent.llm.get_token_usage_summary().successful_requests == 1
+    assert llm.get_token_usage_summary().successful_requests == 0  # Agents get their own copy
+    assert not agent.memory
+
+
+def test_structured_calls_return_plain_json():
+    response = FakeLLM(seed=5).call("TARGET GRADE LEVEL: K", response_model=GradeLevelCheckOutput)
+
+    assert json.loads(response)["grade_level"] == "K"
+
+
+def test_config_switches_agents_to_fake_llm(monkeypatch):
+    monkeypatch.setattr(Config, "FAKE_LLM_ENABLED", True)
+    monkeypatch.setattr(Config, "FAKE_LLM_LATENCY", "uniform:0.1,0.2")
+
+    agent = create_grade_level_checker_agent(verbose=False)
+
+    assert isinstance(agent.llm, FakeLLM)
+    assert agent.llm.latency.kind == "uniform"
+    assert not agent.memory
+    assert not agent_memory_enabled()
+    assert create_agent_llm() is not agent.llm
+
+
+def test_full_review_runs_offline():
+    result = run_concurrent_review(CURRICULUM, "3", curriculum_title="Fractions",
+                                   llm=FakeLLM(seed=11), checkpoint=False)
+
+    assert set(result.leaf_results.completed_tasks()) == set(LEAF_TASK_NAMES)
+    assert result.report is not None
+    assert result.report.grade_level == "3"
+    assert result.report.pedagogical_analysis is not None
+    assert result.token_usage["successful_requests"] == len(LEAF_TASK_NAMES) + 1
+
+
+def test_seeded_outputs_do_not_depend_on_call_order():
+    def leaf_outputs():
+        result = run_concurrent_review(CURRICULUM, "3", curriculum_title="Fractions",
+                                       llm=FakeLLM(seed=1), checkpoint=False)
+        return {name: getattr(result.leaf_results, name).model_dump(exclude={'timestamp'})
+                for name in LEAF_TASK_NAMES}
+
+    assert leaf_outputs() == leaf_outputs()
+
+    llm = FakeLLM(seed=1)
+    first = llm.call("TARGET GRADE LEVEL: 3", response_model=GradeLevelCheckOutput)
+    llm.call("TARGET GRADE LEVEL: 5", response_model=GradeLevelCheckOutput)
+    assert FakeLLM(seed=1).call("TARGET GRADE LEVEL: 3", response_model=GradeLevelCheckOutput) == first
@@ -0,0 +1,124 @@
+"""Tests for incremental re-review of revised curricula."""
+
+import pytest
+from crewai import CrewOutput
+
+from src.crews import concurrent_review, leaf_tasks
+from src.crews.incremental_review import run_incremental_review
+from src.models import FinalReviewReport, LEAF_TASK_NAMES
+from src.utils.config import Config
+
+from .test_concurrent_review import make_output
+
+LESSONS = {
+    1: "Lesson 1: Unit Fractions\nStudents partition shapes into equal parts and name unit fractions.",
+    2: "Lesson 2: Fractions on a Number Line\nStudents place fractions on a number line.",
+    3: "Lesson 3: Equivalent Fractions\nStudents find equivalent fractions with models.",
+}
+
+
+def curriculum(lessons):
+    return "Unit 1: Fractions\n\n" + "\n\n".join(lessons) + "\n"
+
+
+@pytest.fixture
+def fake_crews(tmp_path, monkeypatch):
+    """Record which lesson every leaf call reviewed and its input, and count synthesis calls."""
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path)
+    state = {"leaf_calls": [], "leaf_inputs": {}, "synthesis_calls": 0}
+
+    def run_leaf(name, curriculum_content, grade_level, llm=None, verbose=False, **task_kwargs):
+        lesson = curriculum_content.split("Excerpt: ", 1)[1].split(".", 1)[0]
+        state["leaf_calls"].append((name, lesson))
+        alignment = task_kwargs.get("candidate_alignment")
+        state["leaf_inputs"][name, lesson] = (curriculum_content, alignment and alignment.to_prompt())
+        return CrewOutput(raw="", pydantic=make_output(name))
+
+    def run_synthesis(leaf_results, curriculum_title, llm=None, verbose=False):
+        state["synthesis_calls"] += 1
+        report = FinalReviewReport(
+            curriculum_title=curriculum_title, grade_level="3", overall_rating=70,
+            standards_alignment_score=70, content_quality_score=70, pedagogical_score=70,
+            equity_score=70, assessment_score=70,
+            executive_summary="Solid.", recommendation_summary="Add practice.",
+        )
+        return CrewOutput(raw="", pydantic=report)
+
+    monkeypatch.setattr(leaf_tasks, "run_leaf_task", run_leaf)
+    monkeypatch.setattr(concurrent_review, "run_synthesis", run_synthesis)
+    return state
+
+
+def test_one_lesson_edit_reruns_only_that_lesson(fake_crews):
+    first = run_incremental_review(curriculum(LESSONS.values()), "3", "unit1")
+    assert len(fake_crews["leaf_calls"]) == 3 * len(LEAF_TASK_NAMES)
+    assert first.segment_diff.previous_reviewed_at is None
+    assert len(first.segment_diff.added) == 3
+
+    fake_crews.update(leaf_calls=[], synthesis_calls=0)
+    edited = {**LESSONS, 2: LESSONS[2] + "\nStudents compare fractions with the same denominator."}
+    second = run_incremental_review(curriculum(edited.values()), "3", "unit1")
+
+    assert sorted(fake_crews["leaf_calls"]) == sorted((name, "Unit 1 > Lesson 2") for name in LEAF_TASK_NAMES)
+    assert fake_crews["synthesis_calls"] == 1
+    assert second.segment_diff.edited == ["Unit 1 > Lesson 2"]
+    assert second.segment_diff.unchanged == ["Unit 1 > Lesson 1", "Unit 1 > Lesson 3"]
+    assert set(second.leaf_results.completed_tasks()) == set(LEAF_TASK_NAMES)
+    assert second.report.review_metadata["changed_segments"] == "1"
+    assert second.profile.caches["checkpoints"].hits == 2 * len(LEAF_TASK_NAMES)
+
+    fake_crews.update(leaf_calls=[], synthesis_calls=0)
+    run_incremental_review(curriculum(edited.values()), "3", "unit1")
+    assert fake_crews["leaf_calls"] == []
+    assert fake_crews["synthesis_calls"] == 0
+
+
+def test_lesson_edit_leaves_other_grade_level_check_inputs_unchanged(fake_crews):
+    run_incremental_review(curriculum(LESSONS.values()), "3", "unit1")
+    before = dict(fake_crews["leaf_inputs"])
+
+    edited = {**LESSONS, 2: LESSONS[2] + "\nStudents compare fractions with the same denominator."}
+    run_incremental_review(curriculum(edited.values()), "3", "unit1", fresh=True)
+    after = fake_crews["leaf_inputs"]
+
+    for lesson in ("Unit 1 > Lesson 1", "Unit 1 > Lesson 3"):
+        content, alignment = after["grade_level_check", lesson]
+        assert alignment is not None and "Lesson 2" not in alignment
+        assert (content, alignment) == before["grade_level_check", lesson]
+    assert after["grade_level_check", "Unit 1 > Lesson 2"] != before["grade_level_check", "Unit 1 > Lesson 2"]
+
+
+def test_removed_lesson_outputs_are_discarded(fake_crews, tmp_path):
+    run_incremental_review(curriculum(LESSONS.values()), "3", "unit1")
+    store_dir = tmp_path / "incremental" / "unit1_grade3"
+    assert len(list(store_dir.glob("*@*.json"))) == 3 * len(LEAF_TASK_NAMES)
+
+    fake_crews.update(leaf_calls=[])
+    result = run_incremental_review(curriculum([LESSONS[1], LESSONS[3]]), "3", "unit1")
+
+    assert fake_crews["leaf_calls"] == []
+    assert result.segment_diff.removed == ["Unit 1 > Lesson 2"]
+    assert len(list(store_dir.glob("*@*.json"))) == 2 * len(LEAF_TASK_NAMES)
+
+
+def test_lesson_left_on_its_own_keeps_its_outputs(fake_crews):
+    run_incremental_review(curriculum([LESSONS[1], LESSONS[2]]), "3", "unit1")
+
+    fake_crews.update(leaf_calls=[])
+    result = run_incremental_review(curriculum([LESSONS[1]]), "3", "unit1")
+
+    assert fake_crews["leaf_calls"] == []
+    assert result.segment_diff.unchanged == ["Unit 1 > Lesson 1"]
+
+
+def test_fresh_and_other_documents_review_everything(fake_crews):
+    run_incremental_review(curriculum(LESSONS.values()), "3", "unit1")
+
+    fake_crews.update(leaf_calls=[])
+    run_incremental_review(curriculum(LESSONS.values()), "3", "unit1-copy")
+    assert len(fake_crews["leaf_calls"]) == 3 * len(LEAF_TASK_NAMES)
+
+    fake_crews.update(leaf_calls=[])
+    result = run_incremental_review(curriculum(LESSONS.values()), "3", "unit1", fresh=True)
+    assert len(fake_crews["leaf_calls"]) == 3 * len(LEAF_TASK_NAMES)
+    assert result.segment_diff.previous_reviewed_at is None
@@ -0,0 +1,42 @@
+"""
+Tests for lazy construction of the shared agent instances.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.agents as agents
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_import_constructs_no_agents():
+    script = (
+        "import sys, src.agents as agents\n"
+        "built = [name for name, module in agents._AGENT_MODULES.items()\n"
+        "         if name in vars(sys.modules['src.agents' + module])]\n"
+        "print(','.join(built))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_agent_created_once_on_first_access():
+    from src.agents import equity_reviewer
+
+    first = agents.equity_reviewer_agent
+    assert first is agents.equity_reviewer_agent
+    assert first is equity_reviewer.equity_reviewer_agent
+    assert first.role == equity_reviewer.create_equity_reviewer_agent().role
+
+
+def test_unknown_attribute_raises():
+    from src.agents import equity_reviewer
+
+    with pytest.raises(AttributeError, match="missing_agent"):
+        equity_reviewer.missing_agent
@@ -0,0 +1,163 @@
+"""Tests for the persistent LLM response cache."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+
+from src.agents import create_grade_level_checker_agent
+from src.llms.cached_llm import CachedLLM
+from src.llms.factory import create_agent_llm
+from src.utils import llm_cache, rate_limit
+from src.utils.config import Config
+from src.utils.llm_cache import LLMResponseCache
+
+
+class CountingLLM(BaseLLM):
+    """LLM that answers with a numbered response and counts its calls."""
+
+    calls: int = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.calls += 1
+        return f"response {self.calls} (stop={self.stop_sequences})"
+
+
+class ToolCallingLLM(CountingLLM):
+    """LLM with native function calling that always asks for the standards lookup tool."""
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        self.calls += 1
+        function = SimpleNamespace(name="lookup_standard", arguments='{"code": "3.NF.A.1"}')
+        return [SimpleNamespace(id=f"call_{self.calls}", function=function)]
+
+    def supports_function_calling(self):
+        return True
+
+
+class CountingLimiter:
+    """Stand-in for the installed rate limiter that counts acquired slots."""
+
+    acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+        return 0.0
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(tmp_path / "llm.sqlite3", ttl_seconds=3600, max_bytes=10_000)
+
+
+def test_key_covers_model_prompt_temperature_and_stop():
+    messages = [{"role": "user", "content": "Review lesson 1"}]
+    key = LLMResponseCache.make_key("gpt-4-turbo", messages, 0.7, ["Observation:"])
+
+    assert key == LLMResponseCache.make_key("gpt-4-turbo", list(messages), 0.7, ["Observation:"])
+    assert key != LLMResponseCache.make_key("gpt-3.5-turbo", messages, 0.7, ["Observation:"])
+    assert key != LLMResponseCache.make_key("gpt-4-turbo", messages, 0.2, ["Observation:"])
+    assert key != LLMResponseCache.make_key("gpt-4-turbo", messages, 0.7, [])
+    observed = messages + [{"role": "user", "content": "Observation: 3.NF.A.1"}]
+    assert key != LLMResponseCache.make_key("gpt-4-turbo", observed, 0.7, ["Observation:"])
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", ttl_seconds=0.05, max_bytes=10_000)
+    cache.put("k", "m", "stored")
+    assert cache.get("k") == "stored"
+
+    time.sleep(0.1)
+
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.max_bytes = 250
+    for key in "abc":
+        cache.put(key, "m", key * 100)
+        time.sleep(0.01)
+    assert cache.get("a") is None  # Evicted when "c" pushed the total past the limit
+
+    cache.get("b")
+    time.sleep(0.01)
+    cache.put("d", "m", "d" * 100)
+
+    assert cache.get("b") == "b" * 100
+    assert cache.get("c") is None
+    assert cache.stats()["bytes"] <= 250
+
+
+def test_cached_llm_replays_identical_calls(cache):
+    inner = CountingLLM(model="test-model", temperature=0.1)
+    llm = CachedLLM(inner=inner, cache=cache)
+
+    first = llm.call("Review lesson 1")
+    assert llm.call("Review lesson 1") == first
+    assert llm.call("Review lesson 2") != first
+    with call_stop_override(llm, ["Observation:"]):
+        stopped = llm.call("Review lesson 1")
+
+    assert inner.calls == 3
+    assert "Observation:" in stopped
+    assert llm.model == "test-model"
+    assert not llm.supports_function_calling()
+    assert CachedLLM(inner=ToolCallingLLM(model="test-model"), cache=cache).supports_function_calling()
+
+    # A second wrapper over the same store (e.g. the next run) replays without calling
+    rerun_inner = CountingLLM(model="test-model", temperature=0.1)
+    assert CachedLLM(inner=rerun_inner, cache=cache).call("Review lesson 2") == "response 2 (stop=[])"
+    assert rerun_inner.calls == 0
+
+
+def test_cached_llm_replays_native_tool_calls(cache):
+    inner = ToolCallingLLM(model="test-model")
+    llm = CachedLLM(inner=inner, cache=cache)
+    tools = [{"type": "function", "function": {"name": "lookup_standard"}}]
+
+    first = llm.call("Check 3.NF.A.1", tools=tools)
+    replayed = llm.call("Check 3.NF.A.1", tools=tools)
+
+    assert inner.calls == 1
+    assert replayed == [{"id": first[0].id, "type": "function",
+                         "function": {"name": "lookup_standard", "arguments": '{"code": "3.NF.A.1"}'}}]
+    llm.call("Check 3.NF.A.1", tools=tools + [{"type": "function", "function": {"name": "read"}}])
+    assert inner.calls == 2
+    # The LLM runs the tools itself when given available_functions; never replay that
+    llm.call("Check 3.NF.A.1", tools=tools, available_functions={"lookup_standard": print})
+    llm.call("Check 3.NF.A.1", tools=tools, available_functions={"lookup_standard": print})
+    assert inner.calls == 4
+
+
+def test_rate_limit_slot_is_taken_only_on_cache_misses(cache, monkeypatch):
+    limiter = CountingLimiter()
+    monkeypatch.setattr(rate_limit, "_installed", limiter)
+    llm = CachedLLM(inner=CountingLLM(model="test-model"), cache=cache)
+
+    # The before-LLM-call hook leaves the wait to the cache wrapper
+    rate_limit._wait_for_slot(SimpleNamespace(llm=llm))
+    llm.call("Review lesson 1")
+    llm.call("Review lesson 1")
+    assert limiter.acquired == 1
+
+    rate_limit._wait_for_slot(SimpleNamespace(llm=llm.inner))
+    assert limiter.acquired == 2
+    with rate_limit.llm_request_slot():
+        rate_limit._wait_for_slot(SimpleNamespace(llm=llm.inner))
+    assert limiter.acquired == 3
+
+
+def test_agents_use_cached_llm_only_when_enabled(cache, monkeypatch):
+    assert create_agent_llm() is None
+
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(llm_cache, "_default_cache", cache)
+    agent = create_grade_level_checker_agent(verbose=False)
+
+    assert isinstance(agent.llm, CachedLLM)
+    assert agent.llm.cache is cache
+    assert agent.llm.model == Config.get_model_name()
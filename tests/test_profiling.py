@@ -0,0 +1,125 @@
+"""Tests for per-run profiles of review crews."""
+
+import json
+import threading
+
+import pytest
+
+from src.crews.batch_review import BatchItem, run_batch_review
+from src.crews.concurrent_review import run_concurrent_review
+from src.crews.leaf_tasks import run_leaf_task
+from src.llms.fake_llm import FakeLLM
+from src.models import LEAF_TASK_NAMES
+from src.tools.document_analyzer import DocumentAnalyzerTool
+from src.utils import extraction_cache
+from src.utils.config import Config
+from src.utils.extraction_cache import ExtractionCache
+from src.utils.profiling import RunProfiler
+from src.utils.standards_snapshot import build_snapshot, load_snapshot
+
+from .test_review_pipeline import CURRICULUM
+
+
+class ToolFirstLLM(FakeLLM):
+    """Fake LLM that looks up a standard before giving its final answer."""
+
+    def call(self, messages, *args, **kwargs):
+        if self.calls == 0:
+            self.calls += 1
+            return ('Thought: I should check the standard\nAction: Standards Lookup\n'
+                    'Action Input: {"query": "standard:3.NF.A.1"}')
+        return super().call(messages, *args, **kwargs)
+
+
+def test_profile_covers_every_task_and_agent():
+    result = run_concurrent_review(CURRICULUM, "3", llm=FakeLLM(seed=2), checkpoint=False)
+    profile = result.profile
+
+    assert set(profile.tasks) == set(LEAF_TASK_NAMES) | {"synthesis"}
+    assert len(profile.agents) == len(profile.tasks)
+    assert all(task.llm_calls == 1 and task.runs == 1 for task in profile.tasks.values())
+    assert profile.totals.llm_calls == len(profile.tasks)
+    assert profile.totals.total_tokens == result.token_usage["total_tokens"]
+    assert profile.tasks["synthesis"].agent in profile.agents
+    assert profile.stages == result.timings
+    assert profile.mode == "concurrent"
+
+
+def test_tool_calls_are_timed_per_tool():
+    with RunProfiler("test") as profiler:
+        run_leaf_task("grade_level_check", CURRICULUM, "3", llm=ToolFirstLLM(seed=4))
+    profile = profiler.finish()
+
+    task = profile.tasks["grade_level_check"]
+    assert task.llm_calls == 2
+    assert task.tool_calls == 1
+    assert task.tools["standards_lookup"].calls == 1
+    assert task.seconds >= task.tool_seconds > 0
+    assert profile.agents[task.agent].tool_calls == 1
+
+
+def test_concurrent_runs_see_only_their_own_calls():
+    profiles = {}
+
+    def review(name):
+        with RunProfiler(name) as profiler:
+            run_leaf_task(name, CURRICULUM, "3", llm=FakeLLM(latency={"kind": "fixed", "params": (0.1,)}))
+        profiles[name] = profiler.finish()
+
+    threads = [threading.Thread(target=review, args=(name,)) for name in ("equity_review", "math_practices")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, profile in profiles.items():
+        assert list(profile.tasks) == [name]
+        assert profile.totals.llm_calls == 1
+
+
+def test_profile_reports_checkpoint_hit_rate(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "CHECKPOINTS_ENABLED", True)
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path)
+    run_concurrent_review(CURRICULUM, "3", llm=FakeLLM(seed=1))
+
+    rerun = run_concurrent_review(CURRICULUM, "3", llm=FakeLLM(seed=1)).profile
+
+    assert rerun.caches["checkpoints"].hit_rate == 1.0
+    assert rerun.totals.llm_calls == 0
+
+
+def test_profile_reports_extraction_and_snapshot_hit_rates(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(extraction_cache, "_default_cache", ExtractionCache())
+    doc = tmp_path / "lesson.txt"
+    doc.write_text(CURRICULUM, encoding="utf-8")
+    standards = Config.STANDARDS_DIR / "ccssm_standards.json"
+    build_snapshot(standards)
+
+    with RunProfiler("concurrent") as profiler:
+        tool = DocumentAnalyzerTool()
+        tool._run(str(doc))
+        tool._run(str(doc))
+        load_snapshot(standards)
+    profile = profiler.finish()
+
+    assert (profile.caches["extraction"].hits, profile.caches["extraction"].misses) == (1, 1)
+    assert profile.caches["standards_snapshot"].hit_rate == 1.0
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_batch_saves_profile_next_to_report(tmp_path, monkeypatch, enabled):
+    monkeypatch.setattr(Config, "RUN_PROFILES_ENABLED", enabled)
+    source = tmp_path / "unit1.txt"
+    source.write_text(CURRICULUM)
+
+    summary = run_batch_review([BatchItem(source, "3")], tmp_path / "out", llm=FakeLLM(seed=3),
+                               requests_per_minute=0)
+
+    item = summary.items[0]
+    assert item.status == "completed"
+    if enabled:
+        assert item.profile_path == item.report_path.replace("_report.json", "_profile.json")
+        assert json.loads(open(item.profile_path).read())["tasks"]["synthesis"]["llm_calls"] == 1
+    else:
+        assert item.profile_path is None
@@ -0,0 +1,157 @@
+"""Tests for streamed report rendering."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from src.tools import report_generator
+from src.tools.report_generator import ReportGeneratorTool
+from src.utils.config import Config
+
+CONTENT = {
+    "scores": {"overall_rating": 82, "equity_score": 75},
+    "strengths": ["Clear fraction models", "Números y fracciones"],
+    "summary": "Solid unit • needs more practice.",
+}
+
+
+class CountingSink:
+    """Text sink that keeps only the number and size of writes."""
+
+    def __init__(self):
+        self.writes = 0
+        self.chars = 0
+
+    def write(self, text):
+        self.writes += 1
+        self.chars += len(text)
+
+
+class SlowSink(io.StringIO):
+    """Sink that takes a while per write and notes which threads wrote to it."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def write(self, text):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.2)
+        return super().write(text)
+
+
+class AsyncSink:
+    """Sink whose write is a coroutine, like an aiofiles file."""
+
+    def __init__(self):
+        self.parts = []
+
+    async def write(self, text):
+        self.parts.append(text)
+
+
+@pytest.mark.parametrize("format_type,generate", [
+    ("md", "_generate_markdown"), ("html", "_generate_html"), ("txt", "_generate_text"),
+])
+def test_streamed_report_matches_generated_string(format_type, generate):
+    tool = ReportGeneratorTool()
+    sink = io.StringIO()
+
+    size = tool.render("Grade 3 Review", CONTENT, format_type, sink)
+
+    assert sink.getvalue() == getattr(tool, generate)("Grade 3 Review", CONTENT)
+    assert size == len(sink.getvalue().encode("utf-8"))
+
+
+def test_large_report_is_written_in_bounded_pieces(monkeypatch):
+    monkeypatch.setattr(report_generator, "WRITE_CHUNK_CHARS", 1024)
+    content = {"findings": [f"Finding {number}: " + "x" * 100 for number in range(2000)]}
+    sink = CountingSink()
+
+    size = ReportGeneratorTool().render("Large", content, "md", sink)
+
+    assert sink.writes > 100
+    assert size == sink.chars
+    with pytest.raises(ValueError, match="Unsupported format"):
+        ReportGeneratorTool().render("Large", content, "pdf", sink)
+
+
+def test_async_sink_receives_the_same_report():
+    tool = ReportGeneratorTool()
+    sink = AsyncSink()
+
+    size = asyncio.run(tool.render_async("Grade 3 Review", CONTENT, "md", sink))
+
+    assert "".join(sink.parts) == tool._generate_markdown("Grade 3 Review", CONTENT)
+    assert size == len("".join(sink.parts).encode("utf-8"))
+
+
+def test_run_reports_bytes_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path)
+
+    result = json.loads(ReportGeneratorTool()._run(json.dumps({
+        "title": "Grade 3 Review", "content": CONTENT, "format": "txt", "filename": "review.txt",
+    })))
+
+    assert result["success"]
+    assert result["size_bytes"] == (tmp_path / "review.txt").stat().st_size
+    unsupported = json.loads(ReportGeneratorTool()._run(json.dumps({"content": CONTENT, "format": "pdf"})))
+    assert not unsupported["success"]
+    assert list(tmp_path.iterdir()) == [tmp_path / "review.txt"]
+
+
+def test_all_formats_render_in_one_pass(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path)
+    tool = ReportGeneratorTool()
+
+    result = json.loads(tool._run(json.dumps({
+        "title": "Grade 3 Review", "content": CONTENT, "formats": ["md", "html", "txt", "json", "MD"],
+        "filename": "reviews/unit3.md",
+    })))
+
+    assert result["success"]
+    assert result["formats"] == ["md", "html", "txt", "json"]
+    for entry in result["files"]:
+        path = tmp_path / "reviews" / f"unit3.{entry['format']}"
+        assert entry["file_path"] == str(path)
+        assert entry["size_bytes"] == path.stat().st_size
+    assert (tmp_path / "reviews" / "unit3.md").read_text(encoding="utf-8") == \
+        tool._generate_markdown("Grade 3 Review", CONTENT)
+    report = json.loads((tmp_path / "reviews" / "unit3.json").read_text(encoding="utf-8"))
+    assert report["title"] == "Grade 3 Review"
+    assert report["content"] == CONTENT
+
+    unsupported = json.loads(tool._run(json.dumps({"content": CONTENT, "formats": ["md", "pdf"]})))
+    assert not unsupported["success"]
+    assert "pdf" in unsupported["error"]
+
+
+def test_format_aliases_and_a_single_format_string(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path)
+    tool = ReportGeneratorTool()
+
+    aliased = json.loads(tool._run(json.dumps({
+        "content": CONTENT, "formats": ["markdown", "md", "Text", "txt"], "filename": "unit3.md",
+    })))
+    single = json.loads(tool._run(json.dumps({"content": CONTENT, "formats": "html", "filename": "unit3.md"})))
+
+    assert aliased["formats"] == ["md", "txt"]
+    assert [entry["filename"] for entry in aliased["files"]] == ["unit3.md", "unit3.txt"]
+    assert single["formats"] == ["html"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["unit3.html", "unit3.md", "unit3.txt"]
+
+
+def test_formats_are_written_concurrently():
+    sinks = {"md": SlowSink(), "html": SlowSink(), "txt": SlowSink()}
+
+    started = time.perf_counter()
+    sizes = ReportGeneratorTool().render_many("Grade 3 Review", CONTENT, sinks)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert len(set.union(*(sink.threads for sink in sinks.values()))) == 3
+    assert all(sizes[name] == len(sink.getvalue().encode("utf-8")) for name, sink in sinks.items())
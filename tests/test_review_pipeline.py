@@ -0,0 +1,127 @@
+"""Tests for the DAG review pipeline."""
+
+import time
+
+import pytest
+from crewai import CrewOutput
+from crewai.types.usage_metrics import UsageMetrics
+
+from src.crews import concurrent_review, leaf_tasks
+from src.crews.review_pipeline import PipelineNode, ReviewPipeline, run_review_pipeline
+from src.models import FinalReviewReport, LEAF_TASK_NAMES
+
+from .test_concurrent_review import DELAY, make_output
+
+CURRICULUM = """Grade 3 Fractions
+
+Unit 1: Fractions
+
+Lesson 1: Unit Fractions
+Students partition shapes into equal parts and name unit fractions.
+
+Lesson 2: Fractions on a Number Line
+Students place fractions on a number line.
+"""
+
+
+def node(name, depends_on=(), log=None, fail=False, tolerate_failures=False):
+    """Build a node that sleeps, records when it ran and returns its inputs."""
+    def run(inputs):
+        if log is not None:
+            log.append((name, "start", time.perf_counter()))
+        time.sleep(0.1)
+        if fail:
+            raise RuntimeError("boom")
+        if log is not None:
+            log.append((name, "end", time.perf_counter()))
+        return sorted(inputs), {"total_tokens": 10}
+    return PipelineNode(name, run, tuple(depends_on), tolerate_failures)
+
+
+def test_ready_nodes_run_in_parallel_after_dependencies():
+    log = []
+    pipeline = ReviewPipeline([
+        node("a", log=log), node("b", log=log), node("c", ["a", "b"], log=log),
+    ])
+
+    run = pipeline.run(max_workers=2)
+
+    events = {(name, kind): at for name, kind, at in log}
+    assert events[("b", "start")] < events[("a", "end")]
+    assert events[("c", "start")] >= max(events[("a", "end")], events[("b", "end")])
+    assert run.outputs["c"] == ["a", "b"]
+    assert run.token_usage == {"total_tokens": 30}
+    assert pipeline.order.index("c") == 2
+
+
+def test_dependents_of_failed_nodes_are_skipped():
+    pipeline = ReviewPipeline([node("a", fail=True), node("b"), node("c", ["a"]), node("d", ["c"])])
+
+    run = pipeline.run(max_workers=2)
+
+    assert run.failures["a"] == "boom"
+    assert run.failures["c"].startswith("skipped")
+    assert run.failures["d"].startswith("skipped")
+    assert set(run.outputs) == {"b"}
+
+
+def test_tolerant_nodes_run_on_the_outputs_that_succeeded():
+    pipeline = ReviewPipeline([node("a", fail=True), node("b"), node("c", ["a", "b"], tolerate_failures=True)])
+
+    run = pipeline.run(max_workers=2)
+
+    assert run.failures == {"a": "boom"}
+    assert run.outputs["c"] == ["b"]
+
+
+def test_invalid_graphs_are_rejected():
+    with pytest.raises(ValueError, match="unknown"):
+        ReviewPipeline([node("a", ["missing"])])
+    with pytest.raises(ValueError, match="cycle"):
+        ReviewPipeline([node("a", ["b"]), node("b", ["a"])])
+    with pytest.raises(ValueError, match="Duplicate"):
+        ReviewPipeline([node("a"), node("a")])
+
+
+def test_review_pipeline_runs_leaves_then_synthesizes_once(monkeypatch):
+    calls = []
+    synthesis_calls = []
+    usage = UsageMetrics(total_tokens=100, successful_requests=1)
+
+    def run_leaf(name, curriculum_content, grade_level, llm=None, verbose=False, **task_kwargs):
+        calls.append((name, set(task_kwargs)))
+        time.sleep(DELAY)
+        return CrewOutput(raw="", pydantic=make_output(name), token_usage=usage)
+
+    def run_synthesis(leaf_results, curriculum_title, llm=None, verbose=False):
+        synthesis_calls.append(leaf_results.completed_tasks())
+        report = FinalReviewReport(
+            curriculum_title=curriculum_title, grade_level="3", overall_rating=80,
+            standards_alignment_score=80, content_quality_score=80, pedagogical_score=80,
+            equity_score=80, assessment_score=80,
+            executive_summary="Solid.", recommendation_summary="Add practice.",
+        )
+        return CrewOutput(raw="", pydantic=report, token_usage=usage)
+
+    monkeypatch.setattr(leaf_tasks, "run_leaf_task", run_leaf)
+    monkeypatch.setattr(concurrent_review, "run_synthesis", run_synthesis)
+
+    started = time.perf_counter()
+    result = run_review_pipeline(CURRICULUM, "3", max_workers=5)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < DELAY * 2.5
+    assert dict(calls)["grade_level_check"] == {"candidate_alignment"}
+    assert len(synthesis_calls) == 1
+    assert set(synthesis_calls[0]) == set(LEAF_TASK_NAMES)
+    assert result.report is not None
+    assert result.report.review_metadata["mode"] == "dag"
+    assert result.token_usage["total_tokens"] == 600
+    assert result.token_usage["successful_requests"] == 6
+    assert {"alignment", "synthesis", "total"} <= set(result.timings)
+    assert result.error is None
+
+
+def test_review_pipeline_rejects_unknown_tasks():
+    with pytest.raises(ValueError, match="Unknown leaf tasks"):
+        run_review_pipeline(CURRICULUM, "3", task_names=["spelling"])
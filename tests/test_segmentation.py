@@ -0,0 +1,70 @@
+"""Tests for curriculum segmentation."""
+
+import json
+
+from src.tools.document_analyzer import DocumentAnalyzerTool, segment_curriculum
+from src.utils.config import Config
+
+
+SAMPLE_PATH = Config.INPUT_DIR / "sample_grade3_curriculum.txt"
+
+
+def test_sample_curriculum_structure():
+    document = segment_curriculum(SAMPLE_PATH.read_text(encoding="utf-8"))
+
+    assert document.title == "Grade 3 Mathematics Curriculum - Sample"
+    assert [unit.number for unit in document.units] == ["1", "2"]
+    assert [lesson.number for lesson in document.iter_lessons()] == ["1", "2", "3"]
+    assert [section.title for section in document.sections] == ["Standards Addressed", "Teaching Notes"]
+    assert document.units[1].sections[0].title == "Assessment"
+
+
+def test_objectives_and_practice_problems():
+    document = segment_curriculum(SAMPLE_PATH.read_text(encoding="utf-8"))
+    lesson = document.get_lesson("2")
+
+    assert lesson.objectives == ["Students will understand division as splitting into equal groups."]
+    assert [problem.number for problem in lesson.practice_problems] == [1, 2]
+    assert lesson.text.startswith("### Lesson 2: Division as Fair Sharing")
+    assert "Lesson 3" not in lesson.text
+
+
+def test_plain_text_headings_and_objective_lists():
+    text = "\n".join([
+        "Unit 4: Geometry",
+        "Lesson 9: Area",
+        "Objectives:",
+        "- Measure area by counting unit squares",
+        "- Relate area to multiplication",
+        "Practice:",
+        "1) Find the area of a 3 by 4 rectangle",
+        "Lesson 10 - Perimeter",
+        "Students find perimeters of polygons.",
+    ])
+
+    document = segment_curriculum(text)
+
+    assert document.units[0].title == "Geometry"
+    assert document.get_lesson("9").objectives == [
+        "Measure area by counting unit squares",
+        "Relate area to multiplication",
+    ]
+    assert document.get_lesson("9").practice_problems[0].text == "Find the area of a 3 by 4 rectangle"
+    assert document.get_lesson("10").title == "Perimeter"
+
+
+def test_lessons_without_units_are_grouped():
+    document = segment_curriculum("## Lesson 1: Counting\nCount to 20.\n## Lesson 2: Comparing\n")
+
+    assert len(document.units) == 1
+    assert document.units[0].number is None
+    assert len(document.units[0].lessons) == 2
+
+
+def test_segments_query():
+    result = json.loads(DocumentAnalyzerTool(extraction_cache=None)._run(f"{SAMPLE_PATH}#segments"))
+
+    assert result["success"] is True
+    assert "content" not in result
+    assert len(result["segments"]["units"]) == 2
+    assert "Lesson 3: Introduction to Fractions" in result["outline"]
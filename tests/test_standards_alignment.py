@@ -0,0 +1,51 @@
+"""Tests for the deterministic standards alignment pre-pass."""
+
+from src.tasks.grade_level_check_task import create_grade_level_check_task
+from src.tools.document_analyzer import segment_curriculum
+from src.utils.config import Config
+from src.utils.standards_alignment import match_curriculum_to_standards
+
+
+SAMPLE_TEXT = (Config.INPUT_DIR / "sample_grade3_curriculum.txt").read_text(encoding="utf-8")
+
+
+def test_fraction_lesson_matches_fraction_standard():
+    coverage_map = match_curriculum_to_standards(SAMPLE_TEXT, grade_level="3")
+
+    fractions = [s for s in coverage_map.segments if s.location == "Unit 2 > Lesson 3" and s.kind == "lesson"]
+    assert fractions[0].candidates[0].standard_id == "3.NF.A.1"
+    assert "Unit 2 > Lesson 3" in coverage_map.coverage["3.NF.A.1"]
+
+
+def test_cited_standards_and_uncovered():
+    coverage_map = match_curriculum_to_standards(SAMPLE_TEXT, grade_level="3")
+
+    assert coverage_map.cited_standards == ["3.OA.A.1", "3.OA.A.2", "3.NF.A.1"]
+    assert coverage_map.uncovered_standards == []
+
+
+def test_matching_is_deterministic_and_accepts_documents():
+    document = segment_curriculum(SAMPLE_TEXT)
+
+    first = match_curriculum_to_standards(document, grade_level="3")
+    second = match_curriculum_to_standards(SAMPLE_TEXT, grade_level="3")
+
+    assert first.segments == second.segments
+
+
+def test_unstructured_text_is_matched_as_one_segment():
+    coverage_map = match_curriculum_to_standards("Counting to 100 by ones and tens.", grade_level="K")
+
+    assert [s.location for s in coverage_map.segments] == ["Document"]
+    assert coverage_map.segments[0].candidates[0].standard_id == "K.CC.A.1"
+
+
+def test_candidate_map_is_injected_into_grade_level_task():
+    coverage_map = match_curriculum_to_standards(SAMPLE_TEXT, grade_level="3")
+
+    task = create_grade_level_check_task(
+        agent=None, curriculum_content=SAMPLE_TEXT, grade_level="3", candidate_alignment=coverage_map
+    )
+
+    assert "CANDIDATE STANDARDS ALIGNMENT" in task.description
+    assert "3.NF.A.1 (" in task.description
@@ -0,0 +1,153 @@
+"""Tests for the standards loader."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from src.tools.standards_lookup import StandardsLookupTool
+from src.utils import standards_loader
+from src.utils.config import Config
+from src.utils.standards_loader import StandardsLoader, clear_standards_loaders, get_standards_loader
+from src.utils.standards_snapshot import build_snapshot, get_snapshot_path, load_snapshot
+
+
+@pytest.fixture
+def loader():
+    return StandardsLoader()
+
+
+def test_search_standard_by_id(loader):
+    standard = loader.search_standard("3.NF.A.1")
+
+    assert standard["domain"] == "NF"
+    assert standard["description"].startswith("Understand a fraction 1/b")
+    assert loader.search_standard("3.NF.Z.9") is None
+    assert loader.search_standard("nonsense") is None
+
+
+def test_grade_lookup_returns_shared_records(loader):
+    first = loader.get_all_standards_for_grade("3")
+    second = loader.get_all_standards_for_grade("3")
+
+    assert first is second
+    assert [s["id"] for s in first] == ["3.OA.A.1", "3.OA.A.2", "3.NF.A.1"]
+    assert first[0]["domain_name"] == "Operations and Algebraic Thinking"
+    assert loader.search_standard("3.OA.A.1") is first[0]
+
+
+def test_domain_lookup(loader):
+    assert [s["id"] for s in loader.get_domain_standards("K", "CC")] == ["K.CC.A.1", "K.CC.A.2"]
+    assert loader.get_domain_standards("9", "OA") == ()
+
+
+def test_records_are_read_only(loader):
+    standard = loader.search_standard("3.OA.A.1")
+
+    with pytest.raises(TypeError):
+        standard["description"] = "changed"
+    with pytest.raises(TypeError):
+        standard.update(id="x")
+
+    mutable = dict(standard)
+    mutable["description"] = "changed"
+    assert standard["description"] == "Interpret products of whole numbers."
+
+
+def test_records_serialize_copy_and_pickle(loader):
+    standard = loader.search_standard("3.OA.A.1")
+
+    assert json.loads(json.dumps(standard))["id"] == "3.OA.A.1"
+    assert copy.deepcopy(standard) is standard
+    assert pickle.loads(pickle.dumps(standard)) == standard
+
+
+def test_missing_file_yields_empty_indexes(tmp_path):
+    loader = StandardsLoader(tmp_path / "missing.json")
+
+    assert loader.get_all_standards_for_grade("3") == ()
+    assert loader.get_grades() == ()
+
+
+def test_shared_loader_is_loaded_once():
+    clear_standards_loaders()
+
+    first = get_standards_loader()
+    second = get_standards_loader(Config.STANDARDS_DIR / "ccssm_standards.json")
+
+    assert first is second
+    assert standards_loader.default_loader is first
+
+
+def test_lookup_tools_share_one_store():
+    assert StandardsLookupTool().standards_loader is StandardsLookupTool().standards_loader
+
+
+def write_standards(path, description):
+    data = {
+        "mathematical_practices": [{"id": "MP1", "title": "Persevere", "description": "Make sense"}],
+        "grade_levels": {
+            "4": {"domains": {"NF": {"name": "Fractions", "standards": [
+                {"id": "4.NF.A.1", "description": description}
+            ]}}}
+        },
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache" / "standards"
+
+
+def test_loading_is_lazy(tmp_path, snapshot_dir):
+    loader = StandardsLoader(write_standards(tmp_path / "std.json", "Equivalent fractions"))
+
+    assert loader._standards_data is None
+    assert loader.search_standard("4.NF.A.1")["domain_name"] == "Fractions"
+
+
+def test_snapshot_is_built_and_reused(tmp_path, snapshot_dir):
+    source = write_standards(tmp_path / "std.json", "Equivalent fractions")
+    StandardsLoader(source).get_grades()
+
+    assert get_snapshot_path(source).exists()
+    assert get_snapshot_path(source).parent == snapshot_dir
+    assert load_snapshot(source)["grade_levels"]["4"]["domains"]["NF"]["name"] == "Fractions"
+
+
+def test_stale_snapshot_falls_back_to_json(tmp_path, snapshot_dir):
+    source = write_standards(tmp_path / "std.json", "Equivalent fractions")
+    build_snapshot(source)
+
+    write_standards(source, "Compare fractions with unlike denominators")
+
+    assert load_snapshot(source) is None
+    loader = StandardsLoader(source)
+    assert loader.search_standard("4.NF.A.1")["description"].startswith("Compare")
+    assert load_snapshot(source) is not None
+
+
+def test_same_named_sources_get_separate_snapshots(tmp_path, snapshot_dir):
+    for directory in ("ccssm", "state"):
+        (tmp_path / directory).mkdir()
+    first = write_standards(tmp_path / "ccssm" / "std.json", "Equivalent fractions")
+    second = write_standards(tmp_path / "state" / "std.json", "Compare fractions")
+    build_snapshot(first)
+    build_snapshot(second)
+
+    assert get_snapshot_path(first) != get_snapshot_path(second)
+    assert load_snapshot(first) is not None
+    standard = load_snapshot(second)["grade_levels"]["4"]["domains"]["NF"]["standards"][0]
+    assert standard["description"] == "Compare fractions"
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path, snapshot_dir):
+    source = write_standards(tmp_path / "std.json", "Equivalent fractions")
+    snapshot_dir.mkdir(parents=True)
+    get_snapshot_path(source).write_bytes(b"garbage")
+
+    assert StandardsLoader(source).search_standard("4.NF.A.1") is not None
@@ -0,0 +1,48 @@
+"""Tests for full-text standards search."""
+
+import json
+
+from src.tools.standards_lookup import StandardsLookupTool
+from src.utils.standards_loader import get_standards_loader
+from src.utils.text_search import BM25Index, stem, tokenize
+
+
+def test_tokenize_stems_and_drops_stopwords():
+    assert tokenize("Partitioning the fractions into equal parts") == ["partition", "fraction", "equal", "part"]
+    assert stem("quantities") == "quantity"
+    assert stem("class") == "class"
+
+
+def test_bm25_ranks_more_specific_documents_first():
+    index = BM25Index([
+        ("a", "fractions on a number line"),
+        ("b", "whole numbers and fractions"),
+        ("c", "geometry of shapes"),
+    ])
+
+    assert [key for key, _ in index.search("fraction number line")] == ["a", "b"]
+
+
+def test_fuzzy_matches_misspelled_terms():
+    index = BM25Index([("a", "fractions"), ("b", "multiplication")])
+
+    assert index.search("fracions")[0][0] == "a"
+
+
+def test_loader_search_filters_by_grade_but_keeps_practices():
+    loader = get_standards_loader()
+
+    ids = [record["id"] for record, _ in loader.search("fraction equal parts", grade="3")]
+    assert ids[0] == "3.NF.A.1"
+    assert all(i.startswith("3.") or i.startswith("MP") for i in ids)
+
+    assert loader.search("persevere in solving problems")[0][0]["id"] == "MP1"
+
+
+def test_search_query_returns_top_k():
+    result = json.loads(StandardsLookupTool()._run("search:count to 100|k=2"))
+
+    assert result["success"] is True
+    assert result["results_count"] == 2
+    assert result["results"][0]["id"] == "K.CC.A.1"
+    assert result["results"][0]["score"] > result["results"][1]["score"]
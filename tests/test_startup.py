@@ -0,0 +1,89 @@
+"""
+Startup-cost regression checks for the command-line interface.
+
+Uses ``python -X importtime`` in a fresh interpreter so the measurements
+are not affected by modules already imported by the test session.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported by commands that actually use them
+HEAVY_MODULES = ("crewai", "crewai_tools", "pdfplumber", "bs4", "docx", "langchain_community")
+
+# Cumulative import budget for the CLI module, in microseconds
+CLI_IMPORT_BUDGET_US = 1_000_000
+
+
+def import_times(statement: str) -> dict:
+    """Run a statement with -X importtime and return module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cumulative.isdigit():
+            times[module] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("statement", [
+    "import src.cli",
+    "import src.tools, src.tasks",
+    "import src.utils.standards_alignment",
+])
+def test_no_heavy_imports(statement):
+    times = import_times(statement)
+
+    loaded = {name.split(".")[0] for name in times}
+    assert loaded.isdisjoint(HEAVY_MODULES)
+
+
+def test_cli_import_within_budget():
+    times = import_times("import src.cli")
+
+    assert times["src.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_help_lists_commands():
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for command in ("segment", "align", "standards", "check-grade"):
+        assert command in result.output
+
+
+def test_standards_search_command():
+    result = CliRunner().invoke(cli, ["standards", "search", "fraction number line", "--grade", "3"])
+
+    assert result.exit_code == 0
+    assert result.stdout.startswith("3.NF.A.1")
+
+
+def test_segment_command_reads_plain_text():
+    result = CliRunner().invoke(cli, ["segment", str(ROOT / "data/input/sample_grade3_curriculum.txt")])
+
+    assert result.exit_code == 0
+    assert "Unit 1: Multiplication and Division" in result.output
+
+
+def test_align_json_output_is_clean_json():
+    result = CliRunner().invoke(cli, [
+        "align", str(ROOT / "data/input/sample_grade3_curriculum.txt"), "--grade", "3", "--json",
+    ])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["grade_level"] == "3"